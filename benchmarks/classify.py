@@ -0,0 +1,61 @@
+"""Benchmark classifying cards as new, learning, review or not due.
+
+Compares the per-card `_get_card_type` with the batch `classify`, on the
+`array` backend and, when it is installed, on NumPy.
+
+Run from the repository root:
+
+    python -m benchmarks.classify --sizes 10000,100000,1000000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper, _import_numpy
+
+
+def make_cards(count: int, now: float, seed: int = 0) -> List[Dict[str, Any]]:
+    """Build `cardsInfo`-shaped cards with the fields classification reads."""
+    rng = random.Random(seed)
+    today = int(now / 86400)
+    cards = []
+    for _ in range(count):
+        queue = rng.choice([0, 0, 0, 1, 2, 2, 2, 2, 3, -1])
+        due = int(now * 1000) + rng.randint(-3600, 3600) * 1000 if queue in (1, 3) else today + rng.randint(-5, 30)
+        cards.append({"queue": queue, "type": max(queue, 0), "due": due, "odue": 0})
+    return cards
+
+
+def measure(classify: Callable[[], Any], repeat: int) -> float:
+    """Get the fastest of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        classify()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma separated numbers of cards")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, the fastest is reported")
+    args = parser.parse_args()
+
+    mapper = AnkiCardMapper()
+    backends = ["array"] + (["numpy"] if _import_numpy() else [])
+    print(f"{'cards':>10} {'per card':>12}" + "".join(f" {backend:>12}" for backend in backends) + f" {'speedup':>8}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        cards = make_cards(size, time.time())
+        scalar = measure(lambda: [mapper._get_card_type(card) for card in cards], args.repeat)
+        batch = [measure(lambda: mapper.classify(cards, backend=backend), args.repeat) for backend in backends]
+        print(
+            f"{size:>10,} {scalar:>10.1f}ms" + "".join(f" {elapsed:>10.1f}ms" for elapsed in batch)
+            + f" {scalar / min(batch):>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark the memory taken by mapped cards.
+
+Compares mapping `cardsInfo`-shaped cards into lists of cards, as the mapper
+used to, with the mapper's CardBatch columns, built eagerly or with lazy
+fields. Reports the time and peak memory of mapping, the memory kept once the
+payload is gone, and the time and memory kept after every card was read.
+
+Run from the repository root:
+
+    python -m benchmarks.entities --sizes 10000,100000,500000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.core.entities import Card, DeckCards
+from src.infrastructure.persistence.anki_connect.mapper import LEARNING, NEW, NOT_DUE, REVIEW, AnkiCardMapper
+
+
+def make_cards(count: int) -> List[Dict[str, Any]]:
+    """Build new `cardsInfo`-shaped cards with Basic notes."""
+    return [
+        {
+            "cardId": 1_500_000_000_000 + index,
+            "modelName": "Basic",
+            "queue": 0,
+            "type": 0,
+            "fields": {
+                "Front": {"value": f"Question {index}", "order": 0},
+                "Back": {"value": f"Answer {index}", "order": 1},
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def map_to_lists(mapper: AnkiCardMapper, cards: List[Dict[str, Any]]) -> DeckCards:
+    """Map cards into lists of Card objects, the way the mapper used to."""
+    buckets: Dict[int, List[Card]] = {NEW: [], LEARNING: [], REVIEW: []}
+    for card, code in zip(cards, mapper.classify(cards)):
+        if code != NOT_DUE:
+            front, back = mapper._fields.extract(card)
+            buckets[code].append(Card(front=front, back=back, card_id=card.get("cardId")))
+    return DeckCards("Deck", buckets[NEW], buckets[LEARNING], buckets[REVIEW])
+
+
+def measure(count: int, map_cards: Callable[[List[Dict[str, Any]]], DeckCards]) -> Tuple[float, ...]:
+    """Map fresh cards, then read them all.
+
+    Returns:
+        Mapping time in ms, peak MB while mapping, MB kept after the payload
+        is freed, reading time in ms and MB kept after reading
+    """
+    gc.collect()
+    tracemalloc.start()
+    cards = make_cards(count)
+    started = time.perf_counter()
+    deck = map_cards(cards)
+    mapping = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    del cards
+    gc.collect()
+    kept, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    assert sum(len(card.front) for card in deck.new_cards) > 0
+    reading = time.perf_counter() - started
+    gc.collect()
+    read, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert deck.total_cards == count
+    return mapping * 1000, peak / 2**20, kept / 2**20, reading * 1000, read / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,500000", help="Comma separated numbers of cards")
+    args = parser.parse_args()
+
+    mappers = {"batch": AnkiCardMapper(lazy_fields=False), "lazy": AnkiCardMapper(lazy_fields=True)}
+    print(f"{'cards':>10} {'layout':>7} {'map':>10} {'peak':>10} {'kept':>10} {'read':>10} {'kept':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        for layout, map_cards in (
+            ("lists", lambda cards: map_to_lists(mappers["batch"], cards)),
+            ("batch", lambda cards: mappers["batch"].to_deck_cards("Deck", cards)),
+            ("lazy", lambda cards: mappers["lazy"].to_deck_cards("Deck", cards)),
+        ):
+            mapping, peak, kept, reading, read = measure(size, map_cards)
+            print(
+                f"{size:>10,} {layout:>7} {mapping:>8.1f}ms {peak:>8.1f}MB {kept:>8.1f}MB"
+                f" {reading:>8.1f}ms {read:>8.1f}MB"
+            )
+
+if __name__ == "__main__":
+    main()
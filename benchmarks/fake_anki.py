@@ -0,0 +1,232 @@
+"""Local HTTP stand-in for AnkiConnect, serving a synthetic or generated collection.
+
+Implements the actions the CLI uses: `deckNames`, `findCards`, `cardsInfo`,
+`cardsModTime`, `getDeckStats` and `multi`. Every request can be delayed by a fixed latency
+to mimic Anki's single-threaded request handling.
+
+Run it on its own to point the CLI at it:
+
+    python -m benchmarks.fake_anki --cards 100000 --decks 100 --port 8765
+    python -m benchmarks.fake_anki --fixture cards.json --port 8765
+"""
+
+import argparse
+import json
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Union
+
+from .generator import GeneratedCollection, load_json
+from .synthetic import DUE, INACTIVE, LEARNING, NEW, NOT_DUE, CollectionSpec, SyntheticCollection
+
+_DECK_TERM = re.compile(r'^deck:"([^"]*)"$|^deck:(\S+)$')
+_NOT_SUBDECKS_TERM = re.compile(r'^-deck:"([^"]*)::\*"$')
+# Comparisons of card properties, checked against each found card's details
+_PROP_TERM = re.compile(r'^prop:(lapses|ease|due)(<=|>=|<|>|=)(-?[\d.]+)$')
+_COMPARISONS = {
+    "<=": lambda a, b: a <= b, ">=": lambda a, b: a >= b, "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b, "=": lambda a, b: a == b,
+}
+
+# Card states matched by each search term, mirroring Anki's search syntax
+_STATE_TERMS = {
+    "is:due": {LEARNING, DUE},
+    "is:new": {NEW},
+    "is:learn": {LEARNING},
+    "is:review": {DUE, NOT_DUE},
+    "-is:learn": {NEW, DUE, NOT_DUE, INACTIVE},
+    "-is:new": {LEARNING, DUE, NOT_DUE, INACTIVE},
+}
+
+
+class FakeAnkiConnect:
+    """Answers AnkiConnect actions from a synthetic or generated collection."""
+
+    def __init__(self, collection: Union[SyntheticCollection, GeneratedCollection], latency: float = 0.0, lock: bool = True):
+        """Initialize the fake.
+
+        Args:
+            collection: The collection to serve
+            latency: Seconds to wait before answering each request
+            lock: Whether requests are handled one at a time, like Anki does
+        """
+        self.collection = collection
+        self.latency = latency
+        self.requests: Dict[str, int] = {}
+        self._lock = threading.Lock() if lock else None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Get the URL the fake listens on."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> "FakeAnkiConnect":
+        """Start serving on a background thread.
+
+        Args:
+            host: Address to bind
+            port: Port to bind, a free one if 0
+
+        Returns:
+            The fake itself
+        """
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body are written separately, don't let Nagle delay the body
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                body = json.dumps(fake.handle(request)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "FakeAnkiConnect":
+        return self if self._server is not None else self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request.
+
+        Args:
+            request: The decoded AnkiConnect request
+
+        Returns:
+            The AnkiConnect response envelope
+        """
+        if self._lock is None:
+            time.sleep(self.latency)
+            return self._answer(request)
+        with self._lock:
+            time.sleep(self.latency)
+            return self._answer(request)
+
+    def _answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        action = request.get("action")
+        self.requests[action] = self.requests.get(action, 0) + 1
+        try:
+            return {"result": self._dispatch(action, request.get("params") or {}), "error": None}
+        except (KeyError, ValueError) as e:
+            return {"result": None, "error": str(e)}
+
+    def _dispatch(self, action: str, params: Dict[str, Any]) -> Any:
+        collection = self.collection
+        if action == "deckNames":
+            return collection.deck_list()
+        if action == "findCards":
+            return self._find_cards(params["query"])
+        if action == "cardsInfo":
+            return [collection.card_info(card_id) for card_id in params["cards"]]
+        if action == "getDeckStats":
+            return collection.deck_stats(params["decks"])
+        if action == "cardsModTime":
+            return [{"cardId": card_id, "mod": collection.card_info(card_id)["mod"]} for card_id in params["cards"]]
+        if action == "multi":
+            return [self._answer(inner) for inner in params["actions"]]
+        raise ValueError(f"unsupported action: {action}")
+
+    def _find_cards(self, query: str) -> List[int]:
+        deck = None
+        include_children = True
+        states = {NEW, LEARNING, DUE, NOT_DUE, INACTIVE}
+        props = []
+        for term in _split_query(query):
+            deck_term = _DECK_TERM.match(term)
+            not_subdecks = _NOT_SUBDECKS_TERM.match(term)
+            prop = _PROP_TERM.match(term)
+            if deck_term:
+                deck = deck_term.group(1) if deck_term.group(1) is not None else deck_term.group(2)
+            elif not_subdecks and not_subdecks.group(1) == deck:
+                include_children = False
+            elif term in _STATE_TERMS:
+                states &= _STATE_TERMS[term]
+            elif prop:
+                props.append((prop.group(1), _COMPARISONS[prop.group(2)], float(prop.group(3))))
+            else:
+                raise ValueError(f"unsupported search term: {term}")
+        card_ids = self.collection.find_cards(deck, states, include_children=include_children)
+        if props:
+            card_ids = [card_id for card_id in card_ids if self._matches(self.collection.card_info(card_id), props)]
+        return card_ids
+
+    def _matches(self, card: Dict[str, Any], props: List[Any]) -> bool:
+        """Check a card against `prop:` comparisons, like Anki only review cards have a due day."""
+        for name, compare, value in props:
+            if name == "lapses":
+                actual = card["lapses"]
+            elif name == "ease":
+                actual = card["factor"] / 1000
+            elif card["queue"] in (2, 3):
+                actual = card["due"] - self.collection.today
+            else:
+                return False
+            if not compare(actual, value):
+                return False
+        return True
+
+
+def _split_query(query: str) -> List[str]:
+    """Split a search on spaces outside of double quotes."""
+    return re.findall(r'(?:[^\s"]+|"[^"]*")+', query)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10000, help="Number of cards")
+    parser.add_argument("--decks", type=int, default=10, help="Number of top-level decks")
+    parser.add_argument("--field-bytes", type=int, default=32, help="Size of each card field")
+    parser.add_argument("--fixture", help="Serve a JSON fixture written by benchmarks.generator instead")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before each answer")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    args = parser.parse_args()
+
+    if args.fixture:
+        collection = load_json(args.fixture)
+    else:
+        collection = SyntheticCollection(CollectionSpec(args.cards, args.decks, field_bytes=args.field_bytes))
+    fake = FakeAnkiConnect(collection, latency=args.latency_ms / 1000).start(port=args.port)
+    print(f"Serving {collection.name} on {fake.url}, press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
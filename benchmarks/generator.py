@@ -0,0 +1,472 @@
+"""Seeded generator of realistic Anki collections for scale testing.
+
+Unlike `benchmarks.synthetic`, which derives flat, uniform cards from their
+index, this generator draws cards the way a long-used collection looks:
+
+- decks nested up to `depth` levels with `::`, with cards skewed towards a
+  few large decks, plus one filtered deck holding cards away from home
+- Basic, reversed and "Polish-English" note models
+- new, learning, relearning, review, suspended and buried cards with
+  spread-out intervals, due days, ease factors, reviews and lapses
+
+The same spec, seed and current time always produce the same collection. It can be
+written as a JSON fixture of AnkiConnect `cardsInfo` dictionaries or as a
+`collection.anki2`-shaped SQLite file, and served by `benchmarks.fake_anki`:
+
+    python -m benchmarks.generator --cards 300000 --decks 200 --json cards.json
+    python -m benchmarks.generator --cards 300000 --decks 200 --anki2 collection.anki2
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import math
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .synthetic import DAY, DUE, INACTIVE, LEARNING, NEW, NOT_DUE
+
+DEFAULT_DECK_ID = 1
+FILTERED_DECK_ID = 2
+FIRST_DECK_ID = 1_600_000_000_000
+FIRST_CARD_ID = 1_500_000_000_000
+
+BASIC_MODEL_ID = 1_400_000_000_001
+REVERSED_MODEL_ID = 1_400_000_000_002
+POLISH_MODEL_ID = 1_400_000_000_003
+MODELS: Dict[int, Tuple[str, List[str]]] = {
+    BASIC_MODEL_ID: ("Basic", ["Front", "Back"]),
+    REVERSED_MODEL_ID: ("Basic (and reversed card)", ["Front", "Back"]),
+    POLISH_MODEL_ID: ("Polish-English", ["Polish word", "Word translation", "Polish example"]),
+}
+
+# Anki shows learning cards due within this many seconds as due now
+LEARN_AHEAD = 1200
+
+_TOPICS = ["Languages", "Programming", "History", "Geography", "Medicine", "Music", "Mathematics", "Law"]
+_SYLLABLES = ["ka", "mo", "rzy", "szcz", "ow", "ie", "pra", "wy", "na", "do", "ło", "cie", "ba", "że"]
+_WORDS = ["river", "window", "sailor", "bread", "mountain", "letter", "garden", "train", "winter", "silver"]
+
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    """Size, shape and seed of a generated collection."""
+    cards: int = 300_000
+    decks: int = 200
+    depth: int = 3
+    seed: int = 0
+    polish_share: float = 0.4
+    reversed_share: float = 0.2
+    field_bytes: int = 0
+    age_days: int = 1000
+
+    @property
+    def name(self) -> str:
+        """Get a short name for reports."""
+        return f"generated-{self.cards}-cards-{self.decks}-decks-seed-{self.seed}"
+
+
+@dataclass(slots=True)
+class CardRow:
+    """One card of a generated collection, as stored in `collection.anki2`."""
+    card_id: int
+    note_id: int
+    deck_id: int
+    model_id: int
+    ord: int
+    type: int
+    queue: int
+    due: int
+    interval: int
+    factor: int
+    reps: int
+    lapses: int
+    left: int
+    original_due: int
+    original_deck_id: int
+    mod: int
+    fields: Tuple[str, ...]
+
+
+class GeneratedCollection:
+    """Cards, decks and note models of a generated collection."""
+
+    def __init__(self, created: int, decks: Dict[int, str], cards: List[CardRow], name: str = "generated", now: float = None):
+        """Initialize the collection.
+
+        Args:
+            created: Collection creation time in seconds, day numbers count from it
+            decks: Deck names by ID, sub-decks separated by `::`
+            cards: The cards, in card ID order
+            name: Short name for reports
+            now: Current time, used to tell which cards are due
+        """
+        self.created = created
+        self.decks = decks
+        self.cards = cards
+        self.name = name
+        self.now = time.time() if now is None else now
+        self.today = int((self.now - created) // DAY)
+        self._ids = [card.card_id for card in cards]
+        self._deck_ids = {name: deck_id for deck_id, name in decks.items()}
+        self._deck_children = self._index_children(decks)
+
+    def deck_list(self) -> List[str]:
+        """Get every deck name, as `deckNames` returns them."""
+        return sorted(self.decks.values())
+
+    def state(self, card: CardRow) -> int:
+        """Classify a card the way Anki's `is:` searches see it."""
+        if card.queue == 0:
+            return NEW
+        if card.queue == 1:
+            return LEARNING if card.due <= self.now + LEARN_AHEAD else NOT_DUE
+        if card.queue == 3:
+            return LEARNING if card.due <= self.today else NOT_DUE
+        if card.queue == 2:
+            return DUE if card.due <= self.today else NOT_DUE
+        return INACTIVE
+
+    def find_cards(self, deck: Optional[str], states: Set[int], include_children: bool = True) -> List[int]:
+        """Find card IDs in a deck and its sub-decks, in any of the given states.
+
+        Like Anki, cards moved to a filtered deck still match their home deck.
+
+        Args:
+            deck: Deck name, None for all decks
+            states: Card states to match
+            include_children: Whether cards in sub-decks match too
+
+        Raises:
+            KeyError: If there is no such deck
+        """
+        deck_ids = None
+        if deck is not None and deck != "*":
+            if deck not in self._deck_children:
+                raise KeyError(deck)
+            deck_ids = self._deck_children[deck] if include_children else {self._deck_ids[deck]}
+        return [
+            card.card_id for card in self.cards
+            if (deck_ids is None or card.deck_id in deck_ids or card.original_deck_id in deck_ids)
+            and self.state(card) in states
+        ]
+
+    def deck_stats(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Build the AnkiConnect `getDeckStats` result for the given decks.
+
+        Totals count the cards in each deck itself, not in its sub-decks.
+
+        Raises:
+            KeyError: If there is no such deck
+        """
+        wanted = {self._deck_ids[name]: {state: 0 for state in (NEW, LEARNING, DUE, NOT_DUE, INACTIVE)} for name in names}
+        for card in self.cards:
+            if card.deck_id in wanted:
+                wanted[card.deck_id][self.state(card)] += 1
+        return {
+            str(deck_id): {
+                "deck_id": deck_id,
+                "name": self.decks[deck_id],
+                "new_count": counts[NEW],
+                "learn_count": counts[LEARNING],
+                "review_count": counts[DUE],
+                "total_in_deck": sum(counts.values()),
+            }
+            for deck_id, counts in wanted.items()
+        }
+
+    def card_info(self, card_id: int) -> Dict[str, Any]:
+        """Build the AnkiConnect `cardsInfo` entry of a card.
+
+        Raises:
+            KeyError: If there is no such card
+        """
+        index = bisect.bisect_left(self._ids, card_id)
+        if index == len(self._ids) or self._ids[index] != card_id:
+            raise KeyError(card_id)
+        return to_card_info(self.cards[index], self.decks)
+
+    @staticmethod
+    def _index_children(decks: Dict[int, str]) -> Dict[str, Set[int]]:
+        children: Dict[str, Set[int]] = {}
+        for deck_id, name in decks.items():
+            parts = name.split("::")
+            for depth in range(1, len(parts) + 1):
+                children.setdefault("::".join(parts[:depth]), set()).add(deck_id)
+        return children
+
+
+def to_card_info(card: CardRow, decks: Dict[int, str]) -> Dict[str, Any]:
+    """Shape a card like AnkiConnect's `cardsInfo` result."""
+    model_name, field_names = MODELS[card.model_id]
+    return {
+        "cardId": card.card_id,
+        "note": card.note_id,
+        "deckName": decks[card.deck_id],
+        "modelName": model_name,
+        "fieldOrder": card.ord,
+        "fields": {name: {"value": value, "order": order} for order, (name, value) in enumerate(zip(field_names, card.fields))},
+        "ord": card.ord,
+        "type": card.type,
+        "queue": card.queue,
+        "due": card.due,
+        "odue": card.original_due,
+        "odid": card.original_deck_id,
+        "interval": card.interval,
+        "factor": card.factor,
+        "reps": card.reps,
+        "lapses": card.lapses,
+        "left": card.left,
+        "mod": card.mod,
+    }
+
+
+def generate(spec: GeneratorSpec, now: float = None) -> GeneratedCollection:
+    """Generate a collection.
+
+    Args:
+        spec: Size, shape and seed of the collection
+        now: Current time, the collection is `spec.age_days` old at this time
+
+    Returns:
+        The generated collection
+    """
+    rng = random.Random(spec.seed)
+    now = time.time() if now is None else now
+    created = int(now) - spec.age_days * DAY - 3600
+    today = spec.age_days
+
+    decks = _generate_decks(rng, spec)
+    home_decks = [deck_id for deck_id in decks if deck_id not in (DEFAULT_DECK_ID, FILTERED_DECK_ID)]
+    # A few decks hold most of the cards
+    weights = list(itertools.accumulate(1 / (rank + 1) ** 0.8 for rank in range(len(home_decks))))
+    padding = "·" * spec.field_bytes
+
+    cards: List[CardRow] = []
+    new_position = 0
+    note_id = FIRST_CARD_ID
+    while len(cards) < spec.cards:
+        note_id += 1
+        deck_id = rng.choices(home_decks, cum_weights=weights)[0]
+        model_roll = rng.random()
+        if model_roll < spec.polish_share:
+            model_id, fields = POLISH_MODEL_ID, _polish_fields(rng, padding)
+        elif model_roll < spec.polish_share + spec.reversed_share:
+            model_id, fields = REVERSED_MODEL_ID, _basic_fields(rng, note_id, padding)
+        else:
+            model_id, fields = BASIC_MODEL_ID, _basic_fields(rng, note_id, padding)
+
+        for ord in range(2 if model_id == REVERSED_MODEL_ID else 1):
+            if len(cards) == spec.cards:
+                break
+            card = _generate_card(rng, FIRST_CARD_ID + len(cards), note_id, deck_id, model_id, ord, fields, now, today, new_position)
+            new_position += card.queue == 0
+            cards.append(card)
+
+    return GeneratedCollection(created, decks, cards, name=spec.name, now=now)
+
+
+def _generate_decks(rng: random.Random, spec: GeneratorSpec) -> Dict[int, str]:
+    decks = {DEFAULT_DECK_ID: "Default", FILTERED_DECK_ID: "Filtered Deck 1"}
+    top_level = max(1, min(len(_TOPICS) * 4, math.ceil(spec.decks ** 0.5)))
+    names: List[str] = []
+    for index in range(min(top_level, spec.decks)):
+        topic = _TOPICS[index % len(_TOPICS)]
+        names.append(topic if index < len(_TOPICS) else f"{topic} {index // len(_TOPICS) + 1}")
+    while len(names) < spec.decks:
+        parent = rng.choice([name for name in names if name.count("::") < spec.depth - 1] or names[:1])
+        siblings = sum(1 for name in names if name.startswith(parent + "::") and name.count("::") == parent.count("::") + 1)
+        names.append(f"{parent}::Part {siblings + 1}")
+    for index, name in enumerate(names):
+        decks[FIRST_DECK_ID + index] = name
+    return decks
+
+
+def _polish_fields(rng: random.Random, padding: str) -> Tuple[str, ...]:
+    word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+    translation = rng.choice(_WORDS)
+    return (word + padding, translation + padding, f"To jest {word}." + padding)
+
+
+def _basic_fields(rng: random.Random, note_id: int, padding: str) -> Tuple[str, ...]:
+    topic = rng.choice(_WORDS)
+    return (f"What is {topic} #{note_id % 100000}?" + padding, f"The answer about {topic}." + padding)
+
+
+def _generate_card(
+    rng: random.Random, card_id: int, note_id: int, deck_id: int, model_id: int, ord: int,
+    fields: Tuple[str, ...], now: float, today: int, new_position: int,
+) -> CardRow:
+    interval, factor, reps, lapses, left = 0, 0, 0, 0, 0
+    original_due, original_deck_id = 0, 0
+    roll = rng.random()
+    if roll < 0.20:
+        card_type, queue, due = 0, 0, new_position
+    elif roll < 0.27:
+        # Learning, or relearning after a lapse, due within the next hour or overdue
+        card_type = 1 if roll < 0.25 else 3
+        queue = 1
+        due = int(now) + rng.randint(-3600, 3600)
+        left = rng.randint(1, 3)
+        reps = rng.randint(1, 5)
+        if card_type == 3:
+            interval, factor, lapses = rng.randint(1, 60), rng.randint(1300, 2500), rng.randint(1, 8)
+    elif roll < 0.28:
+        # Learning steps longer than a day
+        card_type, queue, due = 1, 3, today + rng.randint(-1, 1)
+        reps, left = rng.randint(1, 5), 1
+    else:
+        card_type = 2
+        interval = min(36500, int(rng.lognormvariate(3.0, 1.2)) + 1)
+        factor = rng.randint(1300, 3500)
+        reps = rng.randint(1, 60)
+        lapses = min(reps, int(rng.expovariate(1.0)))
+        due = today - rng.randint(0, 5) if rng.random() < 0.12 else today + rng.randint(1, interval)
+        queue = 2
+        if roll > 0.97:
+            queue = -1
+        elif roll > 0.955:
+            queue = rng.choice((-2, -3))
+        elif roll > 0.94:
+            # Moved into the filtered deck, which keeps the home deck and due day aside
+            original_due, original_deck_id = due, deck_id
+            deck_id, due = FILTERED_DECK_ID, today - rng.randint(0, 2)
+
+    return CardRow(
+        card_id=card_id, note_id=note_id, deck_id=deck_id, model_id=model_id, ord=ord,
+        type=card_type, queue=queue, due=due, interval=interval, factor=factor, reps=reps,
+        lapses=lapses, left=left, original_due=original_due, original_deck_id=original_deck_id,
+        mod=int(now) - rng.randint(0, 86400 * 365), fields=fields,
+    )
+
+
+def write_json(collection: GeneratedCollection, path: str) -> None:
+    """Write a collection as a JSON fixture of `cardsInfo` dictionaries.
+
+    Cards are written one at a time, so large collections never exist as one
+    big list of dictionaries.
+    """
+    with open(path, "w", encoding="utf-8") as fixture:
+        header = {"created": collection.created, "decks": {str(deck_id): name for deck_id, name in collection.decks.items()}}
+        fixture.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "cards": [\n')
+        for index, card in enumerate(collection.cards):
+            fixture.write(("," if index else "") + json.dumps(to_card_info(card, collection.decks), ensure_ascii=False) + "\n")
+        fixture.write("]}\n")
+
+
+def load_json(path: str, now: float = None) -> GeneratedCollection:
+    """Load a collection written by `write_json`."""
+    with open(path, encoding="utf-8") as fixture:
+        data = json.load(fixture)
+    decks = {int(deck_id): name for deck_id, name in data["decks"].items()}
+    deck_ids = {name: deck_id for deck_id, name in decks.items()}
+    model_ids = {name: model_id for model_id, (name, _) in MODELS.items()}
+    cards = [
+        CardRow(
+            card_id=info["cardId"], note_id=info["note"], deck_id=deck_ids[info["deckName"]],
+            model_id=model_ids[info["modelName"]], ord=info["ord"], type=info["type"], queue=info["queue"],
+            due=info["due"], interval=info["interval"], factor=info["factor"], reps=info["reps"],
+            lapses=info["lapses"], left=info["left"], original_due=info["odue"],
+            original_deck_id=info["odid"], mod=info["mod"],
+            fields=tuple(field["value"] for field in sorted(info["fields"].values(), key=lambda field: field["order"])),
+        )
+        for info in data["cards"]
+    ]
+    return GeneratedCollection(data["created"], decks, cards, name=path, now=now)
+
+
+def write_collection(collection: GeneratedCollection, path: str) -> None:
+    """Write a collection as a `collection.anki2`-shaped SQLite file.
+
+    Uses the schema of current Anki versions, with separate tables for decks,
+    note types and fields.
+    """
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        DROP TABLE IF EXISTS col; DROP TABLE IF EXISTS notes; DROP TABLE IF EXISTS cards;
+        DROP TABLE IF EXISTS decks; DROP TABLE IF EXISTS notetypes; DROP TABLE IF EXISTS fields;
+        CREATE TABLE col (id integer primary key, crt integer not null, mod integer not null, scm integer not null,
+                          ver integer not null, models text not null, decks text not null);
+        CREATE TABLE notes (id integer primary key, guid text not null, mid integer not null, mod integer not null,
+                            usn integer not null, tags text not null, flds text not null, sfld text not null);
+        CREATE TABLE cards (id integer primary key, nid integer not null, did integer not null,
+                            ord integer not null, mod integer not null, usn integer not null,
+                            type integer not null, queue integer not null, due integer not null,
+                            ivl integer not null, factor integer not null, reps integer not null,
+                            lapses integer not null, left integer not null, odue integer not null,
+                            odid integer not null, flags integer not null default 0, data text not null default '');
+        CREATE TABLE decks (id integer primary key, name text not null);
+        CREATE TABLE notetypes (id integer primary key, name text not null);
+        CREATE TABLE fields (ntid integer not null, ord integer not null, name text not null, primary key (ntid, ord));
+        CREATE INDEX ix_notes_csum ON notes (sfld);
+        CREATE INDEX ix_cards_nid ON cards (nid);
+        CREATE INDEX ix_cards_sched ON cards (did, queue, due);
+    """)
+    with connection:
+        connection.execute(
+            "INSERT INTO col VALUES (1, ?, ?, ?, 18, '', '')", (collection.created, int(collection.now), collection.created)
+        )
+        connection.executemany(
+            "INSERT INTO decks VALUES (?, ?)",
+            [(deck_id, name.replace("::", "\x1f")) for deck_id, name in collection.decks.items()],
+        )
+        connection.executemany("INSERT INTO notetypes VALUES (?, ?)", [(model_id, name) for model_id, (name, _) in MODELS.items()])
+        connection.executemany(
+            "INSERT INTO fields VALUES (?, ?, ?)",
+            [(model_id, order, field) for model_id, (_, fields) in MODELS.items() for order, field in enumerate(fields)],
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO notes VALUES (?, ?, ?, ?, -1, '', ?, ?)",
+            ((card.note_id, f"g{card.note_id}", card.model_id, card.mod, "\x1f".join(card.fields), card.fields[0])
+             for card in collection.cards),
+        )
+        connection.executemany(
+            "INSERT INTO cards VALUES (?, ?, ?, ?, ?, -1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, '')",
+            ((card.card_id, card.note_id, card.deck_id, card.ord, card.mod, card.type, card.queue, card.due,
+              card.interval, card.factor, card.reps, card.lapses, card.left, card.original_due, card.original_deck_id)
+             for card in collection.cards),
+        )
+    connection.close()
+
+
+def iter_card_infos(collection: GeneratedCollection) -> Iterator[Dict[str, Any]]:
+    """Iterate over the `cardsInfo` dictionaries of every card."""
+    for card in collection.cards:
+        yield to_card_info(card, collection.decks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=GeneratorSpec.cards, help="Number of cards")
+    parser.add_argument("--decks", type=int, default=GeneratorSpec.decks, help="Number of decks, including sub-decks")
+    parser.add_argument("--depth", type=int, default=GeneratorSpec.depth, help="Deepest deck nesting level")
+    parser.add_argument("--seed", type=int, default=GeneratorSpec.seed, help="Random seed")
+    parser.add_argument("--polish-share", type=float, default=GeneratorSpec.polish_share, help="Share of Polish-English notes")
+    parser.add_argument("--field-bytes", type=int, default=GeneratorSpec.field_bytes, help="Padding added to every field")
+    parser.add_argument("--json", help="Write the cards as a JSON fixture to this file")
+    parser.add_argument("--anki2", help="Write the collection as a collection.anki2 SQLite file")
+    args = parser.parse_args()
+    if not args.json and not args.anki2:
+        parser.error("give --json, --anki2 or both")
+
+    spec = GeneratorSpec(
+        cards=args.cards, decks=args.decks, depth=args.depth, seed=args.seed,
+        polish_share=args.polish_share, field_bytes=args.field_bytes,
+    )
+    started = time.perf_counter()
+    collection = generate(spec)
+    print(f"Generated {len(collection.cards)} cards in {len(collection.decks)} decks in {time.perf_counter() - started:.1f}s")
+    if args.json:
+        write_json(collection, args.json)
+        print(f"Wrote {args.json}")
+    if args.anki2:
+        write_collection(collection, args.anki2)
+        print(f"Wrote {args.anki2}")
+
+
+if __name__ == "__main__":
+    main()
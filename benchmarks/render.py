@@ -0,0 +1,69 @@
+"""Benchmark console rendering throughput.
+
+Renders a synthetic review to /dev/null and reports cards per second for the
+old line-by-line rich output and both BufferedRenderer modes.
+
+Run from the repository root:
+
+    python -m benchmarks.render --cards 50000
+"""
+
+import argparse
+import os
+import time
+from typing import Callable
+
+from rich.console import Console
+
+from src.core.entities import Card, DeckCards, TodayReview
+from src.infrastructure.presentation.console import ConsolePresenter
+
+
+def make_review(cards: int, decks: int = 10) -> TodayReview:
+    """Build a review with `cards` cards spread over `decks` decks."""
+    per_deck = max(1, cards // decks)
+    return TodayReview([
+        DeckCards(
+            deck_name=f"Deck {deck}",
+            new_cards=[Card(f"Front {deck}-{index}", f"Back {deck}-{index}") for index in range(per_deck)],
+            learning_cards=[],
+            review_cards=[],
+        )
+        for deck in range(decks)
+    ])
+
+
+def render_line_by_line(review: TodayReview, stream) -> None:
+    """Render the way the presenter used to, with one rich print per line."""
+    console = Console(file=stream)
+    console.print(f"\nTotal cards to review today: {review.total_cards}")
+    for deck in review.decks:
+        console.print(f"{deck.deck_name}:")
+        console.print(f"  New cards ({len(deck.new_cards)}):")
+        for card in deck.new_cards:
+            console.print(f"    - Front: {card.front}")
+            console.print(f"      Back:  {card.back}")
+
+
+def measure(name: str, render: Callable[[TodayReview, object], None], review: TodayReview) -> None:
+    """Time one renderer and print its throughput."""
+    with open(os.devnull, "w") as stream:
+        started = time.perf_counter()
+        render(review, stream)
+        elapsed = time.perf_counter() - started
+    print(f"{name:<14} {review.total_cards / elapsed:>12,.0f} cards/s  ({elapsed:.3f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50000, help="Number of cards to render")
+    args = parser.parse_args()
+
+    review = make_review(args.cards)
+    measure("line-by-line", render_line_by_line, review)
+    measure("buffered rich", lambda r, s: ConsolePresenter(stream=s, plain=False).present(r), review)
+    measure("buffered plain", lambda r, s: ConsolePresenter(stream=s, plain=True).present(r), review)
+
+
+if __name__ == "__main__":
+    main()
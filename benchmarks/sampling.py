@@ -0,0 +1,60 @@
+"""Benchmark picking random cards from decks of growing size.
+
+Compares the old shuffle-and-slice with the seeded sampler used by
+`anki list --random`, uniform and weighted, for one page of cards. Uniform
+picks cost the same at any deck size. Weighted picks grow with the number of
+cards heavier than 1, a tenth of the deck here.
+
+Run from the repository root:
+
+    python -m benchmarks.sampling --sizes 1000,100000,1000000 --limit 20
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from src.infrastructure.persistence.sampling import sample_ids, weighted_sample_ids
+
+FIRST_CARD_ID = 1_500_000_000_000
+
+
+def shuffle_and_slice(card_ids: List[int], limit: int, offset: int) -> List[int]:
+    """Pick cards the way `get_all_cards` used to."""
+    card_ids = list(card_ids)
+    random.shuffle(card_ids)
+    return card_ids[offset:offset + limit]
+
+
+def measure(pick: Callable[[], List[int]], repeat: int) -> float:
+    """Get the fastest of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        pick()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="Comma separated deck sizes")
+    parser.add_argument("--limit", type=int, default=20, help="Cards per page")
+    parser.add_argument("--offset", type=int, default=0, help="Cards to skip")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, the fastest is reported")
+    args = parser.parse_args()
+
+    print(f"{'cards':>10} {'shuffle':>12} {'sample':>12} {'weighted':>12}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        card_ids = list(range(FIRST_CARD_ID, FIRST_CARD_ID + size))
+        # A tenth of the cards weigh more, as lapsed cards would
+        weights = {card_id: 5.0 for card_id in card_ids[::10]}
+        shuffled = measure(lambda: shuffle_and_slice(card_ids, args.limit, args.offset), args.repeat)
+        sampled = measure(lambda: sample_ids(card_ids, args.limit, args.offset, seed=1), args.repeat)
+        weighted = measure(lambda: weighted_sample_ids(card_ids, weights, args.limit, args.offset, seed=1), args.repeat)
+        print(f"{size:>10,} {shuffled:>10.3f}ms {sampled:>10.3f}ms {weighted:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
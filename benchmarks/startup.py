@@ -0,0 +1,89 @@
+"""Benchmark CLI cold start against an import-time budget.
+
+Imports `src.cli` in fresh interpreters under `python -X importtime` and
+reports the cumulative import time of the CLI module, the best of several
+runs. Exits with status 1 when it is over the budget, or when a module that
+should only load once a command runs was imported at startup.
+
+Run from the repository root:
+
+    python -m benchmarks.startup --budget-ms 150
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Modules that commands import when they run, never at startup
+DEFERRED_MODULES = [
+    "dependency_injector",
+    "requests",
+    "sqlite3",
+    "src.application.containers",
+    "src.infrastructure.persistence.anki_connect.client",
+    "src.infrastructure.presentation.console",
+]
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def measure_once(module: str) -> Tuple[int, Dict[str, int]]:
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module: The module to import
+
+    Returns:
+        Tuple of the module's cumulative import time in microseconds and the
+        cumulative time of every top-level import made along the way
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, capture_output=True, text=True, check=True,
+    )
+    imports: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            imports[match.group(4)] = int(match.group(2))
+    return imports[module], imports
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Allowed import time of the CLI module")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--module", default="src.cli", help="Module to import")
+    args = parser.parse_args()
+
+    runs: List[int] = []
+    imports: Dict[str, int] = {}
+    for _ in range(args.runs):
+        cumulative, imports = measure_once(args.module)
+        runs.append(cumulative)
+
+    best_ms = min(runs) / 1000
+    print(f"{args.module}: best {best_ms:.1f} ms, worst {max(runs) / 1000:.1f} ms over {args.runs} runs")
+    print("slowest imports:")
+    for name, micros in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in DEFERRED_MODULES if name in imports]
+    if eager:
+        print(f"FAIL: imported at startup: {', '.join(eager)}")
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if not failed:
+        print(f"OK: within the {args.budget_ms:.0f} ms budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
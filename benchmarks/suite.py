@@ -0,0 +1,199 @@
+"""End-to-end and per-layer benchmarks against a fake AnkiConnect server.
+
+For every collection size and deck count, a synthetic collection, or with
+`--source generated` a realistic one from `benchmarks.generator`, is served
+by `benchmarks.fake_anki` and measured at each layer:
+
+- client: `findCards` for all due cards and `cardsInfo` for them
+- mapper: `AnkiCardMapper.to_deck_cards` over the fetched cards
+- presenter: console rendering of the review to /dev/null
+- repository: `get_today_review` and `get_all_cards`, and `get_today_review`
+  reading cards from an already synced local mirror
+- cli: `anki today` and `anki list` in a fresh interpreter
+
+Every run is appended to a JSON lines file along with the current commit,
+so results can be compared across commits:
+
+    python -m benchmarks.suite --cards 1000,100000,1000000 --decks 10,1000
+    python -m benchmarks.suite --source generated --cards 300000 --decks 200
+    python -m benchmarks.suite --compare
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Union
+
+from src.core.entities import TodayReview
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.anki_connect.repository import AnkiConnectCardRepository
+from src.infrastructure.persistence.cache import CardSync, SqliteCardCache
+from src.infrastructure.presentation.console import ConsolePresenter
+
+from .fake_anki import FakeAnkiConnect
+from .generator import GeneratorSpec, generate
+from .synthetic import CollectionSpec, SyntheticCollection
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_RESULTS = os.path.join(ROOT, "benchmarks", "results.jsonl")
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    """Run a function `repeat` times and get its median duration in seconds."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def run_cli(url: str, *args: str) -> None:
+    """Run the CLI in a fresh interpreter against the fake server."""
+    subprocess.run(
+        [sys.executable, "-m", "src.cli", "--url", url, "--no-daemon", "--no-cache", *args],
+        cwd=ROOT, stdout=subprocess.DEVNULL, check=True,
+    )
+
+
+def run_scenario(spec: Union[CollectionSpec, GeneratorSpec], latency: float, repeat: int) -> Dict[str, float]:
+    """Benchmark every layer against one synthetic or generated collection.
+
+    Args:
+        spec: The collection to build, synthetic or generated depending on the spec type
+        latency: Seconds the fake server waits before each answer
+        repeat: Number of runs per measurement, the median is kept
+
+    Returns:
+        Median seconds per measurement
+    """
+    collection = generate(spec) if isinstance(spec, GeneratorSpec) else SyntheticCollection(spec)
+    with FakeAnkiConnect(collection, latency=latency) as fake:
+        client = AnkiConnectClient(base_url=fake.url)
+        mapper = AnkiCardMapper()
+        repository = AnkiConnectCardRepository(client, mapper)
+        sync = CardSync(client, SqliteCardCache(":memory:"))
+        synced_repository = AnkiConnectCardRepository(client, mapper, sync=sync)
+        sync.sync()
+
+        due_ids = client.find_cards("is:due")
+        cards = client.get_cards_info(due_ids)
+        review = TodayReview([mapper.to_deck_cards("Benchmark", cards)])
+
+        with open(os.devnull, "w") as devnull:
+            presenter = ConsolePresenter(stream=devnull, plain=True)
+            results = {
+                "client.find_cards": timed(lambda: client.find_cards("is:due"), repeat),
+                "client.get_cards_info": timed(lambda: client.get_cards_info(due_ids), repeat),
+                "mapper.to_deck_cards": timed(lambda: mapper.to_deck_cards("Benchmark", cards), repeat),
+                "presenter.present": timed(lambda: presenter.present(review), repeat),
+                "repository.get_today_review": timed(repository.get_today_review, repeat),
+                "repository.get_today_review.synced": timed(synced_repository.get_today_review, repeat),
+                "repository.get_all_cards": timed(lambda: repository.get_all_cards(limit=20), repeat),
+                "cli.today": timed(lambda: run_cli(fake.url, "today"), repeat),
+                "cli.list": timed(lambda: run_cli(fake.url, "list"), repeat),
+            }
+        results["due_cards"] = len(due_ids)
+    return results
+
+
+def current_commit() -> str:
+    """Get the checked-out commit, marked `-dirty` with uncommitted changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def compare(path: str) -> None:
+    """Print the two most recent commits' results side by side per scenario."""
+    if not os.path.exists(path):
+        print(f"No results recorded in {path}")
+        return
+
+    with open(path, encoding="utf-8") as results_file:
+        records = [json.loads(line) for line in results_file if line.strip()]
+
+    by_scenario: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for record in records:
+        # Later runs of the same commit replace earlier ones
+        by_scenario.setdefault(record["scenario"], {})[record["commit"]] = record["results"]
+
+    for scenario, by_commit in by_scenario.items():
+        commits = list(by_commit)[-2:]
+        print(f"\n{scenario}")
+        print(f"  {'measurement':<30}" + "".join(f"{commit:>16}" for commit in commits) + "      change")
+        for name in by_commit[commits[-1]]:
+            values = [by_commit[commit].get(name) for commit in commits]
+            cells = "".join(f"{value:>16.4f}" if value is not None else f"{'-':>16}" for value in values)
+            change = ""
+            if len(values) == 2 and values[0] and values[1] is not None:
+                change = f"{(values[1] - values[0]) / values[0]:>+11.1%}"
+            print(f"  {name:<30}{cells}{change}")
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=_int_list, default=[1000, 100000, 1000000], help="Collection sizes, comma-separated")
+    parser.add_argument("--decks", type=_int_list, default=[10, 1000], help="Deck counts, comma-separated")
+    parser.add_argument("--source", choices=["synthetic", "generated"], default="synthetic", help="How collections are built")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of generated collections")
+    parser.add_argument("--field-bytes", type=int, default=32, help="Size of each card field")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Fake server delay per request")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, the median is kept")
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="JSON lines file results are appended to")
+    parser.add_argument("--compare", action="store_true", help="Compare recorded results instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.results)
+        return
+
+    commit = current_commit()
+    for cards in args.cards:
+        for decks in args.decks:
+            if args.source == "generated":
+                spec = GeneratorSpec(cards=cards, decks=decks, seed=args.seed, field_bytes=args.field_bytes)
+            else:
+                spec = CollectionSpec(cards=cards, decks=decks, field_bytes=args.field_bytes)
+            results = run_scenario(spec, args.latency_ms / 1000, args.repeat)
+            print(f"\n{spec.name} ({results['due_cards']} due)")
+            for name, seconds in results.items():
+                if name != "due_cards":
+                    print(f"  {name:<30} {seconds * 1000:>10.2f} ms")
+
+            record = {
+                "commit": commit,
+                "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "scenario": f"{spec.name}-{args.latency_ms:g}ms",
+                "spec": {
+                    "source": args.source, "cards": cards, "decks": decks, "seed": args.seed,
+                    "field_bytes": args.field_bytes, "latency_ms": args.latency_ms,
+                },
+                "results": results,
+            }
+            with open(args.results, "a", encoding="utf-8") as results_file:
+                results_file.write(json.dumps(record) + "\n")
+    print(f"\nResults appended to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Deterministic synthetic card collections for benchmarks.
+
+Cards are never stored as dictionaries. Every property is derived from the
+card's index, so a million-card collection only keeps a few integer arrays
+in memory and `card_info` builds AnkiConnect-shaped dictionaries on demand.
+"""
+
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+DAY = 86400
+
+# Share of cards per state, out of 10: new, learning, due review, not yet due review
+NEW, LEARNING, DUE, NOT_DUE = 0, 1, 2, 3
+# Suspended and buried cards, which synthetic collections don't have
+INACTIVE = 4
+_STATE_BY_SLOT = [NEW, NEW, NEW, LEARNING, DUE, DUE, DUE, NOT_DUE, NOT_DUE, NOT_DUE]
+
+# Card IDs are millisecond timestamps in Anki, keep them in a realistic range
+FIRST_CARD_ID = 1_500_000_000_000
+# Cards were last modified one second apart, long ago
+_FIRST_MOD = 1_700_000_000
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """Size and shape of a synthetic collection."""
+    cards: int
+    decks: int
+    field_bytes: int = 32
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """Get a short name for reports, e.g. `100k-cards-10-decks`."""
+        return f"{_short(self.cards)}-cards-{self.decks}-decks"
+
+
+def _short(count: int) -> str:
+    if count >= 1_000_000 and count % 1_000_000 == 0:
+        return f"{count // 1_000_000}M"
+    if count >= 1_000 and count % 1_000 == 0:
+        return f"{count // 1_000}k"
+    return str(count)
+
+
+class SyntheticCollection:
+    """A generated collection with cards spread evenly over top-level decks."""
+
+    def __init__(self, spec: CollectionSpec, now: float = None):
+        """Generate the collection.
+
+        Args:
+            spec: Size and shape of the collection
+            now: Current time, used to make review and learning cards due
+        """
+        self.spec = spec
+        self.name = spec.name
+        self.now = time.time() if now is None else now
+        self.today = int(self.now / DAY)
+        self.deck_names = [f"Deck {index:04d}" for index in range(spec.decks)]
+        self._padding = "x" * max(0, spec.field_bytes - 16)
+
+        self.states = array("b", (self._state(index) for index in range(spec.cards)))
+        self.ids_by_deck_and_state: Dict[int, Dict[int, array]] = {
+            deck: {state: array("q") for state in (NEW, LEARNING, DUE, NOT_DUE)} for deck in range(spec.decks)
+        }
+        for index, state in enumerate(self.states):
+            self.ids_by_deck_and_state[index % spec.decks][state].append(FIRST_CARD_ID + index)
+
+    def _state(self, index: int) -> int:
+        mixed = ((index + self.spec.seed) * 2654435761) & 0xFFFFFFFF
+        return _STATE_BY_SLOT[mixed % 10]
+
+    def deck_index(self, name: str) -> int:
+        """Get the index of a deck by name.
+
+        Raises:
+            KeyError: If there is no such deck
+        """
+        if not name.startswith("Deck ") or not name[5:].isdigit() or int(name[5:]) >= self.spec.decks:
+            raise KeyError(name)
+        return int(name[5:])
+
+    def deck_list(self) -> List[str]:
+        """Get every deck name, as `deckNames` returns them."""
+        return ["Default"] + self.deck_names
+
+    def find_cards(self, deck: Optional[str], states: Set[int], include_children: bool = True) -> List[int]:
+        """Find card IDs in a deck, in any of the given states.
+
+        Args:
+            deck: Deck name, None or `*` for all decks
+            states: Card states to match
+            include_children: Unused, synthetic decks have no sub-decks
+
+        Raises:
+            KeyError: If there is no such deck
+        """
+        if deck == "Default":
+            return []
+        decks = range(self.spec.decks) if deck is None or deck == "*" else [self.deck_index(deck)]
+        return self.card_ids(decks, states)
+
+    def deck_stats(self, names: Iterable[str]) -> Dict[str, Dict]:
+        """Build the AnkiConnect `getDeckStats` result for the given decks.
+
+        Raises:
+            KeyError: If there is no such deck
+        """
+        stats = {}
+        for name in names:
+            deck = None if name == "Default" else self.deck_index(name)
+            counts = {state: len(ids) for state, ids in self.ids_by_deck_and_state[deck].items()} if deck is not None else {}
+            deck_id = 1 if deck is None else deck + 2
+            stats[str(deck_id)] = {
+                "deck_id": deck_id,
+                "name": name,
+                "new_count": counts.get(NEW, 0),
+                "learn_count": counts.get(LEARNING, 0),
+                "review_count": counts.get(DUE, 0),
+                "total_in_deck": sum(counts.values()),
+            }
+        return stats
+
+    def card_ids(self, decks: Iterable[int], states: Iterable[int]) -> List[int]:
+        """Get the IDs of cards in the given decks and states, in ID order."""
+        states = list(states)
+        ids: List[int] = []
+        for deck in decks:
+            for state in states:
+                ids.extend(self.ids_by_deck_and_state[deck].get(state, ()))
+        ids.sort()
+        return ids
+
+    def card_info(self, card_id: int) -> Dict:
+        """Build the AnkiConnect `cardsInfo` entry of a card.
+
+        Raises:
+            KeyError: If there is no such card
+        """
+        index = card_id - FIRST_CARD_ID
+        if not 0 <= index < self.spec.cards:
+            raise KeyError(card_id)
+        state = self.states[index]
+        queue, card_type, due = {
+            NEW: (0, 0, index),
+            LEARNING: (1, 1, int(self.now * 1000) - 60_000),
+            DUE: (2, 2, self.today - index % 7),
+            NOT_DUE: (2, 2, self.today + 1 + index % 30),
+        }[state]
+        return {
+            "cardId": card_id,
+            "note": card_id,
+            "deckName": self.deck_names[index % self.spec.decks],
+            "modelName": "Basic",
+            "fieldOrder": 0,
+            "fields": {
+                "Front": {"value": f"Front {index} {self._padding}", "order": 0},
+                "Back": {"value": f"Back {index} {self._padding}", "order": 1},
+            },
+            "ord": 0,
+            "type": card_type,
+            "queue": queue,
+            "due": due,
+            "odue": 0,
+            "interval": 0 if state in (NEW, LEARNING) else 1 + index % 100,
+            "factor": 2500,
+            "reps": 0 if state == NEW else 1 + index % 20,
+            "lapses": index % 3,
+            "left": 0,
+            "mod": _FIRST_MOD + index,
+        }
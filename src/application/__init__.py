@@ -1,6 +1,26 @@
-"""The Anki Today application."""
+"""The Anki Today application.
 
-from .containers import Container
-from .use_cases.today_review import AnkiToday
+Exports are imported on first access, see `src.infrastructure`.
+"""
 
-__all__ = ["Container", "AnkiToday"] 
\ No newline at end of file
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "Container": ".containers",
+    "AnkiToday": ".use_cases.today_review",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,33 +2,257 @@
 
 from dependency_injector import containers, providers
 
-from src.infrastructure import AnkiConnectClient, AnkiConnectCardRepository, ConsolePresenter
+from src.infrastructure import AnkiConnectClient, AnkiConnectCardRepository, AnkiConnectTransport, ConsolePresenter
+from src.infrastructure.persistence.anki_connect.async_client import AsyncAnkiConnectClient
+from src.infrastructure.persistence.anki_connect.async_repository import AsyncAnkiConnectCardRepository
+from src.infrastructure.persistence.anki_connect.async_transport import AsyncAnkiConnectTransport
+from src.infrastructure.persistence.anki_connect.chunking import AdaptiveChunker
+from src.infrastructure.persistence.anki_connect.day_probe import DueDayProbe
+from src.infrastructure.persistence.anki_connect.fields import DEFAULT_PAIRS, FieldExtractors
 from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.anki_connect.memo import ResponseMemo
+from src.infrastructure.persistence.anki_connect.planner import TodayQueryPlanner
+from src.infrastructure.persistence.cache import CachingAnkiConnectClient, CardSync, SqliteCardCache
+from src.infrastructure.persistence.clock import SchedulerClock
+from src.infrastructure.persistence.collection import CollectionCardRepository
+from src.infrastructure.presentation.encoders import get_json_encoder
+from src.infrastructure.presentation.structured import CsvPresenter, JsonPresenter, NdjsonPresenter
 from src.application.use_cases.today_review import AnkiToday
+from src.application.use_cases.today_summary import AnkiTodaySummary
 from src.application.use_cases.list_cards import AnkiList
 
 
+def _no_async_collection() -> None:
+    """Refuse the async stack for the collection backend, which only has a sync repository."""
+    raise ValueError("The collection backend has no async stack, read the collection without --async")
+
+
 class Container(containers.DeclarativeContainer):
     """IoC container for dependency injection."""
 
+    config = providers.Configuration(default={
+        # "sync" or "async"
+        "stack": "sync",
+        # "anki_connect" or "collection"
+        "backend": "anki_connect",
+        "collection": {
+            "path": None,
+            "mmap_size": 256 * 1024 * 1024,
+        },
+        "anki_connect": {
+            "url": "http://localhost:8765",
+            "pool_size": 4,
+            "connect_timeout": 3.05,
+            "read_timeout": 60.0,
+            "keep_alive": True,
+            "max_workers": 4,
+            "max_concurrency": 8,
+        },
+        "chunking": {
+            "initial_size": 500,
+            "min_size": 50,
+            "max_size": 5000,
+            "target_latency": 0.5,
+            "max_response_bytes": 4 * 1024 * 1024,
+        },
+        "cache": {
+            # "sync" mirrors looked up cards and drops deleted ones, "sqlite" only
+            # caches looked up cards, both refetch cards whose modification time
+            # changed. "none" disables caching
+            "backend": "sync",
+            # None uses the default location in the user's cache directory
+            "path": None,
+            # Seconds between listings of every card ID, which find deletions deck totals miss
+            "full_sync_interval": 86400,
+        },
+        "memo": {
+            # "memory" remembers repeated read requests within the process, "none" disables it
+            "backend": "memory",
+            # Seconds per action, None uses the defaults in anki_connect.memo
+            "ttls": None,
+            "max_entries": 1024,
+            "max_bytes": 8 * 1024 * 1024,
+        },
+        "scheduler": {
+            # Local hour at which Anki starts a new day, Anki's "Next day starts at" preference
+            "rollover_hour": 4,
+            # Days from today searched for a review card that tells today's day number
+            "probe_days": 7,
+        },
+        "fields": {
+            # Work out the front and back of cards only once a presenter reads them
+            "lazy": True,
+            # Front and back field names tried for every note model, in order
+            "pairs": [list(pair) for pair in DEFAULT_PAIRS],
+            # Front and back of particular note models, e.g. {"Cloze": {"front": "Text", "back": "Back Extra"}}
+            "models": {},
+        },
+        "planner": {
+            "min_decks_for_global": 20,
+            "sparse_cards_per_deck": 5,
+        },
+        "output": {
+            # "console", "json", "ndjson" or "csv"
+            "format": "console",
+            # "auto", "orjson" or "json"
+            "json_encoder": "auto",
+        },
+        "daemon": {
+            # Whether commands are delegated to a running `anki serve` daemon
+            "enabled": True,
+            # None uses the default location, see default_socket_path
+            "socket": None,
+        },
+    })
+
     # Infrastructure
-    client = providers.Singleton(AnkiConnectClient)
-    mapper = providers.Singleton(AnkiCardMapper)
-    repository = providers.Singleton(
+    transport = providers.Singleton(
+        AnkiConnectTransport,
+        pool_size=config.anki_connect.pool_size,
+        connect_timeout=config.anki_connect.connect_timeout,
+        read_timeout=config.anki_connect.read_timeout,
+        keep_alive=config.anki_connect.keep_alive
+    )
+    chunker = providers.Singleton(
+        AdaptiveChunker,
+        initial_size=config.chunking.initial_size,
+        min_size=config.chunking.min_size,
+        max_size=config.chunking.max_size,
+        target_latency=config.chunking.target_latency,
+        max_response_bytes=config.chunking.max_response_bytes
+    )
+    memo = providers.Selector(
+        config.memo.backend,
+        memory=providers.Singleton(
+            ResponseMemo,
+            ttls=config.memo.ttls,
+            max_entries=config.memo.max_entries,
+            max_bytes=config.memo.max_bytes
+        ),
+        none=providers.Object(None)
+    )
+    client = providers.Singleton(
+        AnkiConnectClient,
+        base_url=config.anki_connect.url,
+        transport=transport,
+        chunker=chunker,
+        max_workers=config.anki_connect.max_workers,
+        memo=memo
+    )
+    card_cache = providers.Singleton(SqliteCardCache, path=config.cache.path)
+    cards_client = providers.Selector(
+        config.cache.backend,
+        sqlite=providers.Singleton(CachingAnkiConnectClient, client=client, cache=card_cache),
+        sync=client,
+        none=client
+    )
+    card_sync = providers.Selector(
+        config.cache.backend,
+        sync=providers.Singleton(
+            CardSync,
+            client=client,
+            cache=card_cache,
+            full_sync_interval=config.cache.full_sync_interval
+        ),
+        sqlite=providers.Object(None),
+        none=providers.Object(None)
+    )
+    # Found once per process, so a daemon asks Anki for today's day number only once
+    scheduler_clock = providers.Singleton(
+        SchedulerClock,
+        probe=providers.Selector(
+            config.backend,
+            anki_connect=providers.Singleton(DueDayProbe, client=client, max_days=config.scheduler.probe_days),
+            collection=providers.Object(None)
+        ),
+        rollover_hour=config.scheduler.rollover_hour
+    )
+    field_extractors = providers.Singleton(
+        FieldExtractors,
+        pairs=config.fields.pairs,
+        models=config.fields.models
+    )
+    mapper = providers.Singleton(
+        AnkiCardMapper,
+        clock=scheduler_clock,
+        fields=field_extractors,
+        lazy_fields=config.fields.lazy
+    )
+    planner = providers.Singleton(
+        TodayQueryPlanner,
+        min_decks_for_global=config.planner.min_decks_for_global,
+        sparse_cards_per_deck=config.planner.sparse_cards_per_deck
+    )
+    anki_connect_repository = providers.Singleton(
         AnkiConnectCardRepository,
-        client=client,
-        mapper=mapper
+        client=cards_client,
+        mapper=mapper,
+        planner=planner,
+        sync=card_sync
+    )
+    collection_repository = providers.Singleton(
+        CollectionCardRepository,
+        path=config.collection.path,
+        mapper=mapper,
+        mmap_size=config.collection.mmap_size,
+        clock=scheduler_clock
+    )
+    repository = providers.Selector(
+        config.backend,
+        anki_connect=anki_connect_repository,
+        collection=collection_repository
+    )
+    async_transport = providers.Singleton(
+        AsyncAnkiConnectTransport,
+        pool_size=config.anki_connect.pool_size,
+        connect_timeout=config.anki_connect.connect_timeout,
+        read_timeout=config.anki_connect.read_timeout,
+        keep_alive=config.anki_connect.keep_alive
+    )
+    async_client = providers.Singleton(
+        AsyncAnkiConnectClient,
+        base_url=config.anki_connect.url,
+        transport=async_transport,
+        chunker=chunker,
+        max_workers=config.anki_connect.max_workers
+    )
+    async_repository = providers.Singleton(
+        AsyncAnkiConnectCardRepository,
+        client=async_client,
+        mapper=mapper,
+        max_concurrency=config.anki_connect.max_concurrency
+    )
+    stack_repository = providers.Selector(
+        config.stack,
+        sync=repository,
+        **{"async": providers.Selector(
+            config.backend,
+            anki_connect=async_repository,
+            collection=providers.Callable(_no_async_collection)
+        )}
+    )
+    json_encoder = providers.Callable(get_json_encoder, config.output.json_encoder)
+    presenter = providers.Selector(
+        config.output.format,
+        console=providers.Singleton(ConsolePresenter),
+        json=providers.Singleton(JsonPresenter, encoder=json_encoder),
+        ndjson=providers.Singleton(NdjsonPresenter, encoder=json_encoder),
+        csv=providers.Singleton(CsvPresenter),
     )
-    presenter = providers.Singleton(ConsolePresenter)
 
-    # Use cases
-    anki_today = providers.Singleton(
+    # Use cases, built per call so they pick up the currently selected presenter
+    anki_today = providers.Factory(
         AnkiToday,
+        repository=stack_repository,
+        presenter=presenter
+    )
+    anki_today_summary = providers.Factory(
+        AnkiTodaySummary,
         repository=repository,
         presenter=presenter
     )
-    anki_list = providers.Singleton(
+    anki_list = providers.Factory(
         AnkiList,
-        repository=repository,
+        repository=stack_repository,
         presenter=presenter
     ) 
\ No newline at end of file
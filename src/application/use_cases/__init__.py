@@ -1,5 +1,6 @@
 """Use cases for the Anki Today application."""
 
 from .today_review import AnkiToday
+from .today_summary import AnkiTodaySummary
 
-__all__ = ["AnkiToday"] 
\ No newline at end of file
+__all__ = ["AnkiToday", "AnkiTodaySummary"] 
\ No newline at end of file
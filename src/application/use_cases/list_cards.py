@@ -1,14 +1,15 @@
 """Use case for listing all cards in Anki."""
 
-from typing import Optional
+from typing import Iterator, Optional, Union
 
-from src.core.ports import CardRepository, ReviewPresenter
+from src.core.entities import DeckCards
+from src.core.ports import AsyncCardRepository, CardRepository, ReviewPresenter
 
 
 class AnkiList:
     """Use case for listing all cards in Anki."""
 
-    def __init__(self, repository: CardRepository, presenter: ReviewPresenter):
+    def __init__(self, repository: Union[CardRepository, AsyncCardRepository], presenter: ReviewPresenter):
         """Initialize AnkiList with required dependencies.
 
         Args:
@@ -18,7 +19,15 @@ class AnkiList:
         self._repository = repository
         self._presenter = presenter
 
-    def execute(self, limit: int = 20, offset: int = 0, deck: Optional[str] = None, random: bool = False) -> None:
+    def execute(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> None:
         """Execute the use case to list all cards.
 
         Args:
@@ -26,6 +35,67 @@ class AnkiList:
             offset: Number of cards to skip
             deck: Optional deck name to filter by
             random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
         """
-        review = self._repository.get_all_cards(limit=limit, offset=offset, deck_name=deck, random=random)
-        self._presenter.present(review) 
\ No newline at end of file
+        review = self._repository.get_all_cards(
+            limit=limit, offset=offset, deck_name=deck, random=random, seed=seed, weight=weight
+        )
+        self._presenter.present(review)
+
+    def execute_pages(
+        self,
+        deck: Optional[str] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None,
+        max_pages: Optional[int] = None,
+    ) -> Optional[str]:
+        """Execute the use case page by page, presenting each page as it arrives.
+
+        Args:
+            deck: Optional deck name to filter by
+            page_size: Maximum number of cards per page
+            cursor: Token of a page to continue after, None to start at the beginning
+            max_pages: Maximum number of pages to present, all of them if not given
+
+        Returns:
+            Token to continue after the last presented page, None if there are no more cards
+        """
+        next_cursor = None
+
+        def decks() -> Iterator[DeckCards]:
+            nonlocal next_cursor
+            pages = self._repository.iter_card_pages(deck_name=deck, page_size=page_size, cursor=cursor)
+            for index, page in enumerate(pages):
+                next_cursor = page.cursor
+                if page.deck.total_cards > 0:
+                    yield page.deck
+                if max_pages is not None and index + 1 >= max_pages:
+                    return
+
+        self._presenter.present_stream(decks())
+        return next_cursor
+
+    async def execute_async(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> None:
+        """Execute the use case against an asyncio repository.
+
+        Args:
+            limit: Maximum number of cards per deck to fetch
+            offset: Number of cards to skip
+            deck: Optional deck name to filter by
+            random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
+        """
+        review = await self._repository.get_all_cards(
+            limit=limit, offset=offset, deck_name=deck, random=random, seed=seed, weight=weight
+        )
+        self._presenter.present(review)
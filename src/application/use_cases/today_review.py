@@ -1,13 +1,13 @@
 """Use case for getting today's review cards."""
 
-from typing import Optional
-from src.core.ports import CardRepository, ReviewPresenter
+from typing import Optional, Union
+from src.core.ports import AsyncCardRepository, CardRepository, ReviewPresenter
 
 
 class AnkiToday:
     """Use case for getting today's review cards."""
 
-    def __init__(self, repository: CardRepository, presenter: ReviewPresenter):
+    def __init__(self, repository: Union[CardRepository, AsyncCardRepository], presenter: ReviewPresenter):
         """Initialize AnkiToday with required dependencies.
 
         Args:
@@ -24,4 +24,21 @@ class AnkiToday:
             deck_name: Optional deck name to filter by
         """
         review = self._repository.get_today_review(deck_name=deck_name)
-        self._presenter.present(review) 
\ No newline at end of file
+        self._presenter.present(review) 
+
+    def execute_stream(self, deck_name: Optional[str] = None) -> None:
+        """Execute the use case, presenting each deck as soon as it is fetched.
+
+        Args:
+            deck_name: Optional deck name to filter by
+        """
+        self._presenter.present_stream(self._repository.iter_today_review(deck_name=deck_name))
+
+    async def execute_async(self, deck_name: Optional[str] = None) -> None:
+        """Execute the use case against an asyncio repository.
+
+        Args:
+            deck_name: Optional deck name to filter by
+        """
+        review = await self._repository.get_today_review(deck_name=deck_name)
+        self._presenter.present(review)
@@ -0,0 +1,27 @@
+"""Use case for counting today's review cards."""
+
+from typing import Optional
+from src.core.ports import CardRepository, ReviewPresenter
+
+
+class AnkiTodaySummary:
+    """Use case for counting today's review cards per deck."""
+
+    def __init__(self, repository: CardRepository, presenter: ReviewPresenter):
+        """Initialize AnkiTodaySummary with required dependencies.
+
+        Args:
+            repository: Repository for accessing card data
+            presenter: Presenter for displaying the results
+        """
+        self._repository = repository
+        self._presenter = presenter
+
+    def execute(self, deck_name: Optional[str] = None) -> None:
+        """Execute the use case to count today's review cards.
+
+        Args:
+            deck_name: Optional deck name to filter by
+        """
+        summary = self._repository.get_today_summary(deck_name=deck_name)
+        self._presenter.present_summary(summary)
@@ -1,12 +1,21 @@
-"""Command Line Interface for Anki CLI."""
+"""Command Line Interface for Anki CLI.
 
-from typing import Optional
+Only typer is imported at module level. The DI container, and with it the
+HTTP stack, the repositories and the presenters, is imported when a command
+runs, so `anki --help` and option errors don't pay for it. When an
+`anki serve` daemon is running, commands are sent to it and the container
+is never imported at all.
+"""
+
+import contextlib
+import copy
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 import typer
-from rich import print
-from rich.console import Console
-from rich.table import Table
 
-from src.application.containers import Container
+if TYPE_CHECKING:
+    from src.application.containers import Container
 
 app = typer.Typer(
     name="anki",
@@ -14,44 +23,254 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+OUTPUT_FORMATS = ("console", "json", "ndjson", "csv")
+# Formats written card by card, which always use the streaming pipeline
+STREAMING_FORMATS = ("ndjson", "csv")
+# Ways `list --random` can weigh cards, see src.infrastructure.persistence.sampling
+WEIGHTS = ("lapses", "ease", "overdue")
+
+
+def _create_container(ctx: typer.Context) -> "Container":
+    """Create the container configured from the global CLI options."""
+    from src.application.containers import Container
+
+    container = Container()
+    # from_dict merges the defaults into nested dicts, keep the CLI options as given
+    container.config.from_dict(copy.deepcopy(ctx.obj or {}))
+    return container
+
+
+def _print_error(error: Exception) -> None:
+    """Print an error message to the console."""
+    from rich.console import Console
+
+    Console().print(f"[red]Error:[/red] {str(error)}")
+
+
+def _run(coroutine) -> None:
+    """Run a coroutine to completion on a new event loop."""
+    import asyncio
+
+    asyncio.run(coroutine)
+
+
+def _run_today(container: "Container", deck: Optional[str] = None, summary: bool = False, stream: bool = False) -> None:
+    """Run the `today` command against a container."""
+    if summary:
+        container.anki_today_summary().execute(deck_name=deck)
+        return
+    anki_today = container.anki_today()
+    if container.config.stack() == "async":
+        _run(anki_today.execute_async(deck_name=deck))
+    elif stream or container.config.output.format() in STREAMING_FORMATS:
+        anki_today.execute_stream(deck_name=deck)
+    else:
+        anki_today.execute(deck_name=deck)
+
+
+def _run_list(
+    container: "Container",
+    limit: int = 20,
+    offset: int = 0,
+    deck: Optional[str] = None,
+    random: bool = False,
+    seed: Optional[int] = None,
+    weight: Optional[str] = None,
+    all_cards: bool = False,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> None:
+    """Run the `list` command against a container."""
+    anki_list = container.anki_list()
+    if all_cards or cursor or page_size:
+        if container.config.stack() == "async":
+            raise RuntimeError("--all, --cursor and --page-size are not supported with --async")
+        next_cursor = anki_list.execute_pages(
+            deck=deck, page_size=page_size or 500, cursor=cursor, max_pages=None if all_cards else 1
+        )
+        if next_cursor and not all_cards:
+            sys.stderr.write(f"Next page: anki list --cursor {next_cursor}\n")
+        return
+    if container.config.stack() == "async":
+        _run(anki_list.execute_async(limit=limit, offset=offset, deck=deck, random=random, seed=seed, weight=weight))
+    else:
+        anki_list.execute(limit=limit, offset=offset, deck=deck, random=random, seed=seed, weight=weight)
+
+
+# Commands a daemon can run on behalf of the CLI
+COMMANDS = {"today": _run_today, "list": _run_list}
+
+
+@contextlib.contextmanager
+def _profiled(ctx: typer.Context) -> Iterator[None]:
+    """Profile the command when --profile is given, then report the timings."""
+    profile = (ctx.obj or {}).get("profile", {})
+    if not profile.get("enabled"):
+        yield
+        return
+
+    from src.infrastructure import profiling
+
+    profiler = profiling.Profiler(cprofile_stage=profile.get("stage"))
+    try:
+        with profiling.activate(profiler):
+            yield
+    finally:
+        sys.stderr.write("\n" + profiler.format_report() + "\n")
+        if profile.get("trace"):
+            profiler.write_trace(profile["trace"])
+            sys.stderr.write(f"Trace written to {profile['trace']}\n")
+
+
+def _delegate(ctx: typer.Context, command: str, params: Dict[str, Any]) -> bool:
+    """Send a command to a running daemon.
+
+    Returns:
+        True if the daemon ran the command, False if it has to run here
+
+    Raises:
+        RuntimeError: If the daemon failed to run the command
+    """
+    options = ctx.obj or {}
+    daemon = options.get("daemon", {})
+    # Profiling measures this process, so it always runs the command here
+    if not daemon.get("enabled", True) or options.get("profile", {}).get("enabled"):
+        return False
+
+    from src.infrastructure.daemon.client import DaemonClient
+
+    response = DaemonClient(daemon.get("socket")).request(command, params, options)
+    if response is None or response.get("status") == "unsupported":
+        return False
+    if response.get("status") != "ok":
+        raise RuntimeError(response.get("error", "Unknown daemon error"))
+    sys.stdout.write(response.get("output", ""))
+    return True
 
 
 @app.command()
 def today(
+    ctx: typer.Context,
     deck: Optional[str] = typer.Option(None, help="Filter reviews by deck name"),
+    summary: bool = typer.Option(False, help="Only show the number of cards due per deck"),
+    stream: bool = typer.Option(False, help="Show each deck as soon as it is fetched"),
 ):
     """Show today's reviews."""
+    params = {"deck": deck, "summary": summary, "stream": stream}
     try:
-        container = Container()
-        anki_today = container.anki_today()
-        anki_today.execute(deck_name=deck)
+        with _profiled(ctx):
+            if not _delegate(ctx, "today", params):
+                _run_today(_create_container(ctx), **params)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        _print_error(e)
         raise typer.Exit(code=1)
 
 
 @app.command()
 def list(
+    ctx: typer.Context,
     limit: int = typer.Option(20, help="Limit of cards per deck to fetch"),
     offset: int = typer.Option(0, help="Number of cards to skip"),
     deck: Optional[str] = typer.Option(None, help="Get cards only from given deck"),
     random: bool = typer.Option(False, help="Randomize the order of cards"),
+    seed: Optional[int] = typer.Option(None, help="Seed of the random order, so --offset pages through it"),
+    weight: Optional[str] = typer.Option(
+        None, help="Favour cards by lapses, ease or overdue when sampling (implies --random)"
+    ),
+    all_cards: bool = typer.Option(False, "--all", help="Stream every card, one page at a time"),
+    cursor: Optional[str] = typer.Option(None, help="Show the page after this cursor, printed by the previous page"),
+    page_size: Optional[int] = typer.Option(
+        None, min=1, help="Show one page of this many cards, 500 by default with --all or --cursor"
+    ),
 ):
     """List all cards in Anki."""
+    if weight is not None and weight not in WEIGHTS:
+        raise typer.BadParameter(f"must be one of {', '.join(WEIGHTS)}", param_hint="--weight")
+    if (random or weight) and seed is None:
+        from src.infrastructure.persistence.sampling import new_seed
+
+        seed = new_seed()
+        sys.stderr.write(f"Random seed: {seed}, pass --seed {seed} to page through the same order\n")
+    params = {"limit": limit, "offset": offset, "deck": deck, "random": random, "seed": seed, "weight": weight}
+    paged = {"all_cards": all_cards, "cursor": cursor, "page_size": page_size}
     try:
-        container = Container()
-        anki_list = container.anki_list()
-        anki_list.execute(limit=limit, offset=offset, deck=deck, random=random)
+        with _profiled(ctx):
+            # The daemon sends its output back in one piece, so paged listings run here
+            if all_cards or cursor or page_size:
+                _run_list(_create_container(ctx), **params, **paged)
+            elif not _delegate(ctx, "list", params):
+                _run_list(_create_container(ctx), **params)
     except Exception as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        _print_error(e)
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(ctx: typer.Context):
+    """Run a background daemon that keeps connections and caches warm for other commands."""
+    import signal
+    from src.infrastructure.daemon.server import AnkiDaemon
+
+    # Exit through KeyboardInterrupt on `kill` too, so the socket is removed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    options = ctx.obj or {}
+    try:
+        daemon = AnkiDaemon(
+            _create_container(ctx), options, COMMANDS, path=options.get("daemon", {}).get("socket")
+        )
+        typer.echo(f"Listening on {daemon.path}")
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        _print_error(e)
         raise typer.Exit(code=1)
 
 
 @app.callback()
-def callback():
+def callback(
+    ctx: typer.Context,
+    use_async: bool = typer.Option(False, "--async", help="Fetch cards concurrently on asyncio"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Send every request to Anki, bypassing the local card cache and the request memo"),
+    collection: Optional[str] = typer.Option(
+        None, help="Read cards from this collection.anki2 file instead of AnkiConnect"
+    ),
+    url: Optional[str] = typer.Option(None, help="AnkiConnect URL, http://localhost:8765 by default"),
+    output_format: str = typer.Option("console", "--format", help="Output format: console, json, ndjson or csv"),
+    no_daemon: bool = typer.Option(False, "--no-daemon", help="Run the command here even if a daemon is running"),
+    socket: Optional[str] = typer.Option(None, help="Path of the daemon socket"),
+    profile: bool = typer.Option(False, help="Print how long each stage of the command took"),
+    profile_trace: Optional[str] = typer.Option(
+        None, help="Also write the timings to this file as a Chrome trace (implies --profile)"
+    ),
+    profile_stage: Optional[str] = typer.Option(
+        None, help="Also run cProfile in this stage, e.g. mapper.to_deck_cards (implies --profile)"
+    ),
+):
     """CLI tool for interacting with Anki."""
-    pass
+    if output_format not in OUTPUT_FORMATS:
+        raise typer.BadParameter(f"must be one of {', '.join(OUTPUT_FORMATS)}", param_hint="--format")
+    if use_async and collection:
+        raise typer.BadParameter(
+            "can't be combined with --collection, the collection file is read synchronously", param_hint="--async"
+        )
+    options: Dict[str, Any] = {"stack": "async" if use_async else "sync", "output": {"format": output_format}}
+    if no_cache:
+        options["cache"] = {"backend": "none"}
+        options["memo"] = {"backend": "none"}
+    if url:
+        options["anki_connect"] = {"url": url}
+    if collection:
+        options["backend"] = "collection"
+        # Absolute, so a daemon running elsewhere opens the same file
+        options["collection"] = {"path": os.path.abspath(collection)}
+    options["daemon"] = {"enabled": not no_daemon, "socket": socket}
+    options["profile"] = {
+        "enabled": bool(profile or profile_trace or profile_stage),
+        "trace": profile_trace,
+        "stage": profile_stage,
+    }
+    ctx.obj = options
 
 
 if __name__ == "__main__":
@@ -5,5 +5,8 @@ Core domain entities for Anki Today application.
 from .deck import DeckCards
 from .review import TodayReview
 from .card import Card
+from .batch import CardBatch
+from .summary import DeckSummary, TodaySummary
+from .page import CardPage
 
-__all__ = ['DeckCards', 'TodayReview', 'Card'] 
\ No newline at end of file
+__all__ = ['DeckCards', 'TodayReview', 'Card', 'CardBatch', 'DeckSummary', 'TodaySummary', 'CardPage'] 
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""
+Card batch entity storing many cards in a few compact columns.
+"""
+
+from array import array
+from itertools import accumulate
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+from .card import Card
+
+# Value of the ID column for cards without an ID, Anki's IDs are creation timestamps
+_NO_ID = 0
+# Joined fronts, where each front ends, joined backs and where each back ends
+_Text = Tuple[str, array, str, array]
+
+
+class CardBatch(Sequence[Card]):
+    """A read-only sequence of cards stored column by column.
+
+    A list of cards costs an object and two strings per card. A batch keeps
+    the card IDs in one array, and the fronts and the backs each in one string
+    with an array of where every card's text ends, so a card costs little more
+    than its text. Cards are built as they are read.
+
+    A batch made with `deferred` knows only its card IDs until a card's front
+    or back is first read, and counting its cards never reads them.
+    """
+
+    __slots__ = ("_ids", "_fronts", "_front_ends", "_backs", "_back_ends", "_pending")
+
+    def __init__(
+        self,
+        fronts: Sequence[str] = (),
+        backs: Sequence[str] = (),
+        card_ids: Sequence[Optional[int]] = (),
+    ):
+        """Initialize the batch from its columns.
+
+        Args:
+            fronts: Front of every card
+            backs: Back of every card, in the same order
+            card_ids: ID of every card, None for cards without one
+
+        Raises:
+            ValueError: If the columns have different lengths
+        """
+        self._ids = _id_array(card_ids)
+        self._pending: Optional[Callable[[], _Text]] = None
+        self._fronts, self._front_ends, self._backs, self._back_ends = _join_text(fronts, backs, len(self._ids))
+
+    @classmethod
+    def of(cls, cards: Iterable[Card]) -> "CardBatch":
+        """Build a batch from cards.
+
+        Args:
+            cards: The cards, in order
+
+        Returns:
+            A batch of the same cards
+        """
+        cards = list(cards)
+        return cls([card.front for card in cards], [card.back for card in cards], [card.card_id for card in cards])
+
+    @classmethod
+    def deferred(
+        cls,
+        card_ids: Sequence[Optional[int]],
+        resolve: Callable[[], Tuple[Sequence[str], Sequence[str]]],
+    ) -> "CardBatch":
+        """Build a batch whose fronts and backs are only worked out once they are read.
+
+        Args:
+            card_ids: ID of every card, None for cards without one
+            resolve: Gets the fronts and backs of the cards, in the same order.
+                It is called at most once and released afterwards, along with
+                anything it holds on to.
+
+        Returns:
+            A batch of the cards
+        """
+        batch = cls()
+        batch._ids = _id_array(card_ids)
+        count = len(batch._ids)
+        batch._pending = lambda: _join_text(*resolve(), count)
+        return batch
+
+    @classmethod
+    def concat(cls, groups: Iterable[Iterable[Card]]) -> "CardBatch":
+        """Join groups of cards into one batch.
+
+        Args:
+            groups: Batches or other iterables of cards, in order
+
+        Returns:
+            A batch of every card in the groups, deferred if any of them is
+        """
+        batches = [group if isinstance(group, CardBatch) else cls.of(group) for group in groups]
+        batch = cls()
+        for group in batches:
+            batch._ids.extend(group._ids)
+        if any(group._pending is not None for group in batches):
+            batch._pending = lambda: _concat_text(group._text() for group in batches)
+        else:
+            batch._fronts, batch._front_ends, batch._backs, batch._back_ends = _concat_text(
+                group._text() for group in batches
+            )
+        return batch
+
+    def _text(self) -> _Text:
+        """Get the text columns, working them out first if the batch is deferred."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._fronts, self._front_ends, self._backs, self._back_ends = pending()
+        return self._fronts, self._front_ends, self._backs, self._back_ends
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CardBatch": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, "CardBatch"]:
+        if isinstance(index, slice):
+            return CardBatch.of(self[position] for position in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CardBatch index out of range")
+        fronts, front_ends, backs, back_ends = self._text()
+        front_start = front_ends[index - 1] if index else 0
+        back_start = back_ends[index - 1] if index else 0
+        return Card(
+            front=fronts[front_start:front_ends[index]],
+            back=backs[back_start:back_ends[index]],
+            card_id=self._ids[index] or None,
+        )
+
+    def __iter__(self) -> Iterator[Card]:
+        fronts, front_ends, backs, back_ends = self._text()
+        front_start = back_start = 0
+        for card_id, front_end, back_end in zip(self._ids, front_ends, back_ends):
+            yield Card(front=fronts[front_start:front_end], back=backs[back_start:back_end], card_id=card_id or None)
+            front_start, back_start = front_end, back_end
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CardBatch):
+            return self._ids == other._ids and self._text() == other._text()
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Any) -> "CardBatch":
+        if not isinstance(other, (CardBatch, list, tuple)):
+            return NotImplemented
+        return CardBatch.concat((self, other))
+
+    def __radd__(self, other: Any) -> "CardBatch":
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return CardBatch.concat((other, self))
+
+    def __repr__(self) -> str:
+        if self._pending is not None:
+            return f"CardBatch(<{len(self)} deferred cards>)"
+        return f"CardBatch({list(self)!r})"
+
+
+def _id_array(card_ids: Sequence[Optional[int]]) -> array:
+    """Pack card IDs into an array."""
+    return array("q", [_NO_ID if card_id is None else card_id for card_id in card_ids])
+
+
+def _join_text(fronts: Sequence[str], backs: Sequence[str], count: int) -> _Text:
+    """Pack fronts and backs into text columns.
+
+    Raises:
+        ValueError: If there isn't a front and a back for every card
+    """
+    if not len(fronts) == len(backs) == count:
+        raise ValueError(f"Columns have different lengths: {len(fronts)} fronts, {len(backs)} backs, {count} IDs")
+    return (
+        "".join(fronts), array("q", accumulate(map(len, fronts))),
+        "".join(backs), array("q", accumulate(map(len, backs))),
+    )
+
+
+def _concat_text(texts: Iterable[_Text]) -> _Text:
+    """Join the text columns of several batches."""
+    front_parts: List[str] = []
+    back_parts: List[str] = []
+    front_ends, back_ends = array("q"), array("q")
+    front_length = back_length = 0
+    for fronts, group_front_ends, backs, group_back_ends in texts:
+        front_parts.append(fronts)
+        back_parts.append(backs)
+        front_ends.extend(end + front_length for end in group_front_ends)
+        back_ends.extend(end + back_length for end in group_back_ends)
+        front_length += len(fronts)
+        back_length += len(backs)
+    return "".join(front_parts), front_ends, "".join(back_parts), back_ends
@@ -3,9 +3,11 @@ Card entity representing a single Anki flashcard.
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Card:
     """Represents a single Anki flashcard."""
     front: str
-    back: str 
\ No newline at end of file
+    back: str
+    card_id: Optional[int] = None 
\ No newline at end of file
@@ -3,16 +3,19 @@ Deck entity representing a collection of cards.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import Sequence
 from .card import Card
 
 @dataclass
 class DeckCards:
-    """Represents a deck and its cards due for review."""
+    """Represents a deck and its cards due for review.
+
+    The cards are lists or, as the mappers build them, compact CardBatch columns.
+    """
     deck_name: str
-    new_cards: List[Card]
-    learning_cards: List[Card]
-    review_cards: List[Card]
+    new_cards: Sequence[Card]
+    learning_cards: Sequence[Card]
+    review_cards: Sequence[Card]
 
     @property
     def total_cards(self) -> int:
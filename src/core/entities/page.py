@@ -0,0 +1,14 @@
+"""
+Page entity representing one page of cards walked in card ID order.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from .deck import DeckCards
+
+@dataclass
+class CardPage:
+    """A page of cards from one deck, with the token to continue after it."""
+    deck: DeckCards
+    # Opaque token continuing after this page, None on the last page
+    cursor: Optional[str] = None
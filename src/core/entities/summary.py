@@ -0,0 +1,34 @@
+"""
+Summary entities holding card counts for today's review.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class DeckSummary:
+    """Represents the number of cards due today in a deck.
+
+    Like `anki today`, which lists Anki's `is:due` cards, it counts learning
+    and review cards. New cards are never due in that sense.
+    """
+    deck_name: str
+    learning_count: int
+    review_count: int
+
+    @property
+    def total_cards(self) -> int:
+        """Get the total number of cards due in the deck."""
+        return self.learning_count + self.review_count
+
+
+@dataclass
+class TodaySummary:
+    """Represents the number of cards due today across all decks."""
+    decks: List[DeckSummary]
+
+    @property
+    def total_cards(self) -> int:
+        """Get the total number of cards due across all decks."""
+        return sum(deck.total_cards for deck in self.decks)
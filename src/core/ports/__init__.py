@@ -1,6 +1,6 @@
 """Core domain interfaces."""
 
-from .repositories import CardRepository
+from .repositories import AsyncCardRepository, CardRepository
 from .presenter import ReviewPresenter
 
-__all__ = ['CardRepository', 'ReviewPresenter'] 
\ No newline at end of file
+__all__ = ['AsyncCardRepository', 'CardRepository', 'ReviewPresenter'] 
\ No newline at end of file
@@ -1,11 +1,23 @@
 """Port interface for presenting review data."""
 
-from typing import Dict, Any
-from ..entities import TodayReview
+from typing import Dict, Any, Iterable
+from ..entities import DeckCards, TodayReview, TodaySummary
 
 class ReviewPresenter:
     """Interface for presenting review information."""
 
     def present(self, review: TodayReview) -> Dict[str, Any]:
         """Present the review data in a format suitable for display."""
-        pass 
\ No newline at end of file
+        pass
+
+    def present_summary(self, summary: TodaySummary) -> None:
+        """Present the number of cards due per deck."""
+        pass
+
+    def present_stream(self, decks: Iterable[DeckCards]) -> None:
+        """Present decks as they arrive, with totals at the end.
+
+        Presenters should override this to render incrementally. The default
+        collects every deck and presents them at once.
+        """
+        self.present(TodayReview(list(decks)))
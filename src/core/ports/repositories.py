@@ -1,8 +1,8 @@
 """Repository interfaces for the core domain."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
-from ..entities import TodayReview
+from typing import Iterator, Optional
+from ..entities import CardPage, DeckCards, DeckSummary, TodayReview, TodaySummary
 
 
 class CardRepository(ABC):
@@ -24,7 +24,15 @@ class CardRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all_cards(self, limit: int = 20, offset: int = 0, deck_name: Optional[str] = None, random: bool = False) -> TodayReview:
+    def get_all_cards(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck_name: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> TodayReview:
         """Get all cards, optionally filtered by deck.
 
         Args:
@@ -32,8 +40,119 @@ class CardRepository(ABC):
             offset: Number of cards to skip
             deck_name: Optional deck name to filter by
             random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
 
         Returns:
             A TodayReview entity containing the cards
         """
-        pass 
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_card_pages(
+        self, deck_name: Optional[str] = None, page_size: int = 500, cursor: Optional[str] = None
+    ) -> Iterator[CardPage]:
+        """Walk all cards page by page, deck by deck in name order and in card ID order within a deck.
+
+        Only one page of card details is held at a time. Each page carries a
+        cursor that resumes the walk right after it.
+
+        Args:
+            deck_name: Optional deck name to filter by
+            page_size: Maximum number of cards per page
+            cursor: Token of a page to continue after, None to start at the beginning
+
+        Yields:
+            CardPage for every page of cards
+
+        Raises:
+            ValueError: If the cursor is not valid
+            RuntimeError: If there's an error accessing the data
+        """
+        pass
+
+    def iter_today_review(self, deck_name: Optional[str] = None) -> Iterator[DeckCards]:
+        """Get today's review cards one deck at a time.
+
+        Implementations should override this to yield each deck as soon as it
+        is fetched. The default yields the decks of the full review.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Yields:
+            DeckCards for every deck that has cards due today
+
+        Raises:
+            RuntimeError: If there's an error accessing the data
+        """
+        yield from self.get_today_review(deck_name=deck_name).decks
+
+    def get_today_summary(self, deck_name: Optional[str] = None) -> TodaySummary:
+        """Get the number of cards due today per deck.
+
+        Implementations should override this to count cards without loading
+        their contents. The default falls back to the full review.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Returns:
+            TodaySummary entity containing card counts grouped by deck
+
+        Raises:
+            RuntimeError: If there's an error accessing the data
+        """
+        review = self.get_today_review(deck_name=deck_name)
+        return TodaySummary([
+            DeckSummary(
+                deck_name=deck.deck_name,
+                learning_count=len(deck.learning_cards),
+                review_count=len(deck.review_cards),
+            )
+            for deck in review.decks
+        ])
+
+
+class AsyncCardRepository(ABC):
+    """Asyncio interface for accessing card data."""
+
+    @abstractmethod
+    async def get_today_review(self, deck_name: Optional[str] = None) -> TodayReview:
+        """Get today's review cards.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Returns:
+            TodayReview entity containing cards grouped by deck
+
+        Raises:
+            RuntimeError: If there's an error accessing the data
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_cards(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck_name: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> TodayReview:
+        """Get all cards, optionally filtered by deck.
+
+        Args:
+            limit: Maximum number of cards per deck to fetch
+            offset: Number of cards to skip
+            deck_name: Optional deck name to filter by
+            random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
+
+        Returns:
+            A TodayReview entity containing the cards
+        """
+        pass
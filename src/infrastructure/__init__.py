@@ -1,7 +1,30 @@
-"""Infrastructure layer for the Anki Today application."""
+"""Infrastructure layer for the Anki Today application.
 
-from .persistence.anki_connect.client import AnkiConnectClient
-from .persistence.anki_connect.repository import AnkiConnectCardRepository
-from .presentation.console import ConsolePresenter
+Exports are imported on first access, so importing one submodule doesn't
+load the HTTP stack, the collection reader and the presenters with it.
+"""
 
-__all__ = ["AnkiConnectClient", "AnkiConnectCardRepository", "ConsolePresenter"] 
\ No newline at end of file
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "AnkiConnectClient": ".persistence.anki_connect.client",
+    "AnkiConnectCardRepository": ".persistence.anki_connect.repository",
+    "AnkiConnectTransport": ".persistence.anki_connect.transport",
+    "CollectionCardRepository": ".persistence.collection.repository",
+    "ConsolePresenter": ".presentation.console",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+"""Background daemon serving CLI commands over a Unix domain socket.
+
+`client` only uses the standard library so that the CLI can talk to a
+running daemon without importing the container.
+"""
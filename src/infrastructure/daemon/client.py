@@ -0,0 +1,91 @@
+"""Client side of the daemon protocol.
+
+A request is a single JSON object followed by a newline. The daemon answers
+with a single JSON object and closes the connection:
+
+    {"command": "today", "params": {...}, "options": {...}}
+    {"status": "ok", "output": "..."}
+
+`status` is "ok", "error" (with an `error` message) or "unsupported" when
+the daemon was started with different global options than the client uses.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, Optional
+
+
+def default_socket_path() -> str:
+    """Get the default location of the daemon socket.
+
+    `$ANKI_CLI_SOCKET` takes precedence, then `$XDG_RUNTIME_DIR`, then the
+    user's cache directory.
+    """
+    if os.environ.get("ANKI_CLI_SOCKET"):
+        return os.environ["ANKI_CLI_SOCKET"]
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "anki-cli", "daemon.sock")
+
+
+class DaemonClient:
+    """Sends commands to a running `anki serve` daemon."""
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 60.0):
+        """Initialize the client.
+
+        Args:
+            path: Path of the daemon socket, the default location if not given
+            timeout: Seconds to wait for the daemon to answer
+        """
+        self.path = path or default_socket_path()
+        self.timeout = timeout
+
+    def request(self, command: str, params: Dict[str, Any], options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a command to the daemon.
+
+        Args:
+            command: Name of the CLI command
+            params: The command's parameters
+            options: The global CLI options
+
+        Returns:
+            The daemon's response, or None if no daemon is listening
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        payload = json.dumps({"command": command, "params": params, "options": options}).encode("utf-8") + b"\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(self.timeout)
+                connection.connect(self.path)
+                connection.sendall(payload)
+                connection.shutdown(socket.SHUT_WR)
+                chunks = []
+                while True:
+                    chunk = connection.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # A socket file left behind by a daemon that is no longer running
+            return None
+
+        try:
+            return json.loads(b"".join(chunks))
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Invalid response from the daemon: {str(e)}")
+
+    def is_running(self) -> bool:
+        """Check whether a daemon is listening on the socket."""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.connect(self.path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,126 @@
+"""Server side of the daemon protocol, see `client` for the wire format."""
+
+import contextlib
+import io
+import json
+import os
+import socketserver
+from typing import Any, Callable, Dict, Optional
+
+from .client import DaemonClient, default_socket_path
+
+# Runs a CLI command against the daemon's container, writing to standard output
+CommandHandler = Callable[..., None]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one request, runs it and writes the response."""
+
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line.strip():
+            # A liveness probe connects and closes without a request
+            return
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"status": "error", "error": f"Invalid request: {str(e)}"}
+        else:
+            response = self.server.daemon.handle(request)
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, daemon: "AnkiDaemon"):
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class AnkiDaemon:
+    """Keeps a container, its pooled connections and its caches alive between CLI calls.
+
+    Requests are handled one at a time. Each command writes to standard
+    output, which is captured for the duration of the request and sent back
+    to the client as plain text.
+    """
+
+    def __init__(
+        self,
+        container: Any,
+        options: Dict[str, Any],
+        commands: Dict[str, CommandHandler],
+        path: Optional[str] = None,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            container: The container commands run against
+            options: The global CLI options the container was configured with
+            commands: Handlers by command name, called with the container and the request parameters
+            path: Path of the socket to listen on, the default location if not given
+        """
+        self.container = container
+        self.options = self._comparable(options)
+        self.commands = commands
+        self.path = path or default_socket_path()
+        self._server: Optional[_UnixServer] = None
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request.
+
+        Args:
+            request: The decoded request
+
+        Returns:
+            The response to send back
+        """
+        options = request.get("options") or {}
+        if self._comparable(options) != self.options:
+            return {"status": "unsupported"}
+
+        handler = self.commands.get(request.get("command"))
+        if handler is None:
+            return {"status": "unsupported"}
+
+        output = io.StringIO()
+        try:
+            output_format = (options.get("output") or {}).get("format", "console")
+            self.container.config.output.format.from_value(output_format)
+            with contextlib.redirect_stdout(output):
+                handler(self.container, **(request.get("params") or {}))
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+        return {"status": "ok", "output": output.getvalue()}
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until shut down.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        if DaemonClient(self.path).is_running():
+            raise RuntimeError(f"A daemon is already listening on {self.path}")
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self._server = _UnixServer(self.path, self)
+        os.chmod(self.path, 0o600)
+        try:
+            self._server.serve_forever(poll_interval=0.1)
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def shutdown(self) -> None:
+        """Stop serving, called from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    @staticmethod
+    def _comparable(options: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop the options that may differ between requests."""
+        return {key: value for key, value in options.items() if key not in ("output", "daemon", "profile")}
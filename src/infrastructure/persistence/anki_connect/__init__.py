@@ -3,5 +3,21 @@
 from .repository import AnkiConnectCardRepository
 from .client import AnkiConnectClient
 from .mapper import AnkiCardMapper
+from .chunking import AdaptiveChunker
+from .async_client import AsyncAnkiConnectClient
+from .async_repository import AsyncAnkiConnectCardRepository
+from .planner import QueryPlan, TodayQueryPlanner
+from .transport import AnkiConnectTransport, TransportStats
 
-__all__ = ['AnkiConnectCardRepository', 'AnkiConnectClient', 'AnkiCardMapper'] 
\ No newline at end of file
+__all__ = [
+    'AdaptiveChunker',
+    'AsyncAnkiConnectCardRepository',
+    'AsyncAnkiConnectClient',
+    'AnkiConnectCardRepository',
+    'AnkiConnectClient',
+    'AnkiCardMapper',
+    'AnkiConnectTransport',
+    'QueryPlan',
+    'TodayQueryPlanner',
+    'TransportStats',
+] 
\ No newline at end of file
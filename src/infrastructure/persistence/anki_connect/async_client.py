@@ -0,0 +1,151 @@
+"""Asyncio client for interacting with the AnkiConnect API."""
+
+import asyncio
+import json
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.infrastructure import profiling
+from .async_transport import AsyncAnkiConnectTransport, AsyncTransportError
+from .chunking import AdaptiveChunker
+
+
+class AsyncAnkiConnectClient:
+    """Asyncio client for making requests to the AnkiConnect API."""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8765",
+        transport: Optional[AsyncAnkiConnectTransport] = None,
+        chunker: Optional[AdaptiveChunker] = None,
+        max_workers: int = 4,
+    ):
+        """Initialize the client.
+
+        Args:
+            base_url: Base URL for the AnkiConnect API
+            transport: Pooled asyncio HTTP transport, a default one is created if not given
+            chunker: Chunk sizing for large cardsInfo requests
+            max_workers: Maximum number of cardsInfo chunks fetched concurrently
+        """
+        self.base_url = base_url
+        self.transport = transport or AsyncAnkiConnectTransport()
+        self.chunker = chunker or AdaptiveChunker()
+        self.max_workers = max(1, max_workers)
+
+    async def _make_request(self, action: str, params: Dict[str, Any] = None) -> Optional[Any]:
+        """Make a request to the AnkiConnect API.
+
+        Args:
+            action: The action to perform
+            params: Parameters for the action
+
+        Returns:
+            Response data if successful, None otherwise
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        result, _ = await self._send(action, params)
+        return result
+
+    async def _send(self, action: str, params: Dict[str, Any] = None) -> Tuple[Optional[Any], int]:
+        """Make a request to the AnkiConnect API and measure its response.
+
+        Args:
+            action: The action to perform
+            params: Parameters for the action
+
+        Returns:
+            Tuple of the response data and the response size in bytes
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if params is None:
+            params = {}
+
+        request_data = {
+            "action": action,
+            "version": 6,
+            "params": params
+        }
+
+        try:
+            with profiling.span(f"anki_connect.{action}") as span:
+                content = await self.transport.post(self.base_url, request_data)
+                with profiling.span("anki_connect.json_decode"):
+                    result = json.loads(content)
+                if span.recording:
+                    span.set(request_bytes=len(json.dumps(request_data)), response_bytes=len(content))
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, AsyncTransportError) as e:
+            raise RuntimeError(f"Failed to communicate with Anki: {str(e) or type(e).__name__}")
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Invalid response from Anki: {str(e)}")
+
+        if result.get("error") is not None:
+            raise RuntimeError(f"AnkiConnect error: {result['error']}")
+
+        return result.get("result"), len(content)
+
+    async def get_deck_names(self) -> List[str]:
+        """Get all available deck names.
+
+        Returns:
+            List of deck names
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        return await self._make_request("deckNames")
+
+    async def find_cards(self, query: str) -> List[int]:
+        """Find cards matching a query.
+
+        Args:
+            query: The search query
+
+        Returns:
+            List of card IDs
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        return await self._make_request("findCards", {"query": query})
+
+    async def get_cards_info(self, card_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get detailed information about cards.
+
+        Lists longer than the current chunk size are fetched in chunks, at most
+        `max_workers` at a time, and reassembled in order.
+
+        Args:
+            card_ids: List of card IDs to get info for
+
+        Returns:
+            List of card information dictionaries
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        size = self.chunker.size
+        if len(card_ids) <= size:
+            return await self._fetch_cards_info_chunk(card_ids)
+
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(chunk: List[int]) -> List[Dict[str, Any]]:
+            async with limit:
+                return await self._fetch_cards_info_chunk(chunk)
+
+        chunks = await asyncio.gather(*(
+            fetch(card_ids[start:start + size]) for start in range(0, len(card_ids), size)
+        ))
+        return [card for chunk in chunks for card in chunk]
+
+    async def _fetch_cards_info_chunk(self, card_ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch one chunk of card information and feed its cost to the chunker."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        cards, response_bytes = await self._send("cardsInfo", {"cards": card_ids})
+        self.chunker.record(len(card_ids), loop.time() - started, response_bytes)
+        return cards or []
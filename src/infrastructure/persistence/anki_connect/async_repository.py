@@ -0,0 +1,116 @@
+"""Asyncio repository implementation using AnkiConnect."""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+from src.core.ports import AsyncCardRepository
+from src.core.entities import DeckCards, TodayReview
+from src.infrastructure import profiling
+from src.infrastructure.persistence.sampling import CardSampler
+from .async_client import AsyncAnkiConnectClient
+from .mapper import AnkiCardMapper
+from .repository import AnkiConnectCardRepository
+
+
+class AsyncAnkiConnectCardRepository(AsyncCardRepository):
+    """Repository for retrieving cards from Anki using AnkiConnect on asyncio.
+
+    Per-deck work runs concurrently, bounded by a semaphore.
+    """
+
+    def __init__(self, client: AsyncAnkiConnectClient, mapper: AnkiCardMapper, max_concurrency: int = 8):
+        """Initialize the repository.
+
+        Args:
+            client: Asyncio AnkiConnect client for making requests
+            mapper: Mapper for converting AnkiConnect data to domain entities
+            max_concurrency: Maximum number of decks fetched at the same time
+        """
+        self._client = client
+        self._mapper = mapper
+        self._max_concurrency = max(1, max_concurrency)
+
+    @profiling.timed("repository.get_today_review")
+    async def get_today_review(self, deck_name: Optional[str] = None) -> TodayReview:
+        """Get today's review cards.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Returns:
+            TodayReview containing the decks and their cards
+        """
+        deck_names = await self._deck_names(deck_name)
+        decks = await self._fan_out(deck_names, lambda name: f'deck:"{name}" is:due')
+        return TodayReview(decks)
+
+    @profiling.timed("repository.get_all_cards")
+    async def get_all_cards(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck_name: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> TodayReview:
+        """Get all cards, optionally filtered by deck.
+
+        Args:
+            limit: Maximum number of cards per deck to fetch
+            offset: Number of cards to skip
+            deck_name: Optional deck name to filter by
+            random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
+
+        Returns:
+            A TodayReview entity containing the cards
+
+        Raises:
+            ValueError: If the weight is not known
+            RuntimeError: If there's an error communicating with Anki
+        """
+        sampler = CardSampler(random=random, seed=seed, weight=weight)
+
+        async def select(name: str, card_ids: List[int]) -> List[int]:
+            searches = sampler.searches(f'deck:"{name}"')
+            matches = await asyncio.gather(*(self._client.find_cards(search) for search in searches))
+            return sampler.select(card_ids, limit, offset, salt=name, weights=sampler.tier_weights(matches))
+
+        deck_names = await self._deck_names(deck_name)
+        decks = await self._fan_out(deck_names, lambda name: f'deck:"{name}"', select)
+        return TodayReview(decks=decks)
+
+    async def _deck_names(self, deck_name: Optional[str]) -> List[str]:
+        """Get the decks to query, either the given one or all main decks."""
+        if deck_name:
+            return [deck_name]
+        return AnkiConnectCardRepository._filter_main_decks(await self._client.get_deck_names())
+
+    async def _fan_out(
+        self,
+        deck_names: List[str],
+        query: Callable[[str], str],
+        select: Optional[Callable[[str, List[int]], Awaitable[List[int]]]] = None,
+    ) -> List[DeckCards]:
+        """Fetch and map every deck concurrently, keeping the order of `deck_names`."""
+        limit = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(name: str) -> Optional[DeckCards]:
+            async with limit:
+                card_ids = await self._client.find_cards(query(name))
+                if card_ids and select is not None:
+                    card_ids = await select(name, card_ids)
+                if not card_ids:
+                    return None
+
+                cards = await self._client.get_cards_info(card_ids)
+                if not cards:
+                    return None
+
+            deck_cards = self._mapper.to_deck_cards(name, cards)
+            return deck_cards if deck_cards.total_cards > 0 else None
+
+        results = await asyncio.gather(*(fetch(name) for name in deck_names))
+        return [deck for deck in results if deck is not None]
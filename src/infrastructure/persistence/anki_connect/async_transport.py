@@ -0,0 +1,211 @@
+"""Asyncio HTTP transport for talking to the AnkiConnect API."""
+
+import asyncio
+import json
+import ssl
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .transport import ConnectionStats, TransportStats
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Where a connection goes: scheme, host and port
+_Address = Tuple[str, str, int]
+
+
+class AsyncTransportError(Exception):
+    """Raised when AnkiConnect answers with an HTTP error or a malformed response."""
+
+
+class _Connection:
+    """An open keep-alive connection and its usage counters."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, stats: ConnectionStats):
+        self.reader = reader
+        self.writer = writer
+        self.stats = stats
+        self.loop = asyncio.get_running_loop()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncAnkiConnectTransport:
+    """HTTP/1.1 transport on asyncio streams with a keep-alive connection pool.
+
+    AnkiConnect only ever receives small JSON POST requests from this client,
+    so a minimal HTTP/1.1 implementation on top of asyncio streams is enough.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 60.0,
+        keep_alive: bool = True,
+    ):
+        """Initialize the transport.
+
+        Args:
+            pool_size: Maximum number of connections kept open to AnkiConnect
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for AnkiConnect to send a response
+            keep_alive: Whether connections are kept open between requests
+        """
+        self.pool_size = max(1, pool_size)
+        self.timeout = (connect_timeout, read_timeout)
+        self.keep_alive = keep_alive
+        self._idle: Dict[_Address, List[_Connection]] = {}
+        self._requests = 0
+        self._connections: List[ConnectionStats] = []
+        self._limits: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    async def post(self, url: str, payload: Dict[str, Any]) -> bytes:
+        """Send a JSON payload over a pooled connection.
+
+        Args:
+            url: The URL to post to
+            payload: JSON-serializable request body
+
+        Returns:
+            The response body
+
+        Raises:
+            OSError: If the connection fails
+            asyncio.TimeoutError: If AnkiConnect doesn't answer in time
+            AsyncTransportError: If AnkiConnect answers with an HTTP error
+            ValueError: If the URL isn't an http or https one
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in _DEFAULT_PORTS:
+            raise ValueError(f"Unsupported URL scheme {parts.scheme!r} in {url}, use http or https")
+        address = (parts.scheme, parts.hostname or "localhost", parts.port or _DEFAULT_PORTS[parts.scheme])
+        path = parts.path or "/"
+        body = json.dumps(payload).encode("utf-8")
+
+        async with self._limit():
+            connection = self._take_idle(address)
+            if connection is not None:
+                try:
+                    return await self._exchange(connection, address, path, body)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The server closed the idle connection, retry on a fresh one
+                    connection.close()
+
+            connection = await self._connect(address)
+            return await self._exchange(connection, address, path, body)
+
+    def stats(self) -> TransportStats:
+        """Get the connection reuse statistics collected so far.
+
+        Returns:
+            A snapshot of the request and per-connection counters
+        """
+        connections = [
+            ConnectionStats(connection_id=stats.connection_id, requests=stats.requests)
+            for stats in self._connections
+        ]
+        return TransportStats(requests=self._requests, connections=connections)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+    def _limit(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding open connections on the running loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._limits:
+            self._limits = {loop: asyncio.Semaphore(self.pool_size)}
+        return self._limits[loop]
+
+    def _take_idle(self, address: _Address) -> Optional[_Connection]:
+        """Take an idle connection opened on the running loop, if there is one."""
+        loop = asyncio.get_running_loop()
+        idle = self._idle.get(address, [])
+        while idle:
+            connection = idle.pop()
+            if connection.loop is loop and not connection.writer.is_closing():
+                return connection
+            connection.close()
+        return None
+
+    async def _connect(self, address: _Address) -> _Connection:
+        """Open a new connection, over TLS for https."""
+        scheme, host, port = address
+        context = ssl.create_default_context() if scheme == "https" else None
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port, ssl=context), self.timeout[0])
+        stats = ConnectionStats(connection_id=len(self._connections) + 1)
+        self._connections.append(stats)
+        return _Connection(reader, writer, stats)
+
+    async def _exchange(self, connection: _Connection, address: _Address, path: str, body: bytes) -> bytes:
+        """Send one request and read its response, returning the connection to the pool."""
+        _, host, port = address
+        head = (
+            f"POST {path} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if self.keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        connection.writer.write(head.encode("ascii") + body)
+        await connection.writer.drain()
+
+        status, headers, content, reusable = await asyncio.wait_for(
+            self._read_response(connection.reader), self.timeout[1]
+        )
+        self._requests += 1
+        connection.stats.requests += 1
+
+        if reusable and self.keep_alive:
+            self._idle.setdefault(address, []).append(connection)
+        else:
+            connection.close()
+
+        if status >= 400:
+            raise AsyncTransportError(f"{status} error from {host}:{port}")
+        return content
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Read a status line, headers and body from the stream."""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by AnkiConnect")
+        try:
+            version, status, _ = (status_line.decode("latin-1").rstrip("\r\n") + " ").split(" ", 2)
+            status_code = int(status)
+        except ValueError:
+            raise AsyncTransportError(f"Malformed status line: {status_line!r}")
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection_header = headers.get("connection", "").lower()
+        reusable = connection_header != "close" and (version == "HTTP/1.1" or connection_header == "keep-alive")
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            return status_code, headers, b"".join(chunks), reusable
+
+        if "content-length" in headers:
+            return status_code, headers, await reader.readexactly(int(headers["content-length"])), reusable
+
+        return status_code, headers, await reader.read(), False
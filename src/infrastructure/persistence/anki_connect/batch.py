@@ -0,0 +1,140 @@
+"""Batching of AnkiConnect actions into a single `multi` request."""
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AnkiConnectClient
+
+
+class PendingResult:
+    """Result of an action queued in a batch, available once the batch is sent."""
+
+    def __init__(self, action: str):
+        """Initialize the pending result.
+
+        Args:
+            action: The name of the queued action
+        """
+        self.action = action
+        self._done = False
+        self._result: Any = None
+        self._error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the batch holding this action has been sent."""
+        return self._done
+
+    def result(self) -> Any:
+        """Get the result of the action.
+
+        Returns:
+            The result AnkiConnect returned for this action
+
+        Raises:
+            RuntimeError: If the batch was not sent yet or the action failed
+        """
+        if not self._done:
+            raise RuntimeError(f"Batch containing '{self.action}' has not been sent yet")
+        if self._error is not None:
+            raise RuntimeError(f"AnkiConnect error: {self._error}")
+        return self._result
+
+    def _resolve(self, response: Any) -> None:
+        """Store the response AnkiConnect returned for this action."""
+        self._done = True
+        if isinstance(response, dict) and "error" in response:
+            self._error = response.get("error")
+            self._result = response.get("result")
+        else:
+            self._result = response
+
+
+class AnkiConnectBatch:
+    """Collects actions and sends them to AnkiConnect as one `multi` request.
+
+    Can be used as a context manager, in which case the batch is sent on exit:
+
+        with client.batch() as batch:
+            decks = batch.get_deck_names()
+            cards = batch.find_cards("is:due")
+        print(decks.result(), cards.result())
+    """
+
+    def __init__(self, client: "AnkiConnectClient"):
+        """Initialize the batch.
+
+        Args:
+            client: Client used to send the `multi` request
+        """
+        self._client = client
+        self._actions: List[Dict[str, Any]] = []
+        self._pending: List[PendingResult] = []
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __enter__(self) -> "AnkiConnectBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.send()
+
+    def add(self, action: str, params: Optional[Dict[str, Any]] = None) -> PendingResult:
+        """Queue an action.
+
+        Args:
+            action: The action to perform
+            params: Parameters for the action
+
+        Returns:
+            Placeholder that holds the action's result once the batch is sent
+        """
+        self._actions.append({"action": action, "version": 6, "params": params or {}})
+        pending = PendingResult(action)
+        self._pending.append(pending)
+        return pending
+
+    def get_deck_names(self) -> PendingResult:
+        """Queue a `deckNames` action."""
+        return self.add("deckNames")
+
+    def find_cards(self, query: str) -> PendingResult:
+        """Queue a `findCards` action."""
+        return self.add("findCards", {"query": query})
+
+    def get_cards_info(self, card_ids: List[int]) -> PendingResult:
+        """Queue a `cardsInfo` action."""
+        return self.add("cardsInfo", {"cards": card_ids})
+
+    def get_cards_mod_time(self, card_ids: List[int]) -> PendingResult:
+        """Queue a `cardsModTime` action."""
+        return self.add("cardsModTime", {"cards": card_ids})
+
+    def get_deck_stats(self, deck_names: List[str]) -> PendingResult:
+        """Queue a `getDeckStats` action."""
+        return self.add("getDeckStats", {"decks": deck_names})
+
+    def send(self) -> List[PendingResult]:
+        """Send all queued actions in one round trip.
+
+        Returns:
+            The pending results, in the order the actions were queued
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        actions, pending = self._actions, self._pending
+        self._actions, self._pending = [], []
+        if not actions:
+            return pending
+
+        responses = self._client.multi(actions) or []
+        if len(responses) != len(actions):
+            raise RuntimeError(
+                f"Invalid response from Anki: expected {len(actions)} results, got {len(responses)}"
+            )
+        for placeholder, response in zip(pending, responses):
+            placeholder._resolve(response)
+        return pending
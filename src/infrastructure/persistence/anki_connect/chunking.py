@@ -0,0 +1,75 @@
+"""Adaptive sizing of chunked AnkiConnect requests."""
+
+import threading
+from typing import Optional
+
+
+class AdaptiveChunker:
+    """Picks a chunk size from the measured per-card latency and response size.
+
+    Every completed chunk updates a moving average of the time and bytes a
+    single card costs. The next chunk is sized so that it takes about
+    `target_latency` seconds and stays under `max_response_bytes`.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 500,
+        min_size: int = 50,
+        max_size: int = 5000,
+        target_latency: float = 0.5,
+        max_response_bytes: int = 4 * 1024 * 1024,
+        smoothing: float = 0.3,
+    ):
+        """Initialize the chunker.
+
+        Args:
+            initial_size: Chunk size used before anything has been measured
+            min_size: Smallest chunk size to use
+            max_size: Largest chunk size to use
+            target_latency: Seconds a single chunk request should take
+            max_response_bytes: Largest response a single chunk request should produce
+            smoothing: Weight of the newest measurement in the moving averages
+        """
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_response_bytes = max_response_bytes
+        self.smoothing = smoothing
+        self._size = max(min_size, min(initial_size, max_size))
+        self._seconds_per_card: Optional[float] = None
+        self._bytes_per_card: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Get the chunk size to use for the next request."""
+        return self._size
+
+    def record(self, cards: int, seconds: float, response_bytes: int) -> None:
+        """Record the cost of a completed chunk and resize the following ones.
+
+        Args:
+            cards: Number of cards in the chunk
+            seconds: Time the request took
+            response_bytes: Size of the response body
+        """
+        if cards <= 0:
+            return
+
+        with self._lock:
+            self._seconds_per_card = self._average(self._seconds_per_card, seconds / cards)
+            self._bytes_per_card = self._average(self._bytes_per_card, response_bytes / cards)
+
+            limits = [self.max_size]
+            if self._seconds_per_card > 0:
+                limits.append(int(self.target_latency / self._seconds_per_card))
+            if self._bytes_per_card > 0:
+                limits.append(int(self.max_response_bytes / self._bytes_per_card))
+            self._size = max(self.min_size, min(limits))
+
+    def _average(self, current: Optional[float], sample: float) -> float:
+        """Fold a new sample into an exponential moving average."""
+        if current is None:
+            return sample
+        return (1 - self.smoothing) * current + self.smoothing * sample
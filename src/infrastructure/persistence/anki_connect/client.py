@@ -1,20 +1,52 @@
 """Client for interacting with the AnkiConnect API."""
 
 import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+
+from src.infrastructure import profiling
+from .batch import AnkiConnectBatch
+from .chunking import AdaptiveChunker
+from .memo import ResponseMemo
+from .transport import AnkiConnectTransport
+
+
+def _count_items(params: Dict[str, Any], result: Any) -> int:
+    """Count the cards, notes or actions a request was about, for profiling."""
+    for key in ("cards", "notes", "actions"):
+        if isinstance(params.get(key), list):
+            return len(params[key])
+    return len(result) if isinstance(result, list) else 0
 
 
 class AnkiConnectClient:
     """Client for making requests to the AnkiConnect API."""
 
-    def __init__(self, base_url: str = "http://localhost:8765"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8765",
+        transport: Optional[AnkiConnectTransport] = None,
+        chunker: Optional[AdaptiveChunker] = None,
+        max_workers: int = 4,
+        memo: Optional[ResponseMemo] = None,
+    ):
         """Initialize the client.
         
         Args:
             base_url: Base URL for the AnkiConnect API
+            transport: Pooled HTTP transport, a default one is created if not given
+            chunker: Chunk sizing for large cardsInfo requests
+            max_workers: Maximum number of cardsInfo chunks fetched concurrently
+            memo: Memo answering repeated read requests without sending them
         """
         self.base_url = base_url
+        self.transport = transport or AnkiConnectTransport()
+        self.chunker = chunker or AdaptiveChunker()
+        self.max_workers = max(1, max_workers)
+        self.memo = memo
 
     def _make_request(self, action: str, params: Dict[str, Any] = None) -> Optional[Any]:
         """Make a request to the AnkiConnect API.
@@ -26,11 +58,35 @@ class AnkiConnectClient:
         Returns:
             Response data if successful, None otherwise
             
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        result, _ = self._send(action, params)
+        return result
+
+    def _send(self, action: str, params: Dict[str, Any] = None) -> Tuple[Optional[Any], int]:
+        """Make a request to the AnkiConnect API and measure its response.
+
+        Repeated read requests are answered from the memo when there is one.
+
+        Args:
+            action: The action to perform
+            params: Parameters for the action
+
+        Returns:
+            Tuple of the response data and the response size in bytes
+
         Raises:
             RuntimeError: If there's an error communicating with Anki
         """
         if params is None:
             params = {}
+        if self.memo is not None:
+            return self.memo.call(action, params, lambda: self._post(action, params))
+        return self._post(action, params)
+
+    def _post(self, action: str, params: Dict[str, Any]) -> Tuple[Optional[Any], int]:
+        """Send a request to the AnkiConnect API, bypassing the memo."""
 
         request_data = {
             "action": action,
@@ -39,14 +95,22 @@ class AnkiConnectClient:
         }
 
         try:
-            response = requests.post(self.base_url, json=request_data)
-            response.raise_for_status()
-            result = response.json()
-            
-            if result.get("error") is not None:
-                raise RuntimeError(f"AnkiConnect error: {result['error']}")
-                
-            return result.get("result")
+            with profiling.span(f"anki_connect.{action}") as span:
+                response = self.transport.post(self.base_url, request_data)
+                response.raise_for_status()
+                with profiling.span("anki_connect.json_decode"):
+                    result = response.json()
+
+                if result.get("error") is not None:
+                    raise RuntimeError(f"AnkiConnect error: {result['error']}")
+
+                if span.recording:
+                    span.set(
+                        request_bytes=len(json.dumps(request_data)),
+                        response_bytes=len(response.content),
+                        items=_count_items(params, result.get("result")),
+                    )
+                return result.get("result"), len(response.content)
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to communicate with Anki: {str(e)}")
@@ -81,6 +145,8 @@ class AnkiConnectClient:
     def get_cards_info(self, card_ids: List[int]) -> List[Dict[str, Any]]:
         """Get detailed information about cards.
         
+        Large ID lists are fetched in chunks, see `iter_cards_info`.
+
         Args:
             card_ids: List of card IDs to get info for
             
@@ -90,4 +156,165 @@ class AnkiConnectClient:
         Raises:
             RuntimeError: If there's an error communicating with Anki
         """
-        return self._make_request("cardsInfo", {"cards": card_ids}) 
\ No newline at end of file
+        return [card for chunk in self.iter_cards_info(card_ids) for card in chunk]
+
+    def iter_cards_info(self, card_ids: List[int]) -> Iterator[List[Dict[str, Any]]]:
+        """Get detailed information about cards, one chunk at a time.
+
+        Lists longer than the current chunk size are split into chunks that are
+        fetched concurrently, at most `max_workers` at a time. Chunks are yielded
+        in the order of `card_ids`, each as soon as it and all chunks before it
+        have arrived, while later chunks are still in flight.
+
+        Args:
+            card_ids: List of card IDs to get info for
+
+        Yields:
+            Lists of card information dictionaries
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if len(card_ids) <= self.chunker.size:
+            yield self._fetch_cards_info_chunk(card_ids)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = deque()
+            position = 0
+
+            def submit_next() -> None:
+                nonlocal position
+                chunk = card_ids[position:position + self.chunker.size]
+                position += len(chunk)
+                in_flight.append(executor.submit(self._fetch_cards_info_chunk, chunk))
+
+            while position < len(card_ids) and len(in_flight) < self.max_workers:
+                submit_next()
+
+            try:
+                while in_flight:
+                    cards = in_flight.popleft().result()
+                    if position < len(card_ids):
+                        submit_next()
+                    yield cards
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _fetch_cards_info_chunk(self, card_ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch one chunk of card information and feed its cost to the chunker."""
+        started = time.perf_counter()
+        cards, response_bytes = self._send("cardsInfo", {"cards": card_ids})
+        self.chunker.record(len(card_ids), time.perf_counter() - started, response_bytes)
+        return cards or []
+
+    def get_cards_mod_time(self, card_ids: List[int]) -> List[Dict[str, int]]:
+        """Get the modification time of cards.
+
+        Much cheaper than `cardsInfo`, so it is used to tell which cards changed.
+
+        Args:
+            card_ids: List of card IDs to get modification times for
+
+        Returns:
+            List of dictionaries with "cardId" and "mod" keys
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if not card_ids:
+            return []
+        return self._make_request("cardsModTime", {"cards": card_ids})
+
+    def get_deck_stats(self, deck_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get due counts and card totals of decks.
+
+        Args:
+            deck_names: Names of the decks
+
+        Returns:
+            Statistics by deck ID, each with "name", "new_count", "learn_count",
+            "review_count" and "total_in_deck" keys. The total does not include
+            sub-decks.
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if not deck_names:
+            return {}
+        return self._make_request("getDeckStats", {"decks": deck_names}) or {}
+
+    def multi(self, actions: List[Dict[str, Any]]) -> List[Any]:
+        """Perform several actions in a single request.
+
+        With a memo, only the actions it can't answer are sent.
+
+        Args:
+            actions: Actions to perform, each with "action", "version" and "params" keys
+
+        Returns:
+            One response per action, in order
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if self.memo is not None:
+            return self.memo.call_many(actions, lambda missing: self._post("multi", {"actions": missing})[0] or [])
+        return self._make_request("multi", {"actions": actions})
+
+    def batch(self) -> AnkiConnectBatch:
+        """Start a batch of actions that is sent as one `multi` request.
+
+        Returns:
+            An empty batch bound to this client
+        """
+        return AnkiConnectBatch(self)
+
+    def find_cards_many(self, queries: List[str]) -> List[List[int]]:
+        """Find cards for several queries in one round trip.
+
+        Args:
+            queries: The search queries
+
+        Returns:
+            List of card IDs for each query, in order
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if not queries:
+            return []
+        with self.batch() as batch:
+            pending = [batch.find_cards(query) for query in queries]
+        return [result.result() or [] for result in pending]
+
+    def get_cards_info_many(self, card_id_lists: List[List[int]]) -> List[List[Dict[str, Any]]]:
+        """Get detailed information about several groups of cards in one round trip.
+
+        When the groups together exceed the current chunk size, the cards are
+        fetched in concurrent chunks instead and split back into their groups.
+
+        Args:
+            card_id_lists: Groups of card IDs to get info for
+
+        Returns:
+            List of card information dictionaries for each group, in order
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if not card_id_lists:
+            return []
+
+        if sum(len(card_ids) for card_ids in card_id_lists) > self.chunker.size:
+            cards = self.get_cards_info([card_id for card_ids in card_id_lists for card_id in card_ids])
+            groups, position = [], 0
+            for card_ids in card_id_lists:
+                groups.append(cards[position:position + len(card_ids)])
+                position += len(card_ids)
+            return groups
+
+        with self.batch() as batch:
+            pending = [batch.get_cards_info(card_ids) for card_ids in card_id_lists]
+        return [result.result() or [] for result in pending]
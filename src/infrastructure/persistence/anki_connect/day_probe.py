@@ -0,0 +1,46 @@
+"""Finding Anki's day number over AnkiConnect."""
+
+from typing import Optional
+
+from .client import AnkiConnectClient
+
+
+class DueDayProbe:
+    """Finds today's day number from a review card due a known number of days from today.
+
+    AnkiConnect doesn't tell when the collection was created, but `prop:due=N`
+    matches review cards due N days from today, so the due day of any card it
+    finds minus N is today's number. Every offset is searched in one batched
+    request, then a few cards of the nearest one are fetched.
+    """
+
+    def __init__(self, client: AnkiConnectClient, max_days: int = 7, sample_size: int = 5):
+        """Initialize the probe.
+
+        Args:
+            client: AnkiConnect client to search with
+            max_days: Furthest offset from today to search, in either direction
+            sample_size: Number of found cards to fetch, so cards in filtered decks can be skipped
+        """
+        self._client = client
+        self._offsets = sorted(range(-max_days, max_days + 1), key=abs)
+        self._sample_size = sample_size
+
+    def __call__(self) -> Optional[int]:
+        """Find today's day number.
+
+        Returns:
+            The day number, None if no review card is due within `max_days` of today
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        found = self._client.find_cards_many([f"prop:due={offset}" for offset in self._offsets])
+        for offset, card_ids in zip(self._offsets, found):
+            if not card_ids:
+                continue
+            for card in self._client.get_cards_info(card_ids[:self._sample_size]):
+                # Cards in filtered decks keep their own due day aside in odue
+                if card.get("queue") in (2, 3) and not card.get("odue"):
+                    return card["due"] - offset
+        return None
@@ -0,0 +1,115 @@
+"""Extracting the front and back of a card from its note's fields."""
+
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+# Field pairs tried for the front and back, in order
+DEFAULT_PAIRS = (("Polish word", "Word translation"), ("Front", "Back"))
+
+Extractor = Callable[[Mapping[str, Any]], Tuple[str, str]]
+
+
+class FieldExtractors:
+    """Tells the front and back of cards, with one extractor compiled per note model.
+
+    Which fields hold the front and back depends only on the note model, so it
+    is worked out once per model, from the field names and order that come
+    with the first card of that model, into an extractor that just indexes
+    the card's fields. A model's front and back are, in order of preference:
+
+    - the fields given for it in `models`
+    - the first of `pairs` whose fields both have a value, or the last pair
+      the model has if none do
+    - the model's first and second field
+    """
+
+    def __init__(
+        self,
+        pairs: Sequence[Sequence[str]] = DEFAULT_PAIRS,
+        models: Optional[Mapping[str, Mapping[str, str]]] = None,
+    ):
+        """Initialize the extractors.
+
+        Args:
+            pairs: Front and back field names tried for every model
+            models: Front and back field names of particular models, e.g.
+                `{"Cloze": {"front": "Text", "back": "Back Extra"}}`
+        """
+        self._pairs = [(front, back) for front, back in pairs]
+        self._models = {name: (rule.get("front"), rule.get("back")) for name, rule in (models or {}).items()}
+        # Keyed by model name, or by field names for cards that don't tell their model
+        self._compiled: Dict[Hashable, Extractor] = {}
+
+    def extract(self, card: Mapping[str, Any]) -> Tuple[str, str]:
+        """Get the front and back of a card.
+
+        Args:
+            card: Card data from AnkiConnect
+
+        Returns:
+            The front and back, empty strings for fields the card doesn't have
+        """
+        return self.extract_fields(card.get("modelName"), card.get("fields"))
+
+    def extract_fields(self, model: Optional[str], fields: Optional[Mapping[str, Any]]) -> Tuple[str, str]:
+        """Get the front and back from a note's fields.
+
+        Args:
+            model: Name of the note model, None if not known
+            fields: The card's `fields` from AnkiConnect
+
+        Returns:
+            The front and back, empty strings for fields the note doesn't have
+        """
+        if not fields:
+            return "", ""
+        key = model if model is not None else tuple(fields)
+        extractor = self._compiled.get(key)
+        if extractor is None:
+            extractor = self._compiled[key] = self._compile(model, fields)
+        try:
+            return extractor(fields)
+        except KeyError:
+            # The model's fields were renamed since it was compiled
+            extractor = self._compiled[key] = self._compile(model, fields)
+            return extractor(fields)
+
+    def _compile(self, model: Optional[str], fields: Mapping[str, Any]) -> Extractor:
+        """Build the extractor of a model from the fields of one of its cards."""
+        front, back = self._models.get(model, (None, None)) if model is not None else (None, None)
+        if front is not None or back is not None:
+            return _pair_extractor(front if front in fields else None, back if back in fields else None)
+
+        present = [(front, back) for front, back in self._pairs if front in fields and back in fields]
+        if len(present) == 1:
+            return _pair_extractor(*present[0])
+        if present:
+            return _pairs_extractor(present)
+
+        names = sorted(fields, key=lambda name: fields[name].get("order", 0))
+        return _pair_extractor(names[0] if names else None, names[1] if len(names) > 1 else None)
+
+
+def _pair_extractor(front: Optional[str], back: Optional[str]) -> Extractor:
+    """Build an extractor reading two fields, or an empty string for a missing one."""
+    if front is not None and back is not None:
+        return lambda fields: (fields[front]["value"], fields[back]["value"])
+    if front is not None:
+        return lambda fields: (fields[front]["value"], "")
+    if back is not None:
+        return lambda fields: ("", fields[back]["value"])
+    return lambda fields: ("", "")
+
+
+def _pairs_extractor(pairs: Sequence[Tuple[str, str]]) -> Extractor:
+    """Build an extractor taking the first pair with both values, or else the last pair."""
+    *preferred, (last_front, last_back) = pairs
+
+    def extract(fields: Mapping[str, Any]) -> Tuple[str, str]:
+        for front, back in preferred:
+            front_value = fields[front]["value"]
+            back_value = fields[back]["value"]
+            if front_value and back_value:
+                return front_value, back_value
+        return fields[last_front]["value"], fields[last_back]["value"]
+
+    return extract
@@ -1,15 +1,59 @@
 """Mapper for converting AnkiConnect data to domain entities."""
 
-import time
-from datetime import datetime, timezone
-from typing import List, Dict, Any
+from array import array
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
-from src.core.entities import DeckCards, Card
+from src.core.entities import DeckCards, CardBatch
+from src.infrastructure import profiling
+from src.infrastructure.persistence.clock import SchedulerClock
+from .fields import FieldExtractors
+
+# Codes `classify` gives each card, indexes into CARD_TYPES
+NOT_DUE, NEW, LEARNING, REVIEW = 0, 1, 2, 3
+CARD_TYPES = (None, "new", "learning", "review")
+
+# Below this many cards, importing NumPy costs more than it saves
+_NUMPY_MIN_CARDS = 50_000
+_numpy: Any = None
+
+
+def _import_numpy() -> Any:
+    """Import NumPy on first use, returning False if it isn't installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - depends on the environment
+            numpy = False
+        _numpy = numpy
+    return _numpy
 
 
 class AnkiCardMapper:
     """Maps AnkiConnect data to domain entities."""
 
+    def __init__(
+        self,
+        clock: Optional[SchedulerClock] = None,
+        fields: Optional[FieldExtractors] = None,
+        lazy_fields: bool = True,
+    ):
+        """Initialize the mapper.
+
+        Args:
+            clock: Tells the current time and Anki's day number, which decide
+                whether learning and review cards are due
+            fields: Tells which of a note model's fields are the front and back
+            lazy_fields: Whether to work out the fronts and backs of a group of
+                cards only when one of them is first read. Until then the
+                group holds on to its cards' `fields`, but nothing else of the
+                AnkiConnect data.
+        """
+        self._clock = clock or SchedulerClock()
+        self._fields = fields or FieldExtractors()
+        self._lazy_fields = lazy_fields
+
+    @profiling.timed("mapper.to_deck_cards")
     def to_deck_cards(self, deck_name: str, cards: List[Dict[str, Any]]) -> DeckCards:
         """Convert AnkiConnect card data to a DeckCards entity.
 
@@ -20,42 +64,96 @@ class AnkiCardMapper:
         Returns:
             A DeckCards entity containing the card information.
         """
-        new_cards = []
-        learning_cards = []
-        review_cards = []
-
-        for card in cards:
-            card_type = self._get_card_type(card)
-            if not card_type:  # Skip cards that aren't due today
+        # ID, note model and fields columns of each card type
+        columns: Dict[int, Tuple[List[Optional[int]], List[Optional[str]], List[Any]]] = {
+            NEW: ([], [], []), LEARNING: ([], [], []), REVIEW: ([], [], [])
+        }
+        for card, code in zip(cards, self.classify(cards)):
+            if code == NOT_DUE:  # Skip cards that aren't due today
                 continue
-                
-            # Try Polish-English specific field names first
-            front = self._get_field_value(card, "Polish word")
-            back = self._get_field_value(card, "Word translation")
-            
-            # If Polish-English fields are empty, try standard field names
-            if not front or not back:
-                front = self._get_field_value(card, "Front")
-                back = self._get_field_value(card, "Back")
-            
-            card_entity = Card(front=front, back=back)
-
-            if card_type == "new":
-                new_cards.append(card_entity)
-            elif card_type == "learning":
-                learning_cards.append(card_entity)
-            elif card_type == "review":
-                review_cards.append(card_entity)
+
+            card_ids, models, fields = columns[code]
+            card_ids.append(card.get("cardId"))
+            models.append(card.get("modelName"))
+            fields.append(card.get("fields"))
 
         return DeckCards(
             deck_name=deck_name,
-            new_cards=new_cards,
-            learning_cards=learning_cards,
-            review_cards=review_cards
+            new_cards=self._to_batch(*columns[NEW]),
+            learning_cards=self._to_batch(*columns[LEARNING]),
+            review_cards=self._to_batch(*columns[REVIEW])
         )
 
-    @staticmethod
-    def _get_card_type(card: Dict[str, Any]) -> str | None:
+    def _to_batch(self, card_ids: List[Optional[int]], models: List[Optional[str]], fields: List[Any]) -> CardBatch:
+        """Build a batch of cards, deferring their fronts and backs if fields are lazy."""
+        if not card_ids:
+            return CardBatch()
+        if self._lazy_fields:
+            return CardBatch.deferred(card_ids, lambda: self._resolve_fields(models, fields))
+        return CardBatch(*self._resolve_fields(models, fields), card_ids)
+
+    @profiling.timed("mapper.resolve_fields")
+    def _resolve_fields(self, models: List[Optional[str]], fields: List[Any]) -> Tuple[List[str], List[str]]:
+        """Get the fronts and backs of cards from their note models and fields."""
+        extract = self._fields.extract_fields
+        fronts, backs = [], []
+        for model, card_fields in zip(models, fields):
+            front, back = extract(model, card_fields)
+            fronts.append(front)
+            backs.append(back)
+        return fronts, backs
+
+    def classify(self, cards: Sequence[Dict[str, Any]], backend: str = "auto") -> array:
+        """Classify a batch of cards the way `_get_card_type` classifies one.
+
+        Queue, due and original due are pulled out of every card into columns
+        once, the clock is read once, and every card is then classified with
+        a few comparisons over the columns.
+
+        Args:
+            cards: Card data from AnkiConnect.
+            backend: "numpy", "array" or "auto", which uses NumPy for large
+                batches when it is installed.
+
+        Returns:
+            One code per card, NOT_DUE, NEW, LEARNING or REVIEW.
+
+        Raises:
+            ValueError: If the backend is unknown or NumPy was requested but isn't installed.
+        """
+        if backend not in ("auto", "numpy", "array"):
+            raise ValueError(f"Unknown classifier backend: {backend}")
+        # Learning cards are due at a timestamp, day learning and review cards on a day number
+        now_ms = self._clock.now_ms()
+        today = self._clock.today()
+
+        queues = [card.get("queue", -1) for card in cards]
+        dues = [card.get("due", 0) for card in cards]
+        odues = [card.get("odue", 0) for card in cards]
+
+        numpy = _import_numpy() if backend == "numpy" or (backend == "auto" and len(cards) >= _NUMPY_MIN_CARDS) else None
+        if backend == "numpy" and not numpy:
+            raise ValueError("The numpy classifier was requested but NumPy is not installed")
+        if numpy:
+            queue = numpy.array(queues, dtype=numpy.int64)
+            due = numpy.array(dues, dtype=numpy.int64)
+            odue = numpy.array(odues, dtype=numpy.int64)
+            codes = numpy.zeros(len(cards), dtype=numpy.int8)
+            codes[queue == 0] = NEW
+            codes[((queue == 1) & (due <= now_ms)) | ((queue == 3) & (due <= today))] = LEARNING
+            codes[(queue == 2) & (numpy.where(odue > 0, odue, due) <= today)] = REVIEW
+            return array("b", codes.tobytes())
+
+        return array("b", [
+            (LEARNING if due <= now_ms else NOT_DUE) if queue == 1
+            else (LEARNING if due <= today else NOT_DUE) if queue == 3
+            else NEW if queue == 0
+            else (REVIEW if (odue if odue > 0 else due) <= today else NOT_DUE) if queue == 2
+            else NOT_DUE
+            for queue, due, odue in zip(queues, dues, odues)
+        ])
+
+    def _get_card_type(self, card: Dict[str, Any]) -> str | None:
         """Determine the type of card based on its queue and type fields.
         Only returns a type for cards that are due today or in learning.
 
@@ -66,32 +164,33 @@ class AnkiCardMapper:
             The type of card as a string: "new", "learning", or "review", or None if not due today.
         """
         queue = card.get("queue", -1)
-        card_type = card.get("type", 0)
         due = card.get("due", 0)
         odue = card.get("odue", 0)  # Original due date
 
-        # Learning cards (queue=1 or queue=3 for learning cards in review)
-        # For learning cards, due is a Unix timestamp in milliseconds
-        if queue in (1, 3):
-            current_timestamp = int(time.time() * 1000)  # Current timestamp in milliseconds
+        # Learning cards (queue=1), due is a Unix timestamp
+        if queue == 1:
             # Only show learning cards that are due now or in the past
-            if due <= current_timestamp:
+            if due <= self._clock.now_ms():
                 return "learning"
             return None
-            
+
+        # Learning cards with steps of a day or more (queue=3), due is a day number
+        if queue == 3:
+            if due <= self._clock.today():
+                return "learning"
+            return None
+
         # New cards due today (queue=0)
         if queue == 0:
             return "new"
-            
+
         # For review cards, the due field is the day number when the card is due
         # relative to the collection creation date
         if queue == 2:
-            # Get today's day number
-            today = int(datetime.now(timezone.utc).timestamp() / 86400)
             target_due = odue if odue > 0 else due
-            if target_due <= today:
+            if target_due <= self._clock.today():
                 return "review"
-            
+
         return None
 
     @staticmethod
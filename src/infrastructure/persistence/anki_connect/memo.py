@@ -0,0 +1,304 @@
+"""In-process memoization of AnkiConnect read actions."""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.infrastructure import profiling
+
+# Seconds each read action is remembered for. Anki itself may change cards at
+# any time, so answers that depend on reviews are only kept briefly.
+DEFAULT_TTLS: Dict[str, float] = {
+    "deckNames": 10.0,
+    "findCards": 2.0,
+    "cardsModTime": 1.0,
+    "getDeckStats": 2.0,
+    "modelNames": 300.0,
+    "modelFieldNames": 300.0,
+}
+
+# Actions that never change the collection. Any other action clears the memo.
+READ_ACTIONS = frozenset({
+    "version", "deckNames", "deckNamesAndIds", "getDeckConfig", "getDeckStats",
+    "findCards", "findNotes", "cardsInfo", "cardsModTime", "cardsToNotes", "notesInfo",
+    "areDue", "areSuspended", "getIntervals", "getEaseFactors", "getTags",
+    "modelNames", "modelNamesAndIds", "modelFieldNames",
+})
+
+
+@dataclass
+class MemoStats:
+    """Counters of a response memo."""
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the share of lookups answered without a request of their own."""
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class _ActionError(RuntimeError):
+    """An action of a `multi` request failed, shared with callers waiting for it."""
+
+    def __init__(self, error: str):
+        super().__init__(f"AnkiConnect error: {error}")
+        self.error = error
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires: float
+
+
+class ResponseMemo:
+    """Remembers AnkiConnect answers for identical read requests.
+
+    Answers are keyed on the action and its parameters and kept for a
+    per-action time to live, with the least recently used ones evicted once
+    `max_entries` or `max_bytes` is exceeded. A request that is identical to
+    one still in flight waits for that one's answer instead of being sent
+    again. Any action that is not a known read clears the memo.
+
+    Callers get their own copy of every answer, so changing a returned list
+    doesn't change what later callers see.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 8 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the memo.
+
+        Args:
+            ttls: Seconds each action is remembered for, actions not listed are never remembered
+            max_entries: Maximum number of remembered answers
+            max_bytes: Maximum total size of remembered answers, as encoded JSON
+            clock: Source of the current time in seconds
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        # Bumped by every invalidation, answers fetched across one are not kept
+        self._generation = 0
+        self._stats = MemoStats()
+
+    def stats(self) -> MemoStats:
+        """Get the counters collected so far.
+
+        Returns:
+            A snapshot of the counters
+        """
+        with self._lock:
+            return MemoStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                coalesced=self._stats.coalesced,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def invalidate(self) -> None:
+        """Forget every remembered answer."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+            self._stats.invalidations += 1
+
+    def call(self, action: str, params: Dict[str, Any], fetch: Callable[[], Tuple[Any, int]]) -> Tuple[Any, int]:
+        """Answer one action from the memo, or fetch and remember it.
+
+        Args:
+            action: The AnkiConnect action
+            params: Its parameters
+            fetch: Sends the request, returning the result and the response size in bytes
+
+        Returns:
+            The result and the response size in bytes
+        """
+        if action not in READ_ACTIONS:
+            try:
+                return fetch()
+            finally:
+                self.invalidate()
+        if action not in self.ttls:
+            return fetch()
+
+        with profiling.span("anki_connect.memo") as span:
+            key = self._key(action, params)
+            state, found, generation = self._claim(key)
+            if state == "hit":
+                span.set(hits=1)
+                return self._copy(found.value), found.size
+            if state == "wait":
+                span.set(coalesced=1)
+                value, size = found.result()
+                return self._copy(value), size
+
+            span.set(misses=1)
+            try:
+                value, size = fetch()
+            except BaseException as e:
+                self._fail(key, found, e)
+                raise
+            self._resolve(key, found, action, value, size, generation)
+            return self._copy(value), size
+
+    def call_many(self, actions: List[Dict[str, Any]], fetch_many: Callable[[List[Dict[str, Any]]], List[Any]]) -> List[Any]:
+        """Answer the actions of a `multi` request, sending only the ones not remembered.
+
+        Args:
+            actions: Actions with "action" and "params" keys
+            fetch_many: Sends a `multi` request for the given actions, returning one response per action
+
+        Returns:
+            One response per action, in order
+        """
+        if any(action.get("action") not in READ_ACTIONS for action in actions):
+            try:
+                return fetch_many(actions)
+            finally:
+                self.invalidate()
+
+        responses: List[Any] = [None] * len(actions)
+        waiting: List[Tuple[int, Future]] = []
+        claimed: List[Tuple[int, str, Future, int]] = []
+        with profiling.span("anki_connect.memo") as span:
+            for index, action in enumerate(actions):
+                name, params = action.get("action"), action.get("params") or {}
+                if name not in self.ttls:
+                    claimed.append((index, "", None, 0))
+                    continue
+                key = self._key(name, params)
+                state, found, generation = self._claim(key)
+                if state == "hit":
+                    responses[index] = self._copy(found.value)
+                elif state == "wait":
+                    waiting.append((index, found))
+                else:
+                    claimed.append((index, key, found, generation))
+            misses = sum(1 for _, _, future, _ in claimed if future is not None)
+            span.set(hits=len(actions) - len(waiting) - len(claimed), coalesced=len(waiting), misses=misses)
+
+            if claimed:
+                try:
+                    fetched = fetch_many([actions[index] for index, _, _, _ in claimed])
+                except BaseException as e:
+                    for _, key, future, _ in claimed:
+                        if future is not None:
+                            self._fail(key, future, e)
+                    raise
+                for (index, key, future, generation), response in zip(claimed, fetched):
+                    responses[index] = response
+                    if future is None:
+                        continue
+                    if isinstance(response, dict) and "error" in response:
+                        if response["error"] is not None:
+                            # Errors are not remembered, later callers try again
+                            self._fail(key, future, _ActionError(response["error"]))
+                            continue
+                        response = response.get("result")
+                    self._resolve(key, future, actions[index]["action"], response, self._size(response), generation)
+                    responses[index] = self._copy(response)
+
+            for index, future in waiting:
+                try:
+                    responses[index] = self._copy(future.result()[0])
+                except _ActionError as e:
+                    responses[index] = {"result": None, "error": e.error}
+                except RuntimeError as e:
+                    responses[index] = {"result": None, "error": str(e)}
+        return responses
+
+    def _claim(self, key: str) -> Tuple[str, Any, int]:
+        """Look up a key, claiming it for fetching if nobody else is.
+
+        Returns:
+            "hit" with the entry, "wait" with the in-flight future, or "fetch"
+            with a new future the caller must resolve, plus the current generation
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > self._clock():
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return "hit", entry, self._generation
+            if entry is not None:
+                self._drop(key)
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats.coalesced += 1
+                return "wait", future, self._generation
+
+            future = Future()
+            self._in_flight[key] = future
+            self._stats.misses += 1
+            return "fetch", future, self._generation
+
+    def _resolve(self, key: str, future: Future, action: str, value: Any, size: int, generation: int) -> None:
+        """Remember a fetched answer and hand it to callers waiting for it."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if generation == self._generation and size <= self.max_bytes:
+                self._entries[key] = _Entry(value, size, self._clock() + self.ttls[action])
+                self._bytes += size
+                while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self._stats.evictions += 1
+        future.set_result((value, size))
+
+    def _fail(self, key: str, future: Future, error: BaseException) -> None:
+        """Pass a failed fetch on to callers waiting for it."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+        future.set_exception(error)
+
+    def _drop(self, key: str) -> None:
+        """Forget one answer. The lock must be held."""
+        self._bytes -= self._entries.pop(key).size
+
+    @staticmethod
+    def _key(action: str, params: Dict[str, Any]) -> str:
+        return action + ":" + json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+    @staticmethod
+    def _size(value: Any) -> int:
+        """Estimate the encoded size of an answer."""
+        if isinstance(value, list) and all(isinstance(item, int) for item in value):
+            # Card IDs are 13 digits plus a comma
+            return 14 * len(value) + 2
+        return len(json.dumps(value))
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """Copy an answer so callers can't change the remembered one."""
+        if isinstance(value, list) and all(isinstance(item, (int, str)) for item in value):
+            return list(value)
+        if isinstance(value, (list, dict)):
+            return copy.deepcopy(value)
+        return value
@@ -0,0 +1,46 @@
+"""Query planning for fetching today's review cards."""
+
+from enum import Enum
+from typing import Optional
+
+
+class QueryPlan(Enum):
+    """Strategies for finding today's due cards."""
+
+    # One `deck:"X" is:due` query per top-level deck, batched into one request
+    PER_DECK = "per_deck"
+    # One `is:due` query across the collection, cards grouped by deckName locally
+    GLOBAL = "global"
+
+
+class TodayQueryPlanner:
+    """Chooses how to query AnkiConnect for today's review cards."""
+
+    def __init__(self, min_decks_for_global: int = 20, sparse_cards_per_deck: int = 5):
+        """Initialize the planner.
+
+        Args:
+            min_decks_for_global: Deck count from which the global query is always used
+            sparse_cards_per_deck: Expected due cards per deck below which most per-deck
+                queries would come back empty, so the global query is used instead
+        """
+        self.min_decks_for_global = min_decks_for_global
+        self.sparse_cards_per_deck = sparse_cards_per_deck
+
+    def plan(self, deck_count: int, expected_cards: Optional[int] = None) -> QueryPlan:
+        """Choose a query plan.
+
+        Args:
+            deck_count: Number of top-level decks that would be queried
+            expected_cards: Number of due cards expected, if known from a previous run
+
+        Returns:
+            The plan to use
+        """
+        if deck_count <= 1:
+            return QueryPlan.PER_DECK
+        if deck_count >= self.min_decks_for_global:
+            return QueryPlan.GLOBAL
+        if expected_cards is not None and expected_cards < deck_count * self.sparse_cards_per_deck:
+            return QueryPlan.GLOBAL
+        return QueryPlan.PER_DECK
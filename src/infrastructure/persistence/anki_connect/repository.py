@@ -1,27 +1,55 @@
 """Repository implementation using AnkiConnect."""
 
-from typing import List, Optional
-import random as random_module
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from src.core.ports import CardRepository
-from src.core.entities import DeckCards, TodayReview
+from src.core.entities import CardBatch, CardPage, DeckCards, DeckSummary, TodayReview, TodaySummary
+from src.infrastructure import profiling
+from src.infrastructure.persistence.cursor import decode_cursor, encode_cursor
+from src.infrastructure.persistence.sampling import CardSampler
 from .client import AnkiConnectClient
 from .mapper import AnkiCardMapper
+from .planner import QueryPlan, TodayQueryPlanner
+
+if TYPE_CHECKING:
+    from src.infrastructure.persistence.cache import CardSync
 
 
 class AnkiConnectCardRepository(CardRepository):
     """Repository for retrieving cards from Anki using AnkiConnect."""
 
-    def __init__(self, client: AnkiConnectClient, mapper: AnkiCardMapper):
+    def __init__(
+        self,
+        client: AnkiConnectClient,
+        mapper: AnkiCardMapper,
+        planner: Optional[TodayQueryPlanner] = None,
+        sync: Optional["CardSync"] = None,
+    ):
         """Initialize the repository.
         
         Args:
             client: AnkiConnect client for making requests
             mapper: Mapper for converting AnkiConnect data to domain entities
+            planner: Planner choosing how today's cards are queried
+            sync: Local mirror of looked up cards, card details are read from it
+                and only downloaded when they changed
         """
         self._client = client
         self._mapper = mapper
+        self._planner = planner or TodayQueryPlanner()
+        self._sync = sync
+        self._last_due_count: Optional[int] = None
+
+    def _card_source(self) -> Any:
+        """Get what card details are read from, dropping deleted cards from the mirror first if there is one."""
+        if self._sync is None:
+            return self._client
+        self._sync.sync()
+        return self._sync
 
+    @profiling.timed("repository.get_today_review")
     def get_today_review(self, deck_name: Optional[str] = None) -> TodayReview:
         """Get today's review cards.
         
@@ -37,74 +65,278 @@ class AnkiConnectCardRepository(CardRepository):
             all_deck_names = self._client.get_deck_names()
             deck_names = self._filter_main_decks(all_deck_names)
 
-        decks = []
-        for name in deck_names:
-            # Only get cards from the main deck that are due today
-            query = f'deck:"{name}" is:due'  # Exact match for deck name and due today
-            card_ids = self._client.find_cards(query)
-            
-            if not card_ids:
-                continue
-                
-            cards = self._client.get_cards_info(card_ids)
-            
-            if not cards:
-                continue
-                
-            deck_cards = self._mapper.to_deck_cards(name, cards)
-            
-            if deck_cards.total_cards > 0:
-                decks.append(deck_cards)
+        plan = self._planner.plan(len(deck_names), self._last_due_count)
+        if plan is QueryPlan.GLOBAL:
+            return TodayReview(self._fetch_due_decks_globally())
+
+        # Only get cards from the main deck that are due today
+        queries = [f'deck:"{name}" is:due' for name in deck_names]
+        card_ids_per_deck = self._client.find_cards_many(queries) if queries else []
+        self._last_due_count = sum(len(card_ids) for card_ids in card_ids_per_deck)
+
+        return TodayReview(self._fetch_decks(deck_names, card_ids_per_deck))
+
+    def iter_today_review(self, deck_name: Optional[str] = None) -> Iterator[DeckCards]:
+        """Get today's review cards one deck at a time.
+
+        The due card IDs of every deck are found in one batched request. Card
+        details are then fetched deck by deck on a background thread, one deck
+        ahead, so fetching deck N+1 overlaps with mapping and presenting deck N.
+
+        Args:
+            deck_name: Optional deck name to filter by
 
-        return TodayReview(decks)
+        Yields:
+            DeckCards for every deck that has cards due today
 
-    def get_all_cards(self, limit: int = 20, offset: int = 0, deck_name: Optional[str] = None, random: bool = False) -> TodayReview:
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if deck_name:
+            deck_names = [deck_name]
+        else:
+            deck_names = self._filter_main_decks(self._client.get_deck_names())
+
+        queries = [f'deck:"{name}" is:due' for name in deck_names]
+        card_ids_per_deck = self._client.find_cards_many(queries) if queries else []
+        wanted = [(name, card_ids) for name, card_ids in zip(deck_names, card_ids_per_deck) if card_ids]
+        if not wanted:
+            return
+
+        source = self._card_source()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(source.get_cards_info, wanted[0][1])
+            for index, (name, _) in enumerate(wanted):
+                with profiling.span("repository.wait_cards_info"):
+                    cards = pending.result()
+                if index + 1 < len(wanted):
+                    pending = executor.submit(source.get_cards_info, wanted[index + 1][1])
+                if not cards:
+                    continue
+
+                deck_cards = self._mapper.to_deck_cards(name, cards)
+                if deck_cards.total_cards > 0:
+                    yield deck_cards
+
+    @profiling.timed("repository.get_all_cards")
+    def get_all_cards(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck_name: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> TodayReview:
         """Get all cards, optionally filtered by deck.
 
+        Random picks never shuffle a whole deck, see CardSampler. With a
+        weight, each weight tier is found with one more search per deck,
+        sent in the same batched request as the decks' own searches.
+
         Args:
             limit: Maximum number of cards per deck to fetch
             offset: Number of cards to skip
             deck_name: Optional deck name to filter by
             random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
 
         Returns:
             A TodayReview entity containing the cards
 
         Raises:
+            ValueError: If the weight is not known
             RuntimeError: If there's an error communicating with Anki
         """
+        sampler = CardSampler(random=random, seed=seed, weight=weight)
         if deck_name:
             deck_names = [deck_name]
         else:
             deck_names = self._client.get_deck_names()
             deck_names = self._filter_main_decks(deck_names)
 
-        decks = []
-        for name in deck_names:
-            # Find all cards in the deck
-            card_ids = self._client.find_cards(f'deck:"{name}"')
-            if not card_ids:
-                continue
+        queries = [f'deck:"{name}"' for name in deck_names]
+        tier_queries = [search for query in queries for search in sampler.searches(query)]
+        found = self._client.find_cards_many(queries + tier_queries) if queries else []
+        card_ids_per_deck, matches = found[:len(queries)], found[len(queries):]
+        tiers = len(tier_queries) // max(len(queries), 1)
 
-            # Randomize if requested
-            if random:
-                random_module.shuffle(card_ids)
+        selected_ids = []
+        for index, (name, card_ids) in enumerate(zip(deck_names, card_ids_per_deck)):
+            weights = sampler.tier_weights(matches[index * tiers:(index + 1) * tiers])
+            selected_ids.append(sampler.select(card_ids, limit, offset, salt=name, weights=weights))
 
-            # Apply limit and offset
-            card_ids = card_ids[offset:offset + limit]
-            if not card_ids:
-                continue
+        return TodayReview(decks=self._fetch_decks(deck_names, selected_ids))
 
-            # Get detailed information about the cards
-            cards_info = self._client.get_cards_info(card_ids)
-            if not cards_info:
-                continue
+    def iter_card_pages(
+        self, deck_name: Optional[str] = None, page_size: int = 500, cursor: Optional[str] = None
+    ) -> Iterator[CardPage]:
+        """Walk all cards page by page, deck by deck in name order and in card ID order within a deck.
 
-            deck = self._mapper.to_deck_cards(name, cards_info)
+        AnkiConnect can't search for card IDs above a given one, so each deck's
+        IDs are listed once when the walk reaches it. Card details are then
+        fetched one page at a time, the next page on a background thread while
+        the current one is presented.
+
+        Args:
+            deck_name: Optional deck name to filter by
+            page_size: Maximum number of cards per page
+            cursor: Token of a page to continue after, None to start at the beginning
+
+        Yields:
+            CardPage for every page of cards
+
+        Raises:
+            ValueError: If the cursor is not valid
+            RuntimeError: If there's an error communicating with Anki
+        """
+        start_deck, after = decode_cursor(cursor) if cursor else (None, 0)
+        if deck_name:
+            deck_names = [deck_name]
+        else:
+            deck_names = self._filter_main_decks(self._client.get_deck_names())
+        if start_deck is not None:
+            deck_names = [name for name in deck_names if name >= start_deck]
+
+        # Deck name and card IDs of every page still to fetch, listing one deck at a time
+        def pages() -> Iterator[Tuple[str, List[int]]]:
+            for name in deck_names:
+                card_ids = sorted(self._client.find_cards(f'deck:"{name}"') or [])
+                if name == start_deck:
+                    card_ids = card_ids[bisect.bisect_right(card_ids, after):]
+                for start in range(0, len(card_ids), page_size):
+                    yield name, card_ids[start:start + page_size]
+
+        source = self._card_source()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upcoming = pages()
+            current = next(upcoming, None)
+            pending = executor.submit(source.get_cards_info, current[1]) if current else None
+            while current is not None:
+                with profiling.span("repository.wait_cards_info"):
+                    cards = pending.result()
+                following = next(upcoming, None)
+                if following is not None:
+                    pending = executor.submit(source.get_cards_info, following[1])
+
+                name, card_ids = current
+                yield CardPage(
+                    deck=self._mapper.to_deck_cards(name, cards),
+                    cursor=None if following is None else encode_cursor(name, card_ids[-1]),
+                )
+                current = following
+
+    @profiling.timed("repository.get_today_summary")
+    def get_today_summary(self, deck_name: Optional[str] = None) -> TodaySummary:
+        """Get the number of cards due today per deck without downloading any card.
+
+        Counts are the lengths of the ID lists returned by two findCards queries
+        per deck, all sent in one batched request. Like `get_today_review`,
+        which lists `is:due` cards, new cards are not counted.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Returns:
+            TodaySummary containing card counts grouped by deck
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if deck_name:
+            deck_names = [deck_name]
+        else:
+            deck_names = self._filter_main_decks(self._client.get_deck_names())
+
+        # Same split as the mapper: learning (queue 1 and 3) and review (queue 2)
+        queries = []
+        for name in deck_names:
+            queries.extend([
+                f'deck:"{name}" is:due is:learn',
+                f'deck:"{name}" is:due is:review -is:learn',
+            ])
+        card_ids = self._client.find_cards_many(queries) if queries else []
+
+        decks = []
+        for index, name in enumerate(deck_names):
+            learning_ids, review_ids = card_ids[index * 2:index * 2 + 2]
+            deck = DeckSummary(
+                deck_name=name,
+                learning_count=len(learning_ids),
+                review_count=len(review_ids),
+            )
             if deck.total_cards > 0:
                 decks.append(deck)
 
-        return TodayReview(decks=decks)
+        return TodaySummary(decks)
+
+    @profiling.timed("repository.fetch_decks")
+    def _fetch_decks(self, deck_names: List[str], card_ids_per_deck: List[List[int]]) -> List[DeckCards]:
+        """Fetch card details for every deck in one round trip and map them.
+
+        Args:
+            deck_names: Names of the decks, in the same order as the card IDs
+            card_ids_per_deck: Card IDs to fetch for each deck
+
+        Returns:
+            DeckCards for every deck that has cards
+        """
+        wanted = [(name, card_ids) for name, card_ids in zip(deck_names, card_ids_per_deck) if card_ids]
+        if not wanted:
+            return []
+
+        cards_per_deck = self._card_source().get_cards_info_many([card_ids for _, card_ids in wanted])
+
+        decks = []
+        for (name, _), cards in zip(wanted, cards_per_deck):
+            if not cards:
+                continue
+
+            deck_cards = self._mapper.to_deck_cards(name, cards)
+            if deck_cards.total_cards > 0:
+                decks.append(deck_cards)
+
+        return decks
+
+    @profiling.timed("repository.fetch_due_decks_globally")
+    def _fetch_due_decks_globally(self) -> List[DeckCards]:
+        """Fetch all due cards with one query and group them by top-level deck.
+
+        Returns:
+            DeckCards for every top-level deck that has due cards
+        """
+        card_ids = self._client.find_cards("is:due")
+        self._last_due_count = len(card_ids)
+        if not card_ids:
+            return []
+
+        parts: Dict[str, List[DeckCards]] = {}
+        # Map each chunk as soon as it arrives, while later chunks are in flight
+        for chunk in self._card_source().iter_cards_info(card_ids):
+            cards_by_deck: Dict[str, List[Dict[str, Any]]] = {}
+            for card in chunk:
+                # Roll sub-deck cards up to their top-level deck
+                main_deck = card.get("deckName", "").split("::")[0]
+                cards_by_deck.setdefault(main_deck, []).append(card)
+
+            for name, cards in cards_by_deck.items():
+                parts.setdefault(name, []).append(self._mapper.to_deck_cards(name, cards))
+
+        decks = [self._join_parts(name, parts[name]) for name in sorted(parts)]
+        return [deck for deck in decks if deck.total_cards > 0]
+
+    @staticmethod
+    def _join_parts(deck_name: str, parts: List[DeckCards]) -> DeckCards:
+        """Join the cards of a deck mapped chunk by chunk into one DeckCards."""
+        if len(parts) == 1:
+            return parts[0]
+        return DeckCards(
+            deck_name=deck_name,
+            new_cards=CardBatch.concat(part.new_cards for part in parts),
+            learning_cards=CardBatch.concat(part.learning_cards for part in parts),
+            review_cards=CardBatch.concat(part.review_cards for part in parts)
+        )
 
     @staticmethod
     def _filter_main_decks(deck_names: List[str]) -> List[str]:
@@ -0,0 +1,117 @@
+"""Pooled HTTP transport for talking to the AnkiConnect API."""
+
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class ConnectionStats:
+    """Usage counters for a single pooled connection."""
+    connection_id: int
+    requests: int = 0
+
+    @property
+    def reuses(self) -> int:
+        """Get the number of requests that reused this connection."""
+        return max(self.requests - 1, 0)
+
+
+@dataclass
+class TransportStats:
+    """Snapshot of the transport's connection usage."""
+    requests: int = 0
+    connections: List[ConnectionStats] = field(default_factory=list)
+
+    @property
+    def connections_opened(self) -> int:
+        """Get the number of distinct connections that served requests."""
+        return len(self.connections)
+
+    @property
+    def reused_requests(self) -> int:
+        """Get the number of requests served by an already open connection."""
+        return sum(connection.reuses for connection in self.connections)
+
+
+class AnkiConnectTransport:
+    """HTTP transport backed by a persistent keep-alive connection pool."""
+
+    def __init__(
+        self,
+        pool_size: int = 4,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 60.0,
+        keep_alive: bool = True,
+    ):
+        """Initialize the transport.
+
+        Args:
+            pool_size: Maximum number of connections kept open to AnkiConnect
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for AnkiConnect to send a response
+            keep_alive: Whether connections are kept open between requests
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections: List[ConnectionStats] = []
+        self._by_socket: "weakref.WeakKeyDictionary[Any, ConnectionStats]" = weakref.WeakKeyDictionary()
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+        self._session.hooks["response"].append(self._track_connection)
+
+    def post(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """Send a JSON payload over a pooled connection.
+
+        Args:
+            url: The URL to post to
+            payload: JSON-serializable request body
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        return self._session.post(url, json=payload, timeout=self.timeout)
+
+    def stats(self) -> TransportStats:
+        """Get the connection reuse statistics collected so far.
+
+        Returns:
+            A snapshot of the request and per-connection counters
+        """
+        with self._lock:
+            connections = [
+                ConnectionStats(connection_id=stats.connection_id, requests=stats.requests)
+                for stats in self._connections
+            ]
+            return TransportStats(requests=self._requests, connections=connections)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._session.close()
+
+    def _track_connection(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        """Count the request against the connection that served it."""
+        connection = getattr(response.raw, "connection", None)
+        sock = getattr(connection, "sock", None)
+        with self._lock:
+            self._requests += 1
+            if sock is not None:
+                stats = self._by_socket.get(sock)
+                if stats is None:
+                    stats = ConnectionStats(connection_id=len(self._connections) + 1)
+                    self._connections.append(stats)
+                    self._by_socket[sock] = stats
+                stats.requests += 1
+        return response
@@ -0,0 +1,7 @@
+"""Local caching of AnkiConnect card data."""
+
+from .sqlite_cache import SqliteCardCache, CacheStats
+from .client import CachingAnkiConnectClient
+from .sync import CardSync, SyncStats
+
+__all__ = ['SqliteCardCache', 'CacheStats', 'CachingAnkiConnectClient', 'CardSync', 'SyncStats']
@@ -0,0 +1,133 @@
+"""AnkiConnect client decorator answering card lookups from a local cache."""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure import profiling
+from .sqlite_cache import CacheStats, SqliteCardCache
+
+
+class CachingAnkiConnectClient:
+    """Serves `cardsInfo` lookups from a SQLite cache, refetching only changed cards.
+
+    For every lookup the cheap `cardsModTime` action tells which cached cards
+    are out of date. Only those, and cards that are not cached yet, are fetched
+    with `cardsInfo`. All other calls are passed to the wrapped client.
+    """
+
+    def __init__(self, client: AnkiConnectClient, cache: SqliteCardCache):
+        """Initialize the caching client.
+
+        Args:
+            client: AnkiConnect client used for everything the cache can't answer
+            cache: Local storage for card data
+        """
+        self._client = client
+        self._cache = cache
+        self._stats = CacheStats()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def stats(self) -> CacheStats:
+        """Get the hit and miss counters collected so far.
+
+        Returns:
+            A snapshot of the cache counters
+        """
+        return CacheStats(hits=self._stats.hits, misses=self._stats.misses)
+
+    @profiling.timed("cache.get_cards_info")
+    def get_cards_info(self, card_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get detailed information about cards, from the cache where it is up to date.
+
+        Args:
+            card_ids: List of card IDs to get info for
+
+        Returns:
+            List of card information dictionaries, in the order of `card_ids`
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        if not card_ids:
+            return []
+
+        cards, stale, mods = self._read_cached(card_ids)
+        if stale:
+            self._store(cards, stale, self._client.get_cards_info(stale), mods)
+        return [cards.get(card_id, {}) for card_id in card_ids]
+
+    def iter_cards_info(self, card_ids: List[int]) -> Iterator[List[Dict[str, Any]]]:
+        """Get detailed information about cards, one chunk at a time.
+
+        Each chunk, sized like the wrapped client's, has its modification times
+        checked on its own, and its stale cards are streamed through the wrapped
+        client's `iter_cards_info`. A chunk is yielded before the next one is
+        looked up.
+
+        Args:
+            card_ids: List of card IDs to get info for
+
+        Yields:
+            Lists of card information dictionaries, in the order of `card_ids`
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        position = 0
+        while position < len(card_ids):
+            chunk = card_ids[position:position + self._client.chunker.size]
+            position += len(chunk)
+
+            cards, stale, mods = self._read_cached(chunk)
+            fetched = 0
+            for fresh in self._client.iter_cards_info(stale) if stale else ():
+                self._store(cards, stale[fetched:fetched + len(fresh)], fresh, mods)
+                fetched += len(fresh)
+            yield [cards.get(card_id, {}) for card_id in chunk]
+
+    def get_cards_info_many(self, card_id_lists: List[List[int]]) -> List[List[Dict[str, Any]]]:
+        """Get detailed information about several groups of cards.
+
+        Args:
+            card_id_lists: Groups of card IDs to get info for
+
+        Returns:
+            List of card information dictionaries for each group, in order
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        cards = self.get_cards_info([card_id for card_ids in card_id_lists for card_id in card_ids])
+        groups, position = [], 0
+        for card_ids in card_id_lists:
+            groups.append(cards[position:position + len(card_ids)])
+            position += len(card_ids)
+        return groups
+
+    def _read_cached(self, card_ids: List[int]) -> Tuple[Dict[int, Dict[str, Any]], List[int], Dict[int, int]]:
+        """Split cards into up-to-date cached ones and stale ones, counting hits and misses."""
+        mods = {entry["cardId"]: entry["mod"] for entry in self._client.get_cards_mod_time(card_ids) or []}
+        cached = self._cache.get_many(card_ids)
+
+        cards: Dict[int, Dict[str, Any]] = {}
+        stale = []
+        for card_id in card_ids:
+            entry = cached.get(card_id)
+            if entry is not None and card_id in mods and entry[0] == mods[card_id]:
+                cards[card_id] = entry[1]
+            else:
+                stale.append(card_id)
+
+        self._stats.hits += len(card_ids) - len(stale)
+        self._stats.misses += len(stale)
+        return cards, stale, mods
+
+    def _store(
+        self, cards: Dict[int, Dict[str, Any]], card_ids: List[int], fresh: List[Dict[str, Any]], mods: Dict[int, int]
+    ) -> None:
+        """Cache freshly fetched cards and add them to a lookup's results."""
+        self._cache.put_many(fresh, mods)
+        for card_id, card in zip(card_ids, fresh):
+            cards[card_id] = card
@@ -0,0 +1,228 @@
+"""SQLite-backed storage for card data returned by AnkiConnect."""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure import profiling
+
+
+def default_cache_path() -> str:
+    """Get the default location of the card cache file."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "anki-cli", "cards.sqlite3")
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a card cache."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the share of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SqliteCardCache:
+    """Stores `cardsInfo` card dictionaries in a local SQLite file, keyed by card ID.
+
+    Next to each card its modification time and deck are kept in their own
+    columns, so the cache can serve as a mirror of the collection that is
+    compared against Anki without decoding any card.
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    _BATCH_SIZE = 500
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the cache. The file is opened on first use.
+
+        Args:
+            path: Location of the SQLite file, ":memory:" for a throwaway cache
+        """
+        self.path = path or default_cache_path()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @profiling.timed("cache.get_many")
+    def get_many(self, card_ids: Iterable[int]) -> Dict[int, Tuple[int, Dict[str, Any]]]:
+        """Get cached cards.
+
+        Args:
+            card_ids: IDs of the cards to look up
+
+        Returns:
+            Mapping of card ID to its modification time and card dictionary,
+            for the cards that are cached
+        """
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for batch in self._batches(list(card_ids)):
+                rows = connection.execute(
+                    f"SELECT card_id, mod, data FROM cards WHERE card_id IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                for card_id, mod, data in rows:
+                    found[card_id] = (mod, json.loads(data))
+        return found
+
+    @profiling.timed("cache.put_many")
+    def put_many(self, cards: Iterable[Dict[str, Any]], mods: Optional[Dict[int, int]] = None) -> None:
+        """Store cards, replacing older versions.
+
+        Args:
+            cards: Card dictionaries as returned by `cardsInfo`
+            mods: Modification times by card ID, used when a card has no "mod" key
+        """
+        mods = mods or {}
+        rows = [
+            (card["cardId"], card.get("mod", mods.get(card["cardId"], 0)), card.get("deckName"), json.dumps(card))
+            for card in cards
+            if "cardId" in card
+        ]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO cards (card_id, mod, deck, data) VALUES (?, ?, ?, ?)", rows
+                )
+
+    def get_mods(self, card_ids: Iterable[int]) -> Dict[int, int]:
+        """Get the modification times of cached cards without loading the cards.
+
+        Args:
+            card_ids: IDs of the cards to look up
+
+        Returns:
+            Mapping of card ID to modification time, for the cards that are cached
+        """
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for batch in self._batches(list(card_ids)):
+                rows = connection.execute(
+                    f"SELECT card_id, mod FROM cards WHERE card_id IN ({','.join('?' * len(batch))})", batch
+                )
+                found.update(rows)
+        return found
+
+    def card_ids(self, decks: Optional[Iterable[str]] = None) -> List[int]:
+        """Get the IDs of cached cards.
+
+        Args:
+            decks: Only get cards in these decks, not counting sub-decks
+
+        Returns:
+            Card IDs in ascending order
+        """
+        with self._lock:
+            connection = self._connect()
+            if decks is None:
+                return [card_id for (card_id,) in connection.execute("SELECT card_id FROM cards ORDER BY card_id")]
+            found = []
+            for batch in self._batches(list(decks)):
+                rows = connection.execute(
+                    f"SELECT card_id FROM cards WHERE deck IN ({','.join('?' * len(batch))})", batch
+                )
+                found.extend(card_id for (card_id,) in rows)
+        return sorted(found)
+
+    def count_by_deck(self) -> Dict[str, int]:
+        """Count cached cards per deck, not counting sub-decks.
+
+        Returns:
+            Mapping of deck name to number of cards
+        """
+        with self._lock:
+            connection = self._connect()
+            return dict(connection.execute("SELECT deck, COUNT(*) FROM cards WHERE deck IS NOT NULL GROUP BY deck"))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Get a stored bookkeeping value, such as a sync watermark.
+
+        Args:
+            key: Name of the value
+
+        Returns:
+            The value, or None if it was never set
+        """
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Store a bookkeeping value, replacing the previous one.
+
+        Args:
+            key: Name of the value
+            value: The value
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def delete_many(self, card_ids: Iterable[int]) -> None:
+        """Remove cards from the cache.
+
+        Args:
+            card_ids: IDs of the cards to remove
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for batch in self._batches(list(card_ids)):
+                    connection.execute(
+                        f"DELETE FROM cards WHERE card_id IN ({','.join('?' * len(batch))})", batch
+                    )
+
+    def clear(self) -> None:
+        """Remove every cached card and bookkeeping value."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM cards")
+                connection.execute("DELETE FROM meta")
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite file and create the schema if needed."""
+        if self._connection is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cards ("
+                "card_id INTEGER PRIMARY KEY, mod INTEGER NOT NULL, deck TEXT, data TEXT NOT NULL)"
+            )
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(cards)")}
+            if "deck" not in columns:
+                # Caches written before the deck column existed
+                with connection:
+                    connection.execute("ALTER TABLE cards ADD COLUMN deck TEXT")
+                    connection.execute("UPDATE cards SET deck = json_extract(data, '$.deckName')")
+            connection.execute("CREATE INDEX IF NOT EXISTS ix_cards_deck ON cards (deck)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._connection = connection
+        return self._connection
+
+    @classmethod
+    def _batches(cls, card_ids: List[int]) -> Iterable[List[int]]:
+        """Split IDs into batches that fit in one statement."""
+        for start in range(0, len(card_ids), cls._BATCH_SIZE):
+            yield card_ids[start:start + cls._BATCH_SIZE]
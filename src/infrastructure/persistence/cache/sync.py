@@ -0,0 +1,168 @@
+"""Incremental mirroring of the collection's cards into the local cache."""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure import profiling
+from .client import CachingAnkiConnectClient
+from .sqlite_cache import CacheStats, SqliteCardCache
+
+_DAY = 86400
+
+
+@dataclass
+class SyncStats:
+    """What one sync run did."""
+    full: bool = False
+    checked: int = 0
+    deleted: int = 0
+
+
+class CardSync:
+    """Keeps the card cache a mirror of the cards that were looked up.
+
+    The mirror fills lazily: a lookup downloads only the requested cards it
+    doesn't have. Every lookup checks the modification times of the requested
+    cards with one batched `cardsModTime` call and downloads the ones that
+    changed, so reviews, edits, unburying, rescheduling and moves are all
+    seen before a card is mapped.
+
+    Sync runs only drop deleted cards from the mirror. Each run compares the
+    per-deck totals from `getDeckStats` with those of the previous run and
+    lists only the decks whose total moved. The first run, and one run per
+    `full_sync_interval` after it, lists the IDs of every card instead, which
+    also catches deletions balanced out by additions to the same deck. No run
+    downloads card details.
+    """
+
+    SYNCED_AT = "sync.synced_at"
+    FULL_SYNCED_AT = "sync.full_synced_at"
+    DECK_TOTALS = "sync.deck_totals"
+
+    def __init__(self, client: AnkiConnectClient, cache: SqliteCardCache, full_sync_interval: float = _DAY):
+        """Initialize the sync engine.
+
+        Args:
+            client: AnkiConnect client the collection is read with
+            cache: Local mirror of the collection's cards
+            full_sync_interval: Seconds after which the next run is a full one
+        """
+        self._client = client
+        self._cache = cache
+        self._cards = CachingAnkiConnectClient(client, cache)
+        self.full_sync_interval = full_sync_interval
+
+    def stats(self) -> CacheStats:
+        """Get the hit and miss counters of card lookups collected so far.
+
+        Returns:
+            A snapshot of the lookup counters
+        """
+        return self._cards.stats()
+
+    @profiling.timed("sync.sync")
+    def sync(self, full: bool = False) -> SyncStats:
+        """Drop cards deleted from the collection from the mirror.
+
+        Args:
+            full: Whether to list every card, even if comparing deck totals would do
+
+        Returns:
+            What the run checked and deleted
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        # Taken before asking Anki, so changes made during the run are seen next time
+        now = time.time()
+        full_synced_at = self._read_time(self.FULL_SYNCED_AT)
+        previous = self._cache.get_meta(self.DECK_TOTALS)
+
+        totals = self._deck_totals()
+        if full or previous is None or full_synced_at is None or now - full_synced_at >= self.full_sync_interval:
+            stats = self._full_sync()
+            self._cache.set_meta(self.FULL_SYNCED_AT, repr(now))
+        else:
+            stats = self._incremental_sync(json.loads(previous), totals)
+        self._cache.set_meta(self.DECK_TOTALS, json.dumps(totals))
+        self._cache.set_meta(self.SYNCED_AT, repr(now))
+        return stats
+
+    def get_cards_info(self, card_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get detailed information about cards from the mirror, refreshing changed ones.
+
+        Args:
+            card_ids: List of card IDs to get info for
+
+        Returns:
+            List of card information dictionaries, in the order of `card_ids`
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        return self._cards.get_cards_info(card_ids)
+
+    def iter_cards_info(self, card_ids: List[int]) -> Iterator[List[Dict[str, Any]]]:
+        """Get detailed information about cards from the mirror, one chunk at a time.
+
+        Args:
+            card_ids: List of card IDs to get info for
+
+        Yields:
+            Lists of card information dictionaries, in the order of `card_ids`
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        return self._cards.iter_cards_info(card_ids)
+
+    def get_cards_info_many(self, card_id_lists: List[List[int]]) -> List[List[Dict[str, Any]]]:
+        """Get detailed information about several groups of cards from the mirror.
+
+        Args:
+            card_id_lists: Groups of card IDs to get info for
+
+        Returns:
+            List of card information dictionaries for each group, in order
+
+        Raises:
+            RuntimeError: If there's an error communicating with Anki
+        """
+        return self._cards.get_cards_info_many(card_id_lists)
+
+    def _deck_totals(self) -> Dict[str, int]:
+        """Get the number of cards in every deck, not counting sub-decks."""
+        deck_names = self._client.get_deck_names() or []
+        if not deck_names:
+            return {}
+        deck_stats = self._client.get_deck_stats(deck_names) or {}
+        return {deck["name"]: deck["total_in_deck"] for deck in deck_stats.values()}
+
+    def _full_sync(self) -> SyncStats:
+        """List every card ID of the collection and drop mirrored cards that aren't among them."""
+        card_ids = set(self._client.find_cards("deck:*") or [])
+        removed = set(self._cache.card_ids()) - card_ids
+        self._cache.delete_many(removed)
+        return SyncStats(full=True, checked=len(card_ids), deleted=len(removed))
+
+    def _incremental_sync(self, previous: Dict[str, int], totals: Dict[str, int]) -> SyncStats:
+        """Re-list decks whose card totals moved since the last run, dropping mirrored cards they lost."""
+        changed = sorted(name for name in set(totals) | set(previous) if totals.get(name, 0) != previous.get(name, 0))
+        if not changed:
+            return SyncStats()
+
+        # Decks that no longer exist have nothing to list
+        present = [name for name in changed if name in totals]
+        queries = [f'deck:"{name}" -deck:"{name}::*"' for name in present]
+        listed = {card_id for card_ids in self._client.find_cards_many(queries) for card_id in card_ids}
+
+        removed = set(self._cache.card_ids(changed)) - listed
+        self._cache.delete_many(removed)
+        return SyncStats(checked=len(listed), deleted=len(removed))
+
+    def _read_time(self, key: str) -> Optional[float]:
+        value = self._cache.get_meta(key)
+        return float(value) if value is not None else None
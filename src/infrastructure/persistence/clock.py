@@ -0,0 +1,88 @@
+"""The time as Anki's scheduler counts it."""
+
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+_DAY = 86400
+
+
+class SchedulerClock:
+    """Tells the current time and Anki's day number for it.
+
+    Review cards are due on a day number counted from the collection's
+    creation, and a new day starts at the rollover hour, local time. Knowing
+    the day number at one moment is enough to tell it at any other, so it is
+    found once, with `probe` or from `anchor`, and only counted on from there
+    for the lifetime of the clock.
+
+    Until the day number is known it is counted from the Unix epoch, which is
+    how the mapper used to count it.
+    """
+
+    def __init__(
+        self,
+        probe: Optional[Callable[[], Optional[int]]] = None,
+        rollover_hour: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the clock.
+
+        Args:
+            probe: Finds today's day number, returning None if it can't be told.
+                It is called at most once per scheduler day until it succeeds,
+                and again on the next call if it raises.
+            rollover_hour: Local hour at which Anki starts a new day
+            clock: Source of the current time in seconds
+        """
+        self._probe = probe
+        self.rollover_hour = rollover_hour
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Day number and the scheduler date it was found on
+        self._anchor: Optional[Tuple[int, date]] = None
+        self._probed_on: Optional[date] = None
+
+    def now(self) -> float:
+        """Get the current time in seconds."""
+        return self._clock()
+
+    def now_ms(self) -> int:
+        """Get the current time in milliseconds."""
+        return int(self._clock() * 1000)
+
+    def today(self) -> int:
+        """Get today's day number, the one due review cards are on or before.
+
+        Raises:
+            RuntimeError: If the probe fails to communicate with Anki
+        """
+        now = self._clock()
+        current = self._scheduler_date(now)
+        with self._lock:
+            if self._anchor is None and self._probe is not None and self._probed_on != current:
+                day = self._probe()
+                # Only a probe that answered waits for the next day, one that raised is tried again
+                self._probed_on = current
+                if day is not None:
+                    self._anchor = (day, current)
+            if self._anchor is None:
+                return int(now / _DAY)
+            day, anchored_on = self._anchor
+        return day + (current - anchored_on).days
+
+    def anchor(self, day: int, at: Optional[float] = None) -> None:
+        """Set the day number at a moment, for sources that know it without probing.
+
+        Args:
+            day: Anki's day number at that moment
+            at: The moment in seconds, now if not given
+        """
+        at = self._clock() if at is None else at
+        with self._lock:
+            self._anchor = (day, self._scheduler_date(at))
+
+    def _scheduler_date(self, timestamp: float) -> date:
+        """Get the local date a moment belongs to, with days starting at the rollover hour."""
+        return (datetime.fromtimestamp(timestamp) - timedelta(hours=self.rollover_hour)).date()
@@ -0,0 +1,5 @@
+"""Read-only persistence implementation on top of Anki's collection file."""
+
+from .repository import CollectionCardRepository
+
+__all__ = ['CollectionCardRepository']
@@ -0,0 +1,396 @@
+"""Repository implementation reading Anki's collection.anki2 SQLite file directly."""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from src.core.ports import CardRepository
+from src.core.entities import CardPage, DeckCards, DeckSummary, TodayReview, TodaySummary
+from src.infrastructure import profiling
+from src.infrastructure.persistence.clock import SchedulerClock
+from src.infrastructure.persistence.cursor import decode_cursor, encode_cursor
+from src.infrastructure.persistence.sampling import CardSampler
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+
+# Anki separates deck name components with \x1f in the `decks` table
+_DECK_SEPARATOR = "\x1f"
+# Anki separates note field values with \x1f in `notes.flds`
+_FIELD_SEPARATOR = "\x1f"
+# Learning cards due within this many seconds count as due, like Anki's default
+_LEARN_AHEAD_SECONDS = 20 * 60
+
+_CARD_COLUMNS = (
+    "c.id, c.nid, c.did, c.odid, c.ord, c.mod, c.type, c.queue, c.due, c.odue, "
+    "c.ivl, c.factor, c.reps, c.lapses, c.left, n.mid, n.flds"
+)
+
+
+class CollectionCardRepository(CardRepository):
+    """Repository for retrieving cards straight from a collection.anki2 file.
+
+    The file is opened read-only and immutable, so Anki doesn't have to be
+    running. Cards are turned into the same dictionaries AnkiConnect's
+    `cardsInfo` returns and mapped with the regular AnkiCardMapper.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mapper: AnkiCardMapper,
+        mmap_size: int = 256 * 1024 * 1024,
+        clock: Optional[SchedulerClock] = None,
+    ):
+        """Initialize the repository. The file is opened on first use.
+
+        Args:
+            path: Location of the collection.anki2 file
+            mapper: Mapper for converting card data to domain entities
+            mmap_size: Bytes of the file SQLite may memory-map
+            clock: Clock the mapper classifies cards with, told today's day
+                number from the collection's creation time once the file is opened
+        """
+        self.path = path
+        self._mapper = mapper
+        self._mmap_size = mmap_size
+        self._clock = clock
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._decks: Optional[Dict[int, str]] = None
+        self._models: Optional[Dict[int, Tuple[str, List[str]]]] = None
+
+    @profiling.timed("collection.get_today_review")
+    def get_today_review(self, deck_name: Optional[str] = None) -> TodayReview:
+        """Get today's review cards.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Returns:
+            TodayReview containing the decks and their cards
+
+        Raises:
+            RuntimeError: If the collection can't be read
+        """
+        return TodayReview(list(self.iter_today_review(deck_name=deck_name)))
+
+    def iter_today_review(self, deck_name: Optional[str] = None) -> Iterator[DeckCards]:
+        """Get today's review cards one deck at a time.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Yields:
+            DeckCards for every deck that has cards due today
+
+        Raises:
+            RuntimeError: If the collection can't be read
+        """
+        now = int(time.time())
+        today = self._today(now)
+        for name, deck_ids in self._main_decks(deck_name):
+            # Same condition as Anki's `is:due` search
+            rows = self._query(
+                f"SELECT {_CARD_COLUMNS} FROM cards c JOIN notes n ON n.id = c.nid "
+                f"WHERE (c.did IN ({self._placeholders(deck_ids)}) OR c.odid IN ({self._placeholders(deck_ids)})) "
+                "AND ((c.queue IN (2, 3) AND c.due <= ?) OR (c.queue IN (1, 4) AND c.due <= ?)) "
+                "ORDER BY c.id",
+                [*deck_ids, *deck_ids, today, now + _LEARN_AHEAD_SECONDS],
+            )
+            deck_cards = self._to_deck_cards(name, rows)
+            if deck_cards is not None:
+                yield deck_cards
+
+    @profiling.timed("collection.get_all_cards")
+    def get_all_cards(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        deck_name: Optional[str] = None,
+        random: bool = False,
+        seed: Optional[int] = None,
+        weight: Optional[str] = None,
+    ) -> TodayReview:
+        """Get all cards, optionally filtered by deck.
+
+        Random picks read only the columns weights need for every card, then
+        the picked cards in full, see CardSampler.
+
+        Args:
+            limit: Maximum number of cards per deck to fetch
+            offset: Number of cards to skip
+            deck_name: Optional deck name to filter by
+            random: Whether to randomize the order of cards
+            seed: Seed of the random order, the same seed and offset give the same cards
+            weight: Favour cards by "lapses", "ease" or "overdue" when sampling, implies random
+
+        Returns:
+            A TodayReview entity containing the cards
+
+        Raises:
+            ValueError: If the weight is not known
+            RuntimeError: If the collection can't be read
+        """
+        sampler = CardSampler(random=random, seed=seed, weight=weight)
+        today = self._today(int(time.time()))
+        decks = []
+        for name, deck_ids in self._main_decks(deck_name):
+            in_deck = f"c.did IN ({self._placeholders(deck_ids)}) OR c.odid IN ({self._placeholders(deck_ids)})"
+            if not sampler.random:
+                rows = self._query(
+                    f"SELECT {_CARD_COLUMNS} FROM cards c JOIN notes n ON n.id = c.nid "
+                    f"WHERE {in_deck} ORDER BY c.id LIMIT ? OFFSET ?",
+                    [*deck_ids, *deck_ids, limit, offset],
+                )
+            else:
+                candidates = self._query(
+                    f"SELECT c.id, c.lapses, c.factor, c.type, c.queue, c.due FROM cards c "
+                    f"WHERE {in_deck} ORDER BY c.id",
+                    [*deck_ids, *deck_ids],
+                )
+                weights = {
+                    card_id: sampler.card_weight(lapses, factor, card_type, today - due if queue in (2, 3) else 0)
+                    for card_id, lapses, factor, card_type, queue, due in candidates
+                } if sampler.weight else None
+                picked = sampler.select([row[0] for row in candidates], limit, offset, salt=name, weights=weights)
+                rows = self._query_cards(picked)
+            deck_cards = self._to_deck_cards(name, rows)
+            if deck_cards is not None:
+                decks.append(deck_cards)
+
+        return TodayReview(decks=decks)
+
+    def _query_cards(self, card_ids: List[int], chunk_size: int = 500) -> List[Tuple]:
+        """Read cards by ID, in the order of `card_ids`."""
+        rows: Dict[int, Tuple] = {}
+        for start in range(0, len(card_ids), chunk_size):
+            chunk = card_ids[start:start + chunk_size]
+            for row in self._query(
+                f"SELECT {_CARD_COLUMNS} FROM cards c JOIN notes n ON n.id = c.nid "
+                f"WHERE c.id IN ({self._placeholders(chunk)})",
+                chunk,
+            ):
+                rows[row[0]] = row
+        return [rows[card_id] for card_id in card_ids if card_id in rows]
+
+    def iter_card_pages(
+        self, deck_name: Optional[str] = None, page_size: int = 500, cursor: Optional[str] = None
+    ) -> Iterator[CardPage]:
+        """Walk all cards page by page, deck by deck in name order and in card ID order within a deck.
+
+        Every page is one indexed query for the cards after the previous page's
+        last card ID, so resuming from a cursor costs the same as any other page.
+
+        Args:
+            deck_name: Optional deck name to filter by
+            page_size: Maximum number of cards per page
+            cursor: Token of a page to continue after, None to start at the beginning
+
+        Yields:
+            CardPage for every page of cards
+
+        Raises:
+            ValueError: If the cursor is not valid
+            RuntimeError: If the collection can't be read
+        """
+        start_deck, after = decode_cursor(cursor) if cursor else (None, 0)
+        decks = [(name, deck_ids) for name, deck_ids in self._main_decks(deck_name) if start_deck is None or name >= start_deck]
+
+        page: Optional[Tuple[str, List[Tuple]]] = None
+        for name, deck_ids in decks:
+            last_id = after if name == start_deck else 0
+            while True:
+                rows = self._query(
+                    f"SELECT {_CARD_COLUMNS} FROM cards c JOIN notes n ON n.id = c.nid "
+                    f"WHERE (c.did IN ({self._placeholders(deck_ids)}) OR c.odid IN ({self._placeholders(deck_ids)})) "
+                    "AND c.id > ? ORDER BY c.id LIMIT ?",
+                    [*deck_ids, *deck_ids, last_id, page_size],
+                )
+                if not rows:
+                    break
+                # Hold each page back until the next one is known, so the last one gets no cursor
+                if page is not None:
+                    yield self._to_page(*page, last=False)
+                page = (name, rows)
+                last_id = rows[-1][0]
+                if len(rows) < page_size:
+                    break
+        if page is not None:
+            yield self._to_page(*page, last=True)
+
+    def _to_page(self, deck_name: str, rows: List[Tuple], last: bool) -> CardPage:
+        """Map one page of card rows, with a cursor unless it is the last page."""
+        deck = self._mapper.to_deck_cards(deck_name, [self._to_card_info(row) for row in rows])
+        return CardPage(deck=deck, cursor=None if last else encode_cursor(deck_name, rows[-1][0]))
+
+    @profiling.timed("collection.get_today_summary")
+    def get_today_summary(self, deck_name: Optional[str] = None) -> TodaySummary:
+        """Get the number of cards due today per deck with a single counting query.
+
+        Args:
+            deck_name: Optional deck name to filter by
+
+        Returns:
+            TodaySummary containing card counts grouped by deck
+
+        Raises:
+            RuntimeError: If the collection can't be read
+        """
+        now = int(time.time())
+        rows = self._query(
+            "SELECT c.did, c.odid, SUM(c.queue IN (1, 3)), SUM(c.queue = 2) "
+            "FROM cards c "
+            "WHERE (c.queue IN (2, 3) AND c.due <= ?) OR (c.queue IN (1, 4) AND c.due <= ?) "
+            "GROUP BY c.did, c.odid",
+            [self._today(now), now + _LEARN_AHEAD_SECONDS],
+        )
+
+        main_deck_by_id = {
+            deck_id: name for name, deck_ids in self._main_decks(deck_name) for deck_id in deck_ids
+        }
+        counts: Dict[str, List[int]] = {}
+        for deck_id, original_deck_id, learning, review in rows:
+            name = main_deck_by_id.get(deck_id) or main_deck_by_id.get(original_deck_id)
+            if name is None:
+                continue
+            total = counts.setdefault(name, [0, 0])
+            total[0] += learning
+            total[1] += review
+
+        decks = [
+            DeckSummary(deck_name=name, learning_count=learning, review_count=review)
+            for name, (learning, review) in sorted(counts.items())
+        ]
+        return TodaySummary([deck for deck in decks if deck.total_cards > 0])
+
+    def close(self) -> None:
+        """Close the collection file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _main_decks(self, deck_name: Optional[str]) -> List[Tuple[str, List[int]]]:
+        """Get the decks to query with the IDs of each deck and its sub-decks.
+
+        Args:
+            deck_name: Optional deck name to filter by, otherwise every top-level deck
+
+        Returns:
+            Pairs of deck name and deck IDs, sorted by name
+        """
+        grouped: Dict[str, List[int]] = {}
+        for deck_id, name in self._deck_names().items():
+            if deck_name:
+                if name == deck_name or name.startswith(deck_name + "::"):
+                    grouped.setdefault(deck_name, []).append(deck_id)
+            else:
+                grouped.setdefault(name.split("::")[0], []).append(deck_id)
+        return sorted(grouped.items())
+
+    def _to_deck_cards(self, deck_name: str, rows: List[Tuple]) -> Optional[DeckCards]:
+        """Map card rows of one deck, returning None if no card is left."""
+        if not rows:
+            return None
+        deck_cards = self._mapper.to_deck_cards(deck_name, [self._to_card_info(row) for row in rows])
+        return deck_cards if deck_cards.total_cards > 0 else None
+
+    def _to_card_info(self, row: Tuple) -> Dict[str, Any]:
+        """Build a card dictionary shaped like AnkiConnect's `cardsInfo` result."""
+        (card_id, note_id, deck_id, original_deck_id, ordinal, mod, card_type, queue,
+         due, original_due, interval, factor, reps, lapses, left, model_id, fields) = row
+        model_name, field_names = self._model_fields().get(model_id, ("", []))
+        values = fields.split(_FIELD_SEPARATOR)
+        return {
+            "cardId": card_id,
+            "note": note_id,
+            "deckName": self._deck_names().get(deck_id, ""),
+            "modelName": model_name,
+            "ord": ordinal,
+            "fields": {
+                name: {"value": value, "order": order}
+                for order, (name, value) in enumerate(zip(field_names, values))
+            },
+            "type": card_type,
+            "queue": queue,
+            "due": due,
+            "odue": original_due,
+            "interval": interval,
+            "factor": factor,
+            "reps": reps,
+            "lapses": lapses,
+            "left": left,
+            "mod": mod,
+        }
+
+    def _today(self, now: int) -> int:
+        """Get today's day number relative to the collection creation time."""
+        (created,) = self._query("SELECT crt FROM col")[0]
+        return (now - created) // 86400
+
+    def _deck_names(self) -> Dict[int, str]:
+        """Get deck names by ID, loaded once per repository."""
+        if self._decks is None:
+            if self._has_table("decks"):
+                rows = self._query("SELECT id, name FROM decks")
+                self._decks = {deck_id: name.replace(_DECK_SEPARATOR, "::") for deck_id, name in rows}
+            else:
+                (decks,) = self._query("SELECT decks FROM col")[0]
+                self._decks = {int(deck_id): deck["name"] for deck_id, deck in json.loads(decks).items()}
+        return self._decks
+
+    def _model_fields(self) -> Dict[int, Tuple[str, List[str]]]:
+        """Get note model names and ordered field names by model ID, loaded once."""
+        if self._models is None:
+            if self._has_table("notetypes"):
+                names = dict(self._query("SELECT id, name FROM notetypes"))
+                fields: Dict[int, List[str]] = {}
+                for model_id, name in self._query("SELECT ntid, name FROM fields ORDER BY ntid, ord"):
+                    fields.setdefault(model_id, []).append(name)
+                self._models = {model_id: (name, fields.get(model_id, [])) for model_id, name in names.items()}
+            else:
+                (models,) = self._query("SELECT models FROM col")[0]
+                self._models = {
+                    int(model_id): (model["name"], [field["name"] for field in sorted(model["flds"], key=lambda f: f["ord"])])
+                    for model_id, model in json.loads(models).items()
+                }
+        return self._models
+
+    def _has_table(self, name: str) -> bool:
+        """Check whether the collection uses the newer schema with a separate table."""
+        return bool(self._query("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", [name]))
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple]:
+        """Run a read-only query against the collection.
+
+        Raises:
+            RuntimeError: If the collection can't be read
+        """
+        try:
+            with self._lock, profiling.span("collection.query") as span:
+                rows = self._connect().execute(sql, list(params)).fetchall()
+                span.set(rows=len(rows))
+                return rows
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to read Anki collection {self.path}: {str(e)}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the collection read-only and immutable."""
+        if self._connection is None:
+            uri = f"file:{quote(self.path)}?mode=ro&immutable=1"
+            connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            connection.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+            connection.execute("PRAGMA query_only = 1")
+            if self._clock is not None:
+                now = self._clock.now()
+                (created,) = connection.execute("SELECT crt FROM col").fetchone()
+                self._clock.anchor(int(now - created) // 86400, at=now)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _placeholders(values: List[Any]) -> str:
+        """Get a comma-separated list of SQL parameter placeholders."""
+        return ",".join("?" * len(values))
@@ -0,0 +1,41 @@
+"""Opaque continuation tokens for walking cards page by page."""
+
+import base64
+import json
+from typing import Tuple
+
+
+def encode_cursor(deck_name: str, after_card_id: int) -> str:
+    """Build a token continuing after a card of a deck.
+
+    Args:
+        deck_name: The top-level deck being walked
+        after_card_id: The last card ID already returned
+
+    Returns:
+        A URL-safe token
+    """
+    data = json.dumps([deck_name, after_card_id], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Read a token built by `encode_cursor`.
+
+    Args:
+        cursor: The token
+
+    Returns:
+        The deck name and the last card ID already returned
+
+    Raises:
+        ValueError: If the token is not a valid cursor
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        deck_name, after_card_id = json.loads(data)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(deck_name, str) or not isinstance(after_card_id, int):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return deck_name, after_card_id
@@ -0,0 +1,238 @@
+"""Seeded, optionally weighted sampling of the cards `anki list --random` shows."""
+
+import heapq
+import math
+import random as random_module
+from itertools import islice
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# Ways cards can be weighted, each favouring cards that need more attention
+WEIGHTS = ("lapses", "ease", "overdue")
+
+# Weights grow in tiers, so AnkiConnect can find every tier with one search.
+# Cards with at least this many lapses, or due at least this many days ago,
+# weigh one more than the threshold.
+_LAPSE_TIERS = (1, 2, 4, 8, 16, 32)
+_OVERDUE_TIERS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+# Ease factors in permille, a review card below each one weighs one more
+_EASE_TIERS = (2500, 2200, 1900, 1600)
+
+_MASK = (1 << 64) - 1
+
+
+def new_seed() -> int:
+    """Get a fresh seed for a run that wasn't given one."""
+    return random_module.SystemRandom().randrange(1 << 32)
+
+
+def sample_ids(card_ids: Sequence[int], limit: int, offset: int = 0, seed: int = 0, salt: str = "") -> List[int]:
+    """Pick cards uniformly at random, in a seeded order that can be paged with `offset`.
+
+    Only the first `offset + limit` steps of a Fisher-Yates shuffle are run,
+    keeping swapped positions in a dictionary, so the cost grows with the
+    number of cards picked and not with the size of the deck. The same seed
+    and salt give the same order as long as the card IDs don't change.
+
+    Args:
+        card_ids: Card IDs to pick from, in a stable order
+        limit: Maximum number of cards to pick
+        offset: Number of picks to skip
+        seed: Seed of the order
+        salt: Distinguishes orders drawn with the same seed, e.g. the deck name
+
+    Returns:
+        The picked card IDs, in the order they were drawn
+    """
+    return list(islice(_shuffled(card_ids, random_module.Random(f"{seed}:{salt}")), offset, offset + limit))
+
+
+def weighted_sample_ids(
+    card_ids: Sequence[int],
+    weights: Mapping[int, float],
+    limit: int,
+    offset: int = 0,
+    seed: int = 0,
+    salt: str = "",
+) -> List[int]:
+    """Pick cards at random with probability proportional to their weight.
+
+    Uses Efraimidis and Spirakis' A-Res, where every card gets the key u^(1/w)
+    and the cards with the highest keys are picked. Only cards heavier than 1
+    get a key of their own. The highest keys of all other cards are drawn
+    directly as order statistics of uniform variables, and the cards they go
+    to as a uniform sample, so the cost grows with the number of heavy cards
+    and picks and not with the size of the deck.
+
+    Args:
+        card_ids: Card IDs to pick from, in a stable order
+        weights: Weight of cards in `card_ids`, 1 for cards not listed
+        limit: Maximum number of cards to pick
+        offset: Number of picks to skip
+        seed: Seed of the order
+        salt: Distinguishes orders drawn with the same seed, e.g. the deck name
+
+    Returns:
+        The picked card IDs, most likely first
+    """
+    wanted = offset + limit
+    rng = random_module.Random(f"{seed}:{salt}")
+    base = _mix(seed & _MASK ^ _mix(_hash_text(salt)))
+
+    # Keys are compared as log(u) / w, which orders the same as u^(1/w) and can't underflow
+    heavy = {card_id: weight for card_id, weight in weights.items() if weight != 1.0}
+    heavy_keys = heapq.nlargest(
+        wanted, ((math.log(_uniform(base, card_id)) / weight, card_id) for card_id, weight in heavy.items())
+    )
+
+    # The largest of n uniform variables is V^(1/n) for a uniform V, the next
+    # largest that times an independent V^(1/(n-1)), and so on
+    light_keys = []
+    remaining = len(card_ids) - len(heavy)
+    key = 0.0
+    light = (card_id for card_id in _shuffled(card_ids, rng) if card_id not in heavy)
+    for card_id in islice(light, min(wanted, remaining)):
+        key += math.log(1.0 - rng.random()) / remaining
+        remaining -= 1
+        light_keys.append((key, card_id))
+
+    merged = heapq.merge(heavy_keys, light_keys, reverse=True)
+    return [card_id for _, card_id in islice(merged, offset, wanted)]
+
+
+def _shuffled(card_ids: Sequence[int], rng: random_module.Random) -> Iterator[int]:
+    """Yield card IDs in shuffled order, running Fisher-Yates one step per card taken."""
+    count = len(card_ids)
+    swapped: Dict[int, int] = {}
+    for position in range(count):
+        other = position + rng.randrange(count - position)
+        chosen = swapped.get(other, other)
+        swapped[other] = swapped.get(position, position)
+        yield card_ids[chosen]
+
+
+def _hash_text(text: str) -> int:
+    """Hash a string to 64 bits, the same in every process unlike `hash`."""
+    value = 0xCBF29CE484222325
+    for byte in text.encode("utf-8"):
+        value = ((value ^ byte) * 0x100000001B3) & _MASK
+    return value
+
+
+def _mix(value: int) -> int:
+    """Scramble 64 bits with the SplitMix64 finalizer."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def _uniform(base: int, card_id: int) -> float:
+    """Get a number in (0, 1) determined by the seed and the card ID."""
+    return ((_mix((base + card_id * 0x9E3779B97F4A7C15) & _MASK) >> 11) + 0.5) / (1 << 53)
+
+
+class CardSampler:
+    """Picks which of a deck's cards `anki list` shows.
+
+    Without `random` cards are shown in the order they were found. With it
+    they are sampled uniformly, or by weight when `weight` is given.
+    """
+
+    def __init__(self, random: bool = False, seed: Optional[int] = None, weight: Optional[str] = None):
+        """Initialize the sampler.
+
+        Args:
+            random: Whether to sample cards at random
+            seed: Seed of the random order, a fresh one if not given
+            weight: Weigh cards by "lapses", "ease" or "overdue", implies random
+
+        Raises:
+            ValueError: If the weight is not known
+        """
+        if weight is not None and weight not in WEIGHTS:
+            raise ValueError(f"Unknown weight: {weight}, expected one of {', '.join(WEIGHTS)}")
+        self.random = random or weight is not None
+        self.seed = new_seed() if seed is None else seed
+        self.weight = weight
+        self._tiers = self._weight_tiers(weight) if weight else []
+
+    def searches(self, deck_search: str) -> List[str]:
+        """Get the AnkiConnect searches finding the cards of each weight tier.
+
+        Args:
+            deck_search: Search for the deck's cards, e.g. `deck:"Polish"`
+
+        Returns:
+            One search per tier, none without a weight
+        """
+        return [f"{deck_search} {term}" for term, _ in self._tiers]
+
+    def tier_weights(self, matches: Sequence[Sequence[int]]) -> Dict[int, float]:
+        """Turn the results of `searches` into card weights.
+
+        Args:
+            matches: Card IDs found by each search, in order
+
+        Returns:
+            The weight of every card heavier than 1
+        """
+        weights: Dict[int, float] = {}
+        for (_, weight), card_ids in zip(self._tiers, matches):
+            for card_id in card_ids:
+                if weight > weights.get(card_id, 1.0):
+                    weights[card_id] = weight
+        return weights
+
+    def card_weight(self, lapses: int, factor: int, card_type: int, overdue_days: int) -> float:
+        """Get a card's weight from its own values, in the same tiers `searches` finds.
+
+        Args:
+            lapses: Number of times the card was forgotten
+            factor: Ease factor in permille
+            card_type: 0 for new cards, 1 learning, 2 review, 3 relearning
+            overdue_days: Days since the card was due, 0 or less if it isn't overdue
+
+        Returns:
+            The card's weight, 1 without a weight
+        """
+        if self.weight == "lapses":
+            return 1.0 + max((tier for tier in _LAPSE_TIERS if lapses >= tier), default=0)
+        if self.weight == "overdue":
+            return 1.0 + max((tier for tier in _OVERDUE_TIERS if overdue_days >= tier), default=0)
+        if self.weight == "ease" and card_type != 0:
+            return 1.0 + sum(1 for tier in _EASE_TIERS if factor < tier)
+        return 1.0
+
+    def select(
+        self,
+        card_ids: Sequence[int],
+        limit: int,
+        offset: int = 0,
+        salt: str = "",
+        weights: Optional[Mapping[int, float]] = None,
+    ) -> List[int]:
+        """Pick the cards to show from a deck.
+
+        Args:
+            card_ids: The deck's card IDs
+            limit: Maximum number of cards to pick
+            offset: Number of cards to skip
+            salt: Distinguishes the decks' orders, e.g. the deck name
+            weights: Card weights, from `tier_weights` or `card_weight`
+
+        Returns:
+            The picked card IDs
+        """
+        if self.weight is not None:
+            return weighted_sample_ids(card_ids, weights or {}, limit, offset, self.seed, salt)
+        if self.random:
+            return sample_ids(card_ids, limit, offset, self.seed, salt)
+        return list(card_ids[offset:offset + limit])
+
+    @staticmethod
+    def _weight_tiers(weight: str) -> List[Tuple[str, float]]:
+        """Get the search term and weight of every tier, lightest first."""
+        if weight == "lapses":
+            return [(f"prop:lapses>={tier}", 1.0 + tier) for tier in _LAPSE_TIERS]
+        if weight == "overdue":
+            return [(f"prop:due<=-{tier}", 1.0 + tier) for tier in _OVERDUE_TIERS]
+        return [(f"-is:new prop:ease<{tier / 1000:g}", 2.0 + index) for index, tier in enumerate(_EASE_TIERS)]
@@ -1,42 +1,110 @@
 """Console presenter implementation for displaying review information."""
 
-from rich import print
-from rich.console import Console
-from rich.table import Table
+from typing import Iterable, Optional, Sequence, TextIO
 
 from src.core.ports import ReviewPresenter
-from src.core.entities import TodayReview, Card
+from src.core.entities import DeckCards, TodayReview, TodaySummary, Card
+from src.infrastructure import profiling
+from .renderer import BufferedRenderer
 
-console = Console()
 
 class ConsolePresenter(ReviewPresenter):
-    """Presents review information in the console."""
+    """Presents review information in the console.
 
+    Output is buffered and written in large chunks, see BufferedRenderer.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, plain: Optional[bool] = None, buffer_size: int = 64 * 1024):
+        """Initialize the presenter.
+
+        Args:
+            stream: Stream to write to, standard output if not given
+            plain: Whether to skip rich rendering, defaults to True when the stream is not a terminal
+            buffer_size: Number of characters collected before they are written
+        """
+        self._renderer = BufferedRenderer(stream=stream, plain=plain, buffer_size=buffer_size)
+
+    @profiling.timed("presenter.present")
     def present(self, review: TodayReview) -> None:
         """Present the review information in the console.
 
         Args:
             review: The review information to present.
         """
+        out = self._renderer
         if not review.decks:
-            print("\nNo cards to review today!")
+            out.line("\nNo cards to review today!")
+            out.flush()
             return
 
-        print(f"\nTotal cards to review today: {review.total_cards}")
+        out.line(f"\nTotal cards to review today: {review.total_cards}")
         for deck in review.decks:
-            print(f"{deck.deck_name}:")
-            if deck.new_cards:
-                print(f"  New cards ({len(deck.new_cards)}):")
-                for card in deck.new_cards:
-                    print(f"    - Front: {card.front}")
-                    print(f"      Back:  {card.back}")
-            if deck.learning_cards:
-                print(f"  Learning cards ({len(deck.learning_cards)}):")
-                for card in deck.learning_cards:
-                    print(f"    - Front: {card.front}")
-                    print(f"      Back:  {card.back}")
-            if deck.review_cards:
-                print(f"  Review cards ({len(deck.review_cards)}):")
-                for card in deck.review_cards:
-                    print(f"    - Front: {card.front}")
-                    print(f"      Back:  {card.back}") 
\ No newline at end of file
+            self._render_deck(deck)
+        out.flush()
+
+    @profiling.timed("presenter.present_stream")
+    def present_stream(self, decks: Iterable[DeckCards]) -> None:
+        """Present decks in the console as they arrive, with the total at the end.
+
+        Consecutive parts of the same deck, such as pages of it, are shown
+        under a single deck heading.
+
+        Args:
+            decks: The decks to present, possibly still being fetched.
+        """
+        out = self._renderer
+        total_cards = 0
+        previous: Optional[str] = None
+        for deck in decks:
+            if total_cards == 0:
+                out.line()
+            self._render_deck(deck, heading=deck.deck_name != previous)
+            previous = deck.deck_name
+            # Write each deck out as soon as it is rendered
+            out.flush()
+            total_cards += deck.total_cards
+
+        if total_cards == 0:
+            out.line("\nNo cards to review today!")
+        else:
+            out.line(f"\nTotal cards to review today: {total_cards}")
+        out.flush()
+
+    def _render_deck(self, deck: DeckCards, heading: bool = True) -> None:
+        """Render a deck and its cards grouped by card type."""
+        out = self._renderer
+        if heading:
+            out.line(f"{deck.deck_name}:")
+        self._render_cards("New", deck.new_cards)
+        self._render_cards("Learning", deck.learning_cards)
+        self._render_cards("Review", deck.review_cards)
+
+    def _render_cards(self, label: str, cards: Sequence[Card]) -> None:
+        """Render one group of cards under its heading."""
+        if not cards:
+            return
+        line = self._renderer.line
+        line(f"  {label} cards ({len(cards)}):")
+        for card in cards:
+            line(f"    - Front: {card.front}")
+            line(f"      Back:  {card.back}")
+
+    @profiling.timed("presenter.present_summary")
+    def present_summary(self, summary: TodaySummary) -> None:
+        """Present the number of cards due per deck in the console.
+
+        Args:
+            summary: The card counts to present.
+        """
+        out = self._renderer
+        if not summary.decks:
+            out.line("\nNo cards to review today!")
+            out.flush()
+            return
+
+        out.line(f"\nTotal cards to review today: {summary.total_cards}")
+        for deck in summary.decks:
+            out.line(
+                f"{deck.deck_name}: {deck.learning_count} learning, {deck.review_count} review"
+            )
+        out.flush()
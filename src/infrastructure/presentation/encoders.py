@@ -0,0 +1,45 @@
+"""JSON encoders used by the machine-readable presenters."""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JsonEncoder = Callable[[Any], str]
+"""Serializes a JSON-compatible value to a single-line string."""
+
+
+def stdlib_encoder(value: Any) -> str:
+    """Serialize a value with the standard library `json` module."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def orjson_encoder(value: Any) -> str:
+    """Serialize a value with orjson."""
+    return orjson.dumps(value).decode("utf-8")
+
+
+def get_json_encoder(name: Optional[str] = "auto") -> JsonEncoder:
+    """Get a JSON encoder by name.
+
+    Args:
+        name: "orjson", "json" or "auto", which picks orjson when it is installed
+
+    Returns:
+        The encoder function
+
+    Raises:
+        ValueError: If the encoder is unknown or orjson was requested but isn't installed
+    """
+    if name in (None, "auto"):
+        return orjson_encoder if orjson is not None else stdlib_encoder
+    if name == "json":
+        return stdlib_encoder
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("The orjson encoder was requested but orjson is not installed")
+        return orjson_encoder
+    raise ValueError(f"Unknown JSON encoder: {name}")
@@ -0,0 +1,82 @@
+"""Buffered text rendering for the console presenters."""
+
+import sys
+from typing import List, Optional, TextIO
+
+from rich.console import Console
+
+from src.infrastructure import profiling
+
+
+class BufferedRenderer:
+    """Collects output lines in memory and writes them out in large chunks.
+
+    Writing line by line costs a markup parse and a flush per line, which
+    dominates when tens of thousands of cards are printed. Lines are instead
+    buffered and written once `buffer_size` characters have been collected.
+
+    When the output is not a terminal, the plain fast path writes the text
+    straight to the stream. On a terminal the buffered text goes through rich,
+    so markup and highlighting look the same as before.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, plain: Optional[bool] = None, buffer_size: int = 64 * 1024):
+        """Initialize the renderer.
+
+        Args:
+            stream: Stream to write to, standard output if not given
+            plain: Whether to skip rich rendering, defaults to True when the stream is not a terminal
+            buffer_size: Number of characters collected before they are written
+        """
+        self._stream = stream
+        self._plain = plain
+        self.buffer_size = buffer_size
+        self._lines: List[str] = []
+        self._pending = 0
+        self._console: Optional[Console] = None
+
+    @property
+    def stream(self) -> TextIO:
+        """Get the stream written to."""
+        return self._stream if self._stream is not None else sys.stdout
+
+    @property
+    def plain(self) -> bool:
+        """Whether output skips rich rendering."""
+        if self._plain is not None:
+            return self._plain
+        isatty = getattr(self.stream, "isatty", None)
+        return not (isatty is not None and isatty())
+
+    def line(self, text: str = "") -> None:
+        """Add a line of output, writing the buffer out once it is full.
+
+        Args:
+            text: The line to add, without a trailing newline
+        """
+        self._lines.append(text)
+        self._pending += len(text) + 1
+        if self._pending >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out all buffered lines."""
+        if not self._lines:
+            return
+
+        with profiling.span("presenter.write", lines=len(self._lines)):
+            text = "\n".join(self._lines)
+            self._lines = []
+            self._pending = 0
+
+            if self.plain:
+                self.stream.write(text + "\n")
+                self.stream.flush()
+            else:
+                self._rich_console().print(text)
+
+    def _rich_console(self) -> Console:
+        """Get the rich console writing to the current stream."""
+        if self._console is None or self._console.file is not self.stream:
+            self._console = Console(file=self.stream)
+        return self._console
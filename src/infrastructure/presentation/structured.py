@@ -0,0 +1,167 @@
+"""Machine-readable presenters writing JSON, NDJSON or CSV."""
+
+import csv
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from src.core.ports import ReviewPresenter
+from src.core.entities import Card, DeckCards, TodayReview, TodaySummary
+from src.infrastructure import profiling
+from .encoders import JsonEncoder, get_json_encoder
+
+CARD_FIELDS = ["deck", "type", "card_id", "front", "back"]
+SUMMARY_FIELDS = ["deck", "learning", "review"]
+
+
+def iter_card_records(deck: DeckCards) -> Iterator[Dict[str, Any]]:
+    """Flatten a deck into one record per card.
+
+    Args:
+        deck: The deck to flatten
+
+    Yields:
+        Dictionaries with the CARD_FIELDS keys
+    """
+    groups = (("new", deck.new_cards), ("learning", deck.learning_cards), ("review", deck.review_cards))
+    for card_type, cards in groups:
+        for card in cards:
+            yield _card_record(deck.deck_name, card_type, card)
+
+
+def _card_record(deck_name: str, card_type: str, card: Card) -> Dict[str, Any]:
+    return {"deck": deck_name, "type": card_type, "card_id": card.card_id, "front": card.front, "back": card.back}
+
+
+def _summary_records(summary: TodaySummary) -> List[Dict[str, Any]]:
+    return [
+        {"deck": deck.deck_name, "learning": deck.learning_count, "review": deck.review_count}
+        for deck in summary.decks
+    ]
+
+
+class _StructuredPresenter(ReviewPresenter):
+    """Base class for presenters writing to a text stream."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """Initialize the presenter.
+
+        Args:
+            stream: Stream to write to, standard output if not given
+        """
+        self._stream = stream
+
+    @property
+    def stream(self) -> TextIO:
+        """Get the stream written to."""
+        return self._stream if self._stream is not None else sys.stdout
+
+
+class JsonPresenter(_StructuredPresenter):
+    """Presents the review as a single JSON document."""
+
+    def __init__(self, stream: Optional[TextIO] = None, encoder: Optional[JsonEncoder] = None):
+        """Initialize the presenter.
+
+        Args:
+            stream: Stream to write to, standard output if not given
+            encoder: JSON encoder, orjson when installed and the standard library otherwise
+        """
+        super().__init__(stream)
+        self._encode = encoder or get_json_encoder()
+
+    @profiling.timed("presenter.present")
+    def present(self, review: TodayReview) -> None:
+        """Write the review as `{"total_cards": N, "cards": [...]}`.
+
+        Args:
+            review: The review information to present.
+        """
+        cards = [record for deck in review.decks for record in iter_card_records(deck)]
+        self._write({"total_cards": len(cards), "cards": cards})
+
+    @profiling.timed("presenter.present_summary")
+    def present_summary(self, summary: TodaySummary) -> None:
+        """Write the counts as `{"total_cards": N, "decks": [...]}`.
+
+        Args:
+            summary: The card counts to present.
+        """
+        self._write({"total_cards": summary.total_cards, "decks": _summary_records(summary)})
+
+    def _write(self, document: Dict[str, Any]) -> None:
+        self.stream.write(self._encode(document) + "\n")
+        self.stream.flush()
+
+
+class NdjsonPresenter(JsonPresenter):
+    """Presents one JSON object per line, one line per card.
+
+    Cards are encoded and written one at a time and every deck is flushed as
+    soon as it has been written, so the output never has to fit in memory.
+    """
+
+    def present(self, review: TodayReview) -> None:
+        """Write one line per card.
+
+        Args:
+            review: The review information to present.
+        """
+        self.present_stream(review.decks)
+
+    @profiling.timed("presenter.present_stream")
+    def present_stream(self, decks: Iterable[DeckCards]) -> None:
+        """Write one line per card, deck by deck as they arrive.
+
+        Args:
+            decks: The decks to present, possibly still being fetched.
+        """
+        encode = self._encode
+        stream = self.stream
+        for deck in decks:
+            for record in iter_card_records(deck):
+                stream.write(encode(record) + "\n")
+            stream.flush()
+
+    def present_summary(self, summary: TodaySummary) -> None:
+        """Write one line per deck with its card counts.
+
+        Args:
+            summary: The card counts to present.
+        """
+        self.stream.write("".join(self._encode(record) + "\n" for record in _summary_records(summary)))
+        self.stream.flush()
+
+
+class CsvPresenter(_StructuredPresenter):
+    """Presents one CSV row per card, after a header row."""
+
+    def present(self, review: TodayReview) -> None:
+        """Write a header and one row per card.
+
+        Args:
+            review: The review information to present.
+        """
+        self.present_stream(review.decks)
+
+    def present_stream(self, decks: Iterable[DeckCards]) -> None:
+        """Write a header and one row per card, deck by deck as they arrive.
+
+        Args:
+            decks: The decks to present, possibly still being fetched.
+        """
+        writer = csv.DictWriter(self.stream, fieldnames=CARD_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        for deck in decks:
+            writer.writerows(iter_card_records(deck))
+            self.stream.flush()
+
+    def present_summary(self, summary: TodaySummary) -> None:
+        """Write a header and one row per deck with its card counts.
+
+        Args:
+            summary: The card counts to present.
+        """
+        writer = csv.DictWriter(self.stream, fieldnames=SUMMARY_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(_summary_records(summary))
+        self.stream.flush()
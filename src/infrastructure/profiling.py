@@ -0,0 +1,318 @@
+"""Lightweight span timing for finding out where a command spends its time.
+
+Code marks a stage with `span`:
+
+    with profiling.span("mapper.to_deck_cards", cards=len(cards)):
+        ...
+
+Spans are only recorded while a Profiler is activated. Otherwise `span`
+returns a shared no-op object, so instrumented code costs one global lookup
+per stage when profiling is off.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import json
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """A timed stage of work."""
+    recording = True
+
+    name: str
+    start: float
+    thread_id: int
+    duration: float = 0.0
+    child_time: float = 0.0
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def self_time(self) -> float:
+        """Get the time spent in this span outside of its child spans."""
+        return max(0.0, self.duration - self.child_time)
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes measured while the span is open."""
+        self.attrs.update(attrs)
+
+
+@dataclass
+class StageStats:
+    """Timing totals of all spans sharing a name."""
+    name: str
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+    max: float = 0.0
+    counters: Dict[str, float] = field(default_factory=dict)
+
+
+class _NoopSpan:
+    """Stands in for a span while profiling is off."""
+
+    recording = False
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class _RecordingSpan:
+    """Context manager timing one span for a profiler."""
+
+    recording = True
+
+    def __init__(self, profiler: "Profiler", name: str, attrs: Dict[str, Any]):
+        self._profiler = profiler
+        self._span = Span(name=name, start=0.0, thread_id=threading.get_ident(), attrs=attrs)
+
+    def __enter__(self) -> Span:
+        self._profiler._enter(self._span)
+        return self._span
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._profiler._exit(self._span)
+
+
+class Profiler:
+    """Records spans and summarizes them per stage.
+
+    Optionally runs cProfile while spans of one stage are open, to see which
+    functions make that stage slow.
+    """
+
+    def __init__(self, cprofile_stage: Optional[str] = None):
+        """Initialize the profiler.
+
+        Args:
+            cprofile_stage: Name of the stage to run cProfile in, if any
+        """
+        self.cprofile_stage = cprofile_stage
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._cprofile_depth = 0
+
+    def span(self, name: str, **attrs: Any) -> _RecordingSpan:
+        """Time a stage of work.
+
+        Args:
+            name: Name of the stage, spans with the same name are summed up
+            attrs: Attributes to attach, numbers are summed per stage
+
+        Returns:
+            A context manager yielding the Span
+        """
+        return _RecordingSpan(self, name, attrs)
+
+    def stages(self) -> List[StageStats]:
+        """Sum up the recorded spans per stage.
+
+        Returns:
+            Stage totals, the stage with the most self time first
+        """
+        stages: Dict[str, StageStats] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            stage = stages.setdefault(span.name, StageStats(name=span.name))
+            stage.calls += 1
+            stage.total += span.duration
+            stage.self_time += span.self_time
+            stage.max = max(stage.max, span.duration)
+            for key, value in span.attrs.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    stage.counters[key] = stage.counters.get(key, 0) + value
+        return sorted(stages.values(), key=lambda stage: stage.self_time, reverse=True)
+
+    def format_report(self) -> str:
+        """Format the per-stage totals as a table.
+
+        Returns:
+            The report text
+        """
+        lines = [f"{'Stage':<32} {'Calls':>6} {'Total ms':>10} {'Self ms':>10} {'Max ms':>10}  Counters"]
+        for stage in self.stages():
+            counters = " ".join(f"{key}={value:g}" for key, value in sorted(stage.counters.items()))
+            lines.append(
+                f"{stage.name:<32} {stage.calls:>6} {stage.total * 1000:>10.2f} "
+                f"{stage.self_time * 1000:>10.2f} {stage.max * 1000:>10.2f}  {counters}"
+            )
+
+        stats = self.cprofile_stats()
+        if stats is not None:
+            output = io.StringIO()
+            stats.stream = output
+            stats.sort_stats("cumulative").print_stats(15)
+            lines.append(f"\ncProfile of {self.cprofile_stage}:")
+            lines.append(output.getvalue().strip("\n"))
+        return "\n".join(lines)
+
+    def write_trace(self, path: str) -> None:
+        """Write the spans as a Chrome trace, viewable in Perfetto or chrome://tracing.
+
+        Args:
+            path: File to write
+        """
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                "name": span.name,
+                "cat": span.name.split(".")[0],
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": 1,
+                "tid": span.thread_id,
+                "args": span.attrs,
+            }
+            for span in spans
+        ]
+        with open(path, "w", encoding="utf-8") as trace:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace, default=str)
+
+    def cprofile_stats(self) -> Optional[pstats.Stats]:
+        """Get the cProfile statistics of the profiled stage, if it ran."""
+        if self._cprofile is None:
+            return None
+        return pstats.Stats(self._cprofile)
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, span: Span) -> None:
+        self._stack().append(span)
+        if span.name == self.cprofile_stage:
+            self._start_cprofile()
+        span.start = time.perf_counter() - self._origin
+
+    def _exit(self, span: Span) -> None:
+        span.duration = time.perf_counter() - self._origin - span.start
+        if span.name == self.cprofile_stage:
+            self._stop_cprofile()
+
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+            if stack:
+                stack[-1].child_time += span.duration
+        elif span in stack:
+            # Interleaved coroutines don't nest, leave their self time alone
+            stack.remove(span)
+        with self._lock:
+            self.spans.append(span)
+
+    def _start_cprofile(self) -> None:
+        with self._lock:
+            self._cprofile_depth += 1
+            if self._cprofile_depth > 1:
+                return
+            if self._cprofile is None:
+                self._cprofile = cProfile.Profile()
+            try:
+                self._cprofile.enable()
+            except ValueError:
+                # Another profiler is already running on this thread
+                self._cprofile_depth -= 1
+
+    def _stop_cprofile(self) -> None:
+        with self._lock:
+            if self._cprofile_depth == 0:
+                return
+            self._cprofile_depth -= 1
+            if self._cprofile_depth == 0:
+                self._cprofile.disable()
+
+
+_active: Optional[Profiler] = None
+
+
+def span(name: str, **attrs: Any):
+    """Time a stage of work with the active profiler.
+
+    Args:
+        name: Name of the stage
+        attrs: Attributes to attach to the span
+
+    Returns:
+        A context manager yielding a Span, or a no-op when profiling is off
+    """
+    profiler = _active
+    if profiler is None:
+        return _NOOP
+    return profiler.span(name, **attrs)
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Get the profiler spans are recorded in, if any."""
+    return _active
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorate a function or coroutine function to run in a span.
+
+    Args:
+        name: Name of the stage
+
+    Returns:
+        The decorator
+    """
+    def decorator(function: F) -> F:
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def activate(profiler: Profiler) -> Iterator[Profiler]:
+    """Record spans in the given profiler while the block runs.
+
+    Args:
+        profiler: The profiler to record in
+
+    Yields:
+        The profiler
+    """
+    global _active
+    previous, _active = _active, profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+
@@ -73,4 +73,30 @@ def test_execute_with_deck_filter(use_case, repository, presenter):
     use_case.execute(deck_name="Test Deck")
 
     repository.get_today_review.assert_called_once_with(deck_name="Test Deck")
-    presenter.present.assert_called_once_with(review) 
\ No newline at end of file
+    presenter.present.assert_called_once_with(review) 
+
+def test_execute_async_with_async_repository(presenter):
+    """Test executing the use case against an asyncio repository."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    review = TodayReview([])
+    repository = Mock()
+    repository.get_today_review = AsyncMock(return_value=review)
+    use_case = AnkiToday(repository=repository, presenter=presenter)
+
+    asyncio.run(use_case.execute_async(deck_name="Test Deck"))
+
+    repository.get_today_review.assert_awaited_once_with(deck_name="Test Deck")
+    presenter.present.assert_called_once_with(review)
+
+
+def test_execute_stream_passes_deck_iterator(use_case, repository, presenter):
+    """Test that streaming hands the repository's deck iterator to the presenter."""
+    decks = iter([DeckCards("Deck", [], [], [])])
+    repository.iter_today_review.return_value = decks
+
+    use_case.execute_stream(deck_name="Deck")
+
+    repository.iter_today_review.assert_called_once_with(deck_name="Deck")
+    presenter.present_stream.assert_called_once_with(decks)
@@ -32,7 +32,7 @@ def test_execute_with_default_parameters(use_case, repository, presenter):
 
     use_case.execute()
 
-    repository.get_all_cards.assert_called_once_with(limit=20, offset=0, deck_name=None, random=False)
+    repository.get_all_cards.assert_called_once_with(limit=20, offset=0, deck_name=None, random=False, seed=None, weight=None)
     presenter.present.assert_called_once_with(review)
 
 
@@ -43,5 +43,36 @@ def test_execute_with_custom_parameters(use_case, repository, presenter):
 
     use_case.execute(limit=10, offset=5, deck="Test Deck", random=True)
 
-    repository.get_all_cards.assert_called_once_with(limit=10, offset=5, deck_name="Test Deck", random=True)
-    presenter.present.assert_called_once_with(review) 
\ No newline at end of file
+    repository.get_all_cards.assert_called_once_with(limit=10, offset=5, deck_name="Test Deck", random=True, seed=None, weight=None)
+    presenter.present.assert_called_once_with(review) 
+
+def test_execute_async_with_async_repository(presenter):
+    """Test executing the use case against an asyncio repository."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    review = TodayReview([])
+    repository = Mock()
+    repository.get_all_cards = AsyncMock(return_value=review)
+    use_case = AnkiList(repository=repository, presenter=presenter)
+
+    asyncio.run(use_case.execute_async(limit=10, offset=5, deck="Test Deck", random=True))
+
+    repository.get_all_cards.assert_awaited_once_with(limit=10, offset=5, deck_name="Test Deck", random=True, seed=None, weight=None)
+    presenter.present.assert_called_once_with(review)
+
+
+def test_execute_pages_stops_after_max_pages(use_case, repository, presenter):
+    """Test that paging presents the requested pages and returns the next cursor."""
+    from src.core.entities import CardPage, DeckCards
+
+    pages = [
+        CardPage(DeckCards("History", ["a"], [], []), cursor="first"),
+        CardPage(DeckCards("History", [], [], []), cursor="second"),
+        CardPage(DeckCards("Math", ["b"], [], []), cursor=None),
+    ]
+    repository.iter_card_pages.return_value = iter(pages)
+    presenter.present_stream.side_effect = list
+
+    assert use_case.execute_pages(page_size=1, max_pages=2) == "second"
+    repository.iter_card_pages.assert_called_once_with(deck_name=None, page_size=1, cursor=None)
@@ -0,0 +1,56 @@
+"""Tests for the AnkiTodaySummary use case."""
+
+from unittest.mock import Mock
+import pytest
+
+from src.core.ports import CardRepository, ReviewPresenter
+from src.core.entities import DeckCards, DeckSummary, TodayReview, TodaySummary
+from src.application.use_cases.today_summary import AnkiTodaySummary
+
+
+@pytest.fixture
+def repository():
+    """Create a mock repository."""
+    return Mock(spec=CardRepository)
+
+
+@pytest.fixture
+def presenter():
+    """Create a mock presenter."""
+    return Mock(spec=ReviewPresenter)
+
+
+@pytest.fixture
+def use_case(repository, presenter):
+    """Create an instance of AnkiTodaySummary use case."""
+    return AnkiTodaySummary(repository=repository, presenter=presenter)
+
+
+def test_execute_presents_summary(use_case, repository, presenter):
+    """Test that the summary is fetched and handed to the presenter."""
+    summary = TodaySummary([DeckSummary("Test Deck", learning_count=2, review_count=3)])
+    repository.get_today_summary.return_value = summary
+
+    use_case.execute(deck_name="Test Deck")
+
+    repository.get_today_summary.assert_called_once_with(deck_name="Test Deck")
+    presenter.present_summary.assert_called_once_with(summary)
+    repository.get_today_review.assert_not_called()
+
+
+def test_default_summary_falls_back_to_review():
+    """Test that repositories without a counting query derive the summary from the review."""
+    class ReviewOnlyRepository(CardRepository):
+        def get_today_review(self, deck_name=None):
+            return TodayReview([DeckCards("Deck", new_cards=[], learning_cards=["a"], review_cards=["b", "c"])])
+
+        def get_all_cards(self, limit=20, offset=0, deck_name=None, random=False):
+            return TodayReview([])
+
+        def iter_card_pages(self, deck_name=None, page_size=500, cursor=None):
+            return iter([])
+
+    summary = ReviewOnlyRepository().get_today_summary()
+
+    assert summary == TodaySummary([DeckSummary("Deck", learning_count=1, review_count=2)])
+    assert summary.total_cards == 3
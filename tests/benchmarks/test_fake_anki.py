@@ -0,0 +1,51 @@
+"""Tests for the fake AnkiConnect server used by the benchmarks."""
+
+import pytest
+
+from benchmarks.fake_anki import FakeAnkiConnect
+from benchmarks.synthetic import CollectionSpec, SyntheticCollection
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.anki_connect.repository import AnkiConnectCardRepository
+
+
+@pytest.fixture
+def fake():
+    """Serve a small synthetic collection."""
+    with FakeAnkiConnect(SyntheticCollection(CollectionSpec(cards=200, decks=4))) as fake:
+        yield fake
+
+
+def test_fake_answers_client_actions(fake):
+    """Test that the real client can talk to the fake."""
+    client = AnkiConnectClient(base_url=fake.url)
+
+    deck_names = client.get_deck_names()
+    due = client.find_cards("is:due")
+    cards = client.get_cards_info(due[:3])
+
+    assert deck_names == ["Default", "Deck 0000", "Deck 0001", "Deck 0002", "Deck 0003"]
+    assert [card["cardId"] for card in cards] == due[:3]
+    assert client.get_cards_mod_time(due[:1])[0]["cardId"] == due[0]
+    assert client.find_cards_many(["is:due"]) == [due]
+
+
+def test_repository_against_fake_matches_collection(fake):
+    """Test that the repository sees every due card of the synthetic collection."""
+    repository = AnkiConnectCardRepository(AnkiConnectClient(base_url=fake.url), AnkiCardMapper())
+
+    review = repository.get_today_review()
+    summary = repository.get_today_summary()
+
+    assert len(review.decks) == 4
+    assert review.total_cards == len(fake.collection.card_ids(range(4), {1, 2}))
+    assert summary.total_cards == review.total_cards
+    assert fake.requests["multi"] >= 1
+
+
+def test_fake_reports_unsupported_search(fake):
+    """Test that unknown search terms come back as AnkiConnect errors."""
+    client = AnkiConnectClient(base_url=fake.url)
+
+    with pytest.raises(RuntimeError, match="AnkiConnect error: unsupported search term"):
+        client.find_cards("tag:leech")
@@ -0,0 +1,67 @@
+"""Tests for the seeded collection generator used by the benchmarks."""
+
+import time
+
+from benchmarks.fake_anki import FakeAnkiConnect
+from benchmarks.generator import GeneratorSpec, MODELS, generate, load_json, write_collection, write_json
+from benchmarks.synthetic import DUE, LEARNING
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.anki_connect.repository import AnkiConnectCardRepository
+from src.infrastructure.persistence.collection.repository import CollectionCardRepository
+
+NOW = time.time()
+SPEC = GeneratorSpec(cards=2000, decks=30, depth=3, seed=7)
+
+
+def test_same_seed_generates_same_collection():
+    """Test that a spec and time fully determine the collection."""
+    first = generate(SPEC, now=NOW)
+    second = generate(SPEC, now=NOW)
+    other = generate(GeneratorSpec(cards=2000, decks=30, depth=3, seed=8), now=NOW)
+
+    assert first.cards == second.cards
+    assert first.decks == second.decks
+    assert first.cards != other.cards
+
+
+def test_collection_shape():
+    """Test the decks, note models and card states of a generated collection."""
+    collection = generate(SPEC, now=NOW)
+
+    assert len(collection.cards) == SPEC.cards
+    assert max(name.count("::") for name in collection.decks.values()) == SPEC.depth - 1
+    assert {card.model_id for card in collection.cards} == set(MODELS)
+    assert {card.queue for card in collection.cards} >= {-3, -2, -1, 0, 1, 2, 3}
+    assert any(card.original_deck_id for card in collection.cards)
+    polish = next(collection.card_info(card.card_id) for card in collection.cards if MODELS[card.model_id][0] == "Polish-English")
+    assert list(polish["fields"]) == ["Polish word", "Word translation", "Polish example"]
+
+
+def test_json_fixture_round_trip(tmp_path):
+    """Test that a JSON fixture loads back into the same collection."""
+    collection = generate(SPEC, now=NOW)
+    path = str(tmp_path / "cards.json")
+
+    write_json(collection, path)
+    loaded = load_json(path, now=NOW)
+
+    assert loaded.cards == collection.cards
+    assert loaded.decks == collection.decks
+    assert loaded.find_cards(None, {LEARNING, DUE}) == collection.find_cards(None, {LEARNING, DUE})
+
+
+def test_collection_file_and_fake_agree(tmp_path):
+    """Test that the SQLite file and the fake serving the same cards report the same review."""
+    collection = generate(SPEC, now=NOW)
+    path = str(tmp_path / "collection.anki2")
+    write_collection(collection, path)
+
+    from_file = CollectionCardRepository(path, AnkiCardMapper()).get_today_review()
+    with FakeAnkiConnect(collection) as fake:
+        repository = AnkiConnectCardRepository(AnkiConnectClient(base_url=fake.url), AnkiCardMapper())
+        from_fake = repository.get_today_review()
+
+    assert from_file.total_cards > 0
+    assert [(deck.deck_name, deck.total_cards) for deck in from_file.decks] == \
+        [(deck.deck_name, deck.total_cards) for deck in from_fake.decks]
@@ -0,0 +1,93 @@
+import dataclasses
+import unittest
+from src.core.entities import Card, CardBatch, DeckCards
+
+CARDS = [Card(front="kot", back="cat", card_id=1), Card(front="", back="empty front"), Card(front="żółw", back="", card_id=3)]
+
+
+class TestCard(unittest.TestCase):
+    def test_card_is_frozen_and_slotted(self):
+        """Test that cards can't be changed and don't carry a __dict__."""
+        card = Card(front="front", back="back")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            card.front = "changed"
+        self.assertFalse(hasattr(card, "__dict__"))
+
+
+class TestCardBatch(unittest.TestCase):
+    def test_iterates_as_cards(self):
+        """Test that a batch gives back the cards it was built from, in order."""
+        batch = CardBatch.of(CARDS)
+        self.assertEqual(list(batch), CARDS)
+        self.assertEqual(len(batch), 3)
+
+    def test_indexing(self):
+        """Test indexing and slicing a batch."""
+        batch = CardBatch.of(CARDS)
+        self.assertEqual(batch[0], CARDS[0])
+        self.assertEqual(batch[-1], CARDS[-1])
+        self.assertEqual(batch[1:], CARDS[1:])
+        with self.assertRaises(IndexError):
+            batch[3]
+
+    def test_compares_with_lists(self):
+        """Test that a batch equals a list of the same cards."""
+        self.assertEqual(CardBatch.of(CARDS), CARDS)
+        self.assertEqual(CardBatch(), [])
+        self.assertNotEqual(CardBatch.of(CARDS), CARDS[:2])
+
+    def test_concat(self):
+        """Test joining batches, and batches with lists."""
+        first, second = CardBatch.of(CARDS[:1]), CardBatch.of(CARDS[1:])
+        self.assertEqual(CardBatch.concat([first, CardBatch(), second]), CARDS)
+        self.assertEqual(first + CARDS[1:], CARDS)
+        self.assertEqual(CARDS[:1] + second, CARDS)
+
+    def test_columns_must_have_the_same_length(self):
+        """Test that columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            CardBatch(["front"], [], [None])
+
+    def test_deferred_resolves_once_on_first_read(self):
+        """Test that a deferred batch counts its cards without resolving them, and resolves them only once."""
+        calls = []
+
+        def resolve():
+            calls.append(True)
+            return [card.front for card in CARDS], [card.back for card in CARDS]
+
+        batch = CardBatch.deferred([card.card_id for card in CARDS], resolve)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(calls, [])
+        self.assertEqual(list(batch), CARDS)
+        self.assertEqual(batch[1], CARDS[1])
+        self.assertEqual(calls, [True])
+
+    def test_concat_of_deferred_batches_stays_deferred(self):
+        """Test that joining a deferred batch doesn't resolve it."""
+        calls = []
+
+        def resolve():
+            calls.append(True)
+            return [CARDS[0].front], [CARDS[0].back]
+
+        batch = CardBatch.concat([CardBatch.deferred([CARDS[0].card_id], resolve), CardBatch.of(CARDS[1:])])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(calls, [])
+        self.assertEqual(batch, CARDS)
+        self.assertEqual(calls, [True])
+
+    def test_deferred_checks_resolved_lengths(self):
+        """Test that a resolver returning the wrong number of cards is caught when the batch is read."""
+        batch = CardBatch.deferred([1, 2], lambda: (["front"], ["back"]))
+        with self.assertRaises(ValueError):
+            list(batch)
+
+    def test_deck_total_cards(self):
+        """Test that a deck of batches counts its cards."""
+        deck = DeckCards(deck_name="Deck", new_cards=CardBatch.of(CARDS), learning_cards=CardBatch(), review_cards=CARDS[:1])
+        self.assertEqual(deck.total_cards, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Test fixtures for building collection.anki2 files."""
+
+import json
+import sqlite3
+import time
+
+DAY = 86400
+
+# Collection created 100 days ago, so review cards due on day 100 are due today
+CREATED = int(time.time()) - 100 * DAY - 3600
+TODAY = 100
+
+BASIC_MODEL_ID = 1
+POLISH_MODEL_ID = 2
+
+MODELS = {
+    BASIC_MODEL_ID: ("Basic", ["Front", "Back"]),
+    POLISH_MODEL_ID: ("Polish-English", ["Polish word", "Word translation", "Polish example"]),
+}
+
+DECKS = {
+    1: "Default",
+    10: "Programming",
+    11: "Programming::Python",
+    20: "History",
+}
+
+# (card id, deck id, model id, fields, type, queue, due)
+CARDS = [
+    (1001, 10, BASIC_MODEL_ID, ["What is Python?", "A programming language"], 0, 0, 1),
+    (1002, 11, BASIC_MODEL_ID, ["What is a decorator?", "A function that modifies other functions"], 1, 1, CREATED),
+    (1003, 11, BASIC_MODEL_ID, ["What is a generator?", "A lazy iterator"], 2, 2, TODAY - 1),
+    (1004, 10, BASIC_MODEL_ID, ["What is a list?", "A sequence"], 2, 2, TODAY + 5),
+    (2001, 20, BASIC_MODEL_ID, ["Who was Julius Caesar?", "A Roman emperor"], 2, 2, TODAY),
+    (2002, 20, POLISH_MODEL_ID, ["marynarz", "mariners", "Przyklad"], 2, 3, TODAY),
+    (2003, 20, BASIC_MODEL_ID, ["Suspended card", "Never shown"], 2, -1, TODAY),
+]
+
+
+def create_collection(path, legacy=False, cards=CARDS, decks=DECKS, models=MODELS, created=CREATED):
+    """Write a minimal collection.anki2 file.
+
+    Args:
+        path: Where to write the file
+        legacy: Store decks and models as JSON in the `col` table (schema 11)
+            instead of the separate tables newer Anki versions use
+        cards: Card rows, see CARDS
+        decks: Deck names by ID
+        models: Model name and field names by ID
+        created: Collection creation time in seconds
+    """
+    connection = sqlite3.connect(str(path))
+    connection.executescript("""
+        CREATE TABLE col (id integer primary key, crt integer not null, mod integer not null,
+                          models text not null, decks text not null);
+        CREATE TABLE notes (id integer primary key, mid integer not null, mod integer not null,
+                            flds text not null);
+        CREATE TABLE cards (id integer primary key, nid integer not null, did integer not null,
+                            ord integer not null, mod integer not null, type integer not null,
+                            queue integer not null, due integer not null, ivl integer not null,
+                            factor integer not null, reps integer not null, lapses integer not null,
+                            left integer not null, odue integer not null, odid integer not null);
+        CREATE INDEX ix_cards_nid ON cards (nid);
+        CREATE INDEX ix_cards_sched ON cards (did, queue, due);
+    """)
+
+    if legacy:
+        legacy_models = {
+            str(model_id): {"name": name, "flds": [{"name": field, "ord": order} for order, field in enumerate(fields)]}
+            for model_id, (name, fields) in models.items()
+        }
+        legacy_decks = {str(deck_id): {"name": name} for deck_id, name in decks.items()}
+        connection.execute("INSERT INTO col VALUES (1, ?, 0, ?, ?)", (created, json.dumps(legacy_models), json.dumps(legacy_decks)))
+    else:
+        connection.execute("INSERT INTO col VALUES (1, ?, 0, '', '')", (created,))
+        connection.executescript("""
+            CREATE TABLE decks (id integer primary key, name text not null);
+            CREATE TABLE notetypes (id integer primary key, name text not null);
+            CREATE TABLE fields (ntid integer not null, ord integer not null, name text not null,
+                                 primary key (ntid, ord));
+        """)
+        connection.executemany("INSERT INTO decks VALUES (?, ?)", [(deck_id, name.replace("::", "\x1f")) for deck_id, name in decks.items()])
+        connection.executemany("INSERT INTO notetypes VALUES (?, ?)", [(model_id, name) for model_id, (name, _) in models.items()])
+        connection.executemany(
+            "INSERT INTO fields VALUES (?, ?, ?)",
+            [(model_id, order, field) for model_id, (_, fields) in models.items() for order, field in enumerate(fields)]
+        )
+
+    for card_id, deck_id, model_id, fields, card_type, queue, due in cards:
+        connection.execute("INSERT INTO notes VALUES (?, ?, 0, ?)", (card_id, model_id, "\x1f".join(fields)))
+        connection.execute(
+            "INSERT INTO cards VALUES (?, ?, ?, 0, 0, ?, ?, ?, 1, 2500, 1, 0, 0, 0, 0)",
+            (card_id, card_id, deck_id, card_type, queue, due)
+        )
+
+    connection.commit()
+    connection.close()
+    return str(path)
@@ -0,0 +1,94 @@
+"""Tests for AsyncAnkiConnectCardRepository."""
+
+import asyncio
+from unittest import TestCase
+from unittest.mock import AsyncMock, Mock
+
+from src.core.entities import TodayReview, DeckCards, Card
+from src.infrastructure.persistence.anki_connect.async_repository import AsyncAnkiConnectCardRepository
+
+
+class TestAsyncAnkiConnectCardRepository(TestCase):
+    """Tests for AsyncAnkiConnectCardRepository."""
+
+    def setUp(self):
+        """Set up test dependencies."""
+        self.mock_client = Mock()
+        self.mock_client.get_deck_names = AsyncMock()
+        self.mock_client.find_cards = AsyncMock()
+        self.mock_client.get_cards_info = AsyncMock()
+        self.mock_mapper = Mock()
+        self.mock_mapper.to_deck_cards.side_effect = lambda name, cards: DeckCards(
+            deck_name=name,
+            new_cards=[Card(front=str(card["id"]), back="") for card in cards],
+            learning_cards=[],
+            review_cards=[]
+        )
+        self.repository = AsyncAnkiConnectCardRepository(self.mock_client, self.mock_mapper, max_concurrency=2)
+
+    def test_get_today_review_queries_every_main_deck(self):
+        """Test that every main deck is queried and results keep deck order."""
+        self.mock_client.get_deck_names.return_value = ["B", "A", "A::Sub", "C"]
+        self.mock_client.find_cards.side_effect = lambda query: {"A": [1], "B": [], "C": [2, 3]}[query.split('"')[1]]
+        self.mock_client.get_cards_info.side_effect = lambda card_ids: [{"id": card_id} for card_id in card_ids]
+
+        result = asyncio.run(self.repository.get_today_review())
+
+        self.assertIsInstance(result, TodayReview)
+        self.assertEqual([deck.deck_name for deck in result.decks], ["A", "C"])
+        self.assertCountEqual(
+            [c.args[0] for c in self.mock_client.find_cards.await_args_list],
+            ['deck:"A" is:due', 'deck:"B" is:due', 'deck:"C" is:due']
+        )
+
+    def test_get_today_review_with_specific_deck(self):
+        """Test getting today's review for a specific deck."""
+        self.mock_client.find_cards.return_value = [1, 2]
+        self.mock_client.get_cards_info.return_value = [{"id": 1}, {"id": 2}]
+
+        result = asyncio.run(self.repository.get_today_review(deck_name="Test Deck"))
+
+        self.assertEqual(len(result.decks), 1)
+        self.mock_client.get_deck_names.assert_not_awaited()
+        self.mock_client.find_cards.assert_awaited_once_with('deck:"Test Deck" is:due')
+
+    def test_get_all_cards_with_limit_and_offset(self):
+        """Test that limit and offset are applied per deck before fetching details."""
+        self.mock_client.get_deck_names.return_value = ["Test Deck"]
+        self.mock_client.find_cards.return_value = [1, 2, 3, 4, 5]
+        self.mock_client.get_cards_info.return_value = [{"id": 2}, {"id": 3}]
+
+        asyncio.run(self.repository.get_all_cards(limit=2, offset=1))
+
+        self.mock_client.find_cards.assert_awaited_once_with('deck:"Test Deck"')
+        self.mock_client.get_cards_info.assert_awaited_once_with([2, 3])
+
+    def test_get_all_cards_empty_deck(self):
+        """Test that empty decks skip the cardsInfo request."""
+        self.mock_client.get_deck_names.return_value = ["Test Deck"]
+        self.mock_client.find_cards.return_value = []
+
+        result = asyncio.run(self.repository.get_all_cards())
+
+        self.assertEqual(result.decks, [])
+        self.mock_client.get_cards_info.assert_not_awaited()
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more decks than max_concurrency are fetched at once."""
+        running = 0
+        peak = 0
+
+        async def find_cards(query):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        self.mock_client.get_deck_names.return_value = ["A", "B", "C", "D", "E"]
+        self.mock_client.find_cards.side_effect = find_cards
+
+        asyncio.run(self.repository.get_today_review())
+
+        self.assertEqual(peak, 2)
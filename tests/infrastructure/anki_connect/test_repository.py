@@ -1,9 +1,9 @@
 """Tests for AnkiConnectCardRepository."""
 
 from unittest import TestCase
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 from src.core.entities import TodayReview, DeckCards, Card
-from src.infrastructure.persistence.anki_connect import AnkiConnectCardRepository
+from src.infrastructure.persistence.anki_connect import AnkiConnectCardRepository, TodayQueryPlanner
 
 
 class TestAnkiConnectCardRepository(TestCase):
@@ -24,42 +24,42 @@ class TestAnkiConnectCardRepository(TestCase):
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 0)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_not_called()
+        self.mock_client.find_cards_many.assert_not_called()
 
     def test_get_cards_deck_with_no_cards(self):
         """Test getting cards when deck exists but has no cards."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = []
+        self.mock_client.find_cards_many.return_value = [[]]
 
         result = self.repository.get_today_review()
 
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 0)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck" is:due')
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck" is:due'])
 
     def test_get_cards_deck_with_failed_card_info(self):
         """Test getting cards when card info retrieval fails."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = [1, 2, 3]
-        self.mock_client.get_cards_info.return_value = []
+        self.mock_client.find_cards_many.return_value = [[1, 2, 3]]
+        self.mock_client.get_cards_info_many.return_value = [[]]
 
         result = self.repository.get_today_review()
 
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 0)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck" is:due')
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck" is:due'])
 
     def test_get_cards_deck_with_all_card_types(self):
         """Test getting cards when deck has all types of cards."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = [1, 2, 3]
-        self.mock_client.get_cards_info.return_value = [
+        self.mock_client.find_cards_many.return_value = [[1, 2, 3]]
+        self.mock_client.get_cards_info_many.return_value = [[
             {"id": 1, "type": 0},
             {"id": 2, "type": 1},
             {"id": 3, "type": 2}
-        ]
+        ]]
         self.mock_mapper.to_deck_cards.return_value = DeckCards(
             deck_name="Test Deck",
             new_cards=[Card(front="new", back="new answer")],
@@ -72,7 +72,7 @@ class TestAnkiConnectCardRepository(TestCase):
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 1)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck" is:due')
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck" is:due'])
 
     def test_get_today_review_filters_subdecks(self):
         """Test that get_today_review filters sub-decks and shows cards under main decks."""
@@ -84,11 +84,10 @@ class TestAnkiConnectCardRepository(TestCase):
             "Languages",
             "Languages::English"
         ]
-        self.mock_client.find_cards.return_value = [1, 2, 3]
-        self.mock_client.get_cards_info.return_value = [
-            {"id": 1, "deck": "Programming::Python"},
-            {"id": 2, "deck": "Programming::PHP"},
-            {"id": 3, "deck": "Languages::English"}
+        self.mock_client.find_cards_many.return_value = [[3], [1, 2]]
+        self.mock_client.get_cards_info_many.return_value = [
+            [{"id": 3, "deck": "Languages::English"}],
+            [{"id": 1, "deck": "Programming::Python"}, {"id": 2, "deck": "Programming::PHP"}]
         ]
         
         # Set up mapper to return decks with cards
@@ -111,14 +110,11 @@ class TestAnkiConnectCardRepository(TestCase):
 
         # Verify
         self.assertGreater(len(result.decks), 0)
-        # Verify we query for both main decks (order doesn't matter)
-        expected_calls = [
-            call('deck:"Programming" is:due'),
-            call('deck:"Languages" is:due')
-        ]
-        actual_calls = self.mock_client.find_cards.call_args_list
-        self.assertEqual(len(actual_calls), 2)
-        self.assertCountEqual(expected_calls, actual_calls)
+        # Verify we query for both main decks in a single batched request
+        self.mock_client.find_cards_many.assert_called_once()
+        queries = self.mock_client.find_cards_many.call_args[0][0]
+        self.assertCountEqual(queries, ['deck:"Programming" is:due', 'deck:"Languages" is:due'])
+        self.mock_client.get_cards_info_many.assert_called_once_with([[3], [1, 2]])
         # Verify the deck names in the result are main decks
         deck_names = [deck.deck_name for deck in result.decks]
         self.assertTrue(all("::" not in name for name in deck_names))
@@ -126,12 +122,12 @@ class TestAnkiConnectCardRepository(TestCase):
     def test_get_all_cards_with_default_parameters(self):
         """Test getting all cards with default parameters."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = [1, 2, 3]
-        self.mock_client.get_cards_info.return_value = [
+        self.mock_client.find_cards_many.return_value = [[1, 2, 3]]
+        self.mock_client.get_cards_info_many.return_value = [[
             {"id": 1, "type": 0},
             {"id": 2, "type": 1},
             {"id": 3, "type": 2}
-        ]
+        ]]
         self.mock_mapper.to_deck_cards.return_value = DeckCards(
             deck_name="Test Deck",
             new_cards=[Card(front="new", back="new answer")],
@@ -144,16 +140,16 @@ class TestAnkiConnectCardRepository(TestCase):
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 1)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck"')
-        self.mock_client.get_cards_info.assert_called_once_with([1, 2, 3])
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck"'])
+        self.mock_client.get_cards_info_many.assert_called_once_with([[1, 2, 3]])
 
     def test_get_all_cards_with_specific_deck(self):
         """Test getting cards from a specific deck."""
-        self.mock_client.find_cards.return_value = [1, 2]
-        self.mock_client.get_cards_info.return_value = [
+        self.mock_client.find_cards_many.return_value = [[1, 2]]
+        self.mock_client.get_cards_info_many.return_value = [[
             {"id": 1, "type": 0},
             {"id": 2, "type": 1}
-        ]
+        ]]
         self.mock_mapper.to_deck_cards.return_value = DeckCards(
             deck_name="Test Deck",
             new_cards=[Card(front="new", back="new answer")],
@@ -166,17 +162,17 @@ class TestAnkiConnectCardRepository(TestCase):
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 1)
         self.mock_client.get_deck_names.assert_not_called()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck"')
-        self.mock_client.get_cards_info.assert_called_once_with([1, 2])
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck"'])
+        self.mock_client.get_cards_info_many.assert_called_once_with([[1, 2]])
 
     def test_get_all_cards_with_limit_and_offset(self):
         """Test getting cards with limit and offset."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = [1, 2, 3, 4, 5]
-        self.mock_client.get_cards_info.return_value = [
+        self.mock_client.find_cards_many.return_value = [[1, 2, 3, 4, 5]]
+        self.mock_client.get_cards_info_many.return_value = [[
             {"id": 2, "type": 0},
             {"id": 3, "type": 1}
-        ]
+        ]]
         self.mock_mapper.to_deck_cards.return_value = DeckCards(
             deck_name="Test Deck",
             new_cards=[Card(front="new", back="new answer")],
@@ -189,30 +185,30 @@ class TestAnkiConnectCardRepository(TestCase):
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 1)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck"')
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck"'])
         # Verify that we're getting info for cards after applying limit and offset
-        self.mock_client.get_cards_info.assert_called_once_with([2, 3])
+        self.mock_client.get_cards_info_many.assert_called_once_with([[2, 3]])
 
     def test_get_all_cards_empty_deck(self):
         """Test getting cards when deck is empty."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = []
+        self.mock_client.find_cards_many.return_value = [[]]
 
         result = self.repository.get_all_cards()
 
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 0)
         self.mock_client.get_deck_names.assert_called_once()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck"')
-        self.mock_client.get_cards_info.assert_not_called()
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck"'])
+        self.mock_client.get_cards_info_many.assert_not_called()
 
     def test_get_today_review_with_specific_deck(self):
         """Test getting today's review for a specific deck."""
-        self.mock_client.find_cards.return_value = [1, 2]
-        self.mock_client.get_cards_info.return_value = [
+        self.mock_client.find_cards_many.return_value = [[1, 2]]
+        self.mock_client.get_cards_info_many.return_value = [[
             {"id": 1, "type": 0},
             {"id": 2, "type": 1}
-        ]
+        ]]
         self.mock_mapper.to_deck_cards.return_value = DeckCards(
             deck_name="Test Deck",
             new_cards=[Card(front="new", back="new answer")],
@@ -225,17 +221,17 @@ class TestAnkiConnectCardRepository(TestCase):
         self.assertIsInstance(result, TodayReview)
         self.assertEqual(len(result.decks), 1)
         self.mock_client.get_deck_names.assert_not_called()
-        self.mock_client.find_cards.assert_called_once_with('deck:"Test Deck" is:due')
-        self.mock_client.get_cards_info.assert_called_once_with([1, 2])
+        self.mock_client.find_cards_many.assert_called_once_with(['deck:"Test Deck" is:due'])
+        self.mock_client.get_cards_info_many.assert_called_once_with([[1, 2]])
 
     def test_get_all_cards_with_random_order(self):
         """Test getting cards with random order."""
         self.mock_client.get_deck_names.return_value = ["Test Deck"]
-        self.mock_client.find_cards.return_value = [1, 2, 3, 4, 5]
-        self.mock_client.get_cards_info.return_value = [
+        self.mock_client.find_cards_many.return_value = [[1, 2, 3, 4, 5]]
+        self.mock_client.get_cards_info_many.return_value = [[
             {"id": 1, "type": 0},
             {"id": 2, "type": 1}
-        ]
+        ]]
         self.mock_mapper.to_deck_cards.return_value = DeckCards(
             deck_name="Test Deck",
             new_cards=[Card(front="new", back="new answer")],
@@ -252,8 +248,154 @@ class TestAnkiConnectCardRepository(TestCase):
             self.assertIsInstance(result, TodayReview)
             self.assertEqual(len(result.decks), 1)
 
-        # Verify that get_cards_info was called with different card_id combinations
-        calls = self.mock_client.get_cards_info.call_args_list
-        card_id_sets = [set(call[0][0]) for call in calls]
+        # Verify that get_cards_info_many was called with different card_id combinations
+        calls = self.mock_client.get_cards_info_many.call_args_list
+        card_id_sets = [set(call[0][0][0]) for call in calls]
         # At least one pair of sets should be different (due to randomization)
-        self.assertTrue(any(s1 != s2 for s1, s2 in zip(card_id_sets, card_id_sets[1:]))) 
\ No newline at end of file
+        self.assertTrue(any(s1 != s2 for s1, s2 in zip(card_id_sets, card_id_sets[1:]))) 
+
+    def test_get_today_review_global_plan_groups_by_main_deck(self):
+        """Test that the global plan issues one query and buckets cards by top-level deck."""
+        self.repository = AnkiConnectCardRepository(
+            self.mock_client, self.mock_mapper, TodayQueryPlanner(min_decks_for_global=2)
+        )
+        self.mock_client.get_deck_names.return_value = ["Programming", "Programming::Python", "Languages"]
+        self.mock_client.find_cards.return_value = [1, 2, 3]
+        self.mock_client.iter_cards_info.return_value = iter([
+            [{"cardId": 1, "deckName": "Programming::Python"}, {"cardId": 2, "deckName": "Languages"}],
+            [{"cardId": 3, "deckName": "Programming"}]
+        ])
+        self.mock_mapper.to_deck_cards.side_effect = lambda name, cards: DeckCards(
+            deck_name=name,
+            new_cards=[Card(front=str(card["cardId"]), back="") for card in cards],
+            learning_cards=[],
+            review_cards=[]
+        )
+
+        result = self.repository.get_today_review()
+
+        self.mock_client.find_cards.assert_called_once_with("is:due")
+        self.mock_client.iter_cards_info.assert_called_once_with([1, 2, 3])
+        self.mock_client.find_cards_many.assert_not_called()
+        self.assertEqual([deck.deck_name for deck in result.decks], ["Languages", "Programming"])
+        self.assertEqual([card.front for card in result.decks[1].new_cards], ["1", "3"])
+
+    def test_get_today_review_global_plan_no_due_cards(self):
+        """Test that the global plan skips cardsInfo when nothing is due."""
+        self.repository = AnkiConnectCardRepository(
+            self.mock_client, self.mock_mapper, TodayQueryPlanner(min_decks_for_global=2)
+        )
+        self.mock_client.get_deck_names.return_value = ["A", "B"]
+        self.mock_client.find_cards.return_value = []
+
+        result = self.repository.get_today_review()
+
+        self.assertEqual(result.decks, [])
+        self.mock_client.iter_cards_info.assert_not_called()
+
+    def test_get_today_review_switches_to_global_plan_when_sparse(self):
+        """Test that a sparse previous result makes the next run use the global plan."""
+        self.mock_client.get_deck_names.return_value = ["A", "B", "C"]
+        self.mock_client.find_cards_many.return_value = [[], [], []]
+        self.mock_client.find_cards.return_value = []
+
+        self.repository.get_today_review()
+        self.repository.get_today_review()
+
+        self.mock_client.find_cards_many.assert_called_once()
+        self.mock_client.find_cards.assert_called_once_with("is:due")
+
+    def test_get_today_summary_counts_without_cards_info(self):
+        """Test that the summary is built from ID list lengths in one batched request."""
+        self.mock_client.get_deck_names.return_value = ["Programming", "Programming::Python", "History"]
+        self.mock_client.find_cards_many.return_value = [
+            [], [],
+            [1], [2, 3]
+        ]
+
+        result = self.repository.get_today_summary()
+
+        self.mock_client.find_cards_many.assert_called_once_with([
+            'deck:"History" is:due is:learn',
+            'deck:"History" is:due is:review -is:learn',
+            'deck:"Programming" is:due is:learn',
+            'deck:"Programming" is:due is:review -is:learn',
+        ])
+        self.mock_client.get_cards_info.assert_not_called()
+        self.mock_client.get_cards_info_many.assert_not_called()
+        self.assertEqual(len(result.decks), 1)
+        deck = result.decks[0]
+        self.assertEqual(deck.deck_name, "Programming")
+        self.assertEqual((deck.learning_count, deck.review_count), (1, 2))
+        self.assertEqual(result.total_cards, 3)
+
+    def test_get_today_summary_with_specific_deck(self):
+        """Test counting cards for a specific deck."""
+        self.mock_client.find_cards_many.return_value = [[], [1]]
+
+        result = self.repository.get_today_summary(deck_name="Test Deck")
+
+        self.mock_client.get_deck_names.assert_not_called()
+        self.assertEqual(result.total_cards, 1)
+
+    def test_iter_today_review_yields_decks_in_order(self):
+        """Test streaming today's cards one deck at a time."""
+        self.mock_client.get_deck_names.return_value = ["History", "Math", "Programming"]
+        self.mock_client.find_cards_many.return_value = [[1], [], [2, 3]]
+        self.mock_client.get_cards_info.side_effect = lambda ids: [{"id": card_id} for card_id in ids]
+        self.mock_mapper.to_deck_cards.side_effect = lambda name, cards: DeckCards(
+            deck_name=name, new_cards=[str(card["id"]) for card in cards], learning_cards=[], review_cards=[]
+        )
+
+        stream = self.repository.iter_today_review()
+        first = next(stream)
+
+        self.assertEqual(first.deck_name, "History")
+        self.assertEqual([deck.deck_name for deck in stream], ["Programming"])
+        self.mock_client.find_cards_many.assert_called_once_with([
+            'deck:"History" is:due', 'deck:"Math" is:due', 'deck:"Programming" is:due'
+        ])
+        self.assertEqual(
+            [args.args[0] for args in self.mock_client.get_cards_info.call_args_list], [[1], [2, 3]]
+        )
+
+    def test_iter_today_review_without_due_cards(self):
+        """Test streaming when no deck has cards due."""
+        self.mock_client.find_cards_many.return_value = [[]]
+
+        self.assertEqual(list(self.repository.iter_today_review(deck_name="Test Deck")), [])
+        self.mock_client.get_cards_info.assert_not_called()
+
+    def test_iter_card_pages_walks_decks_in_card_id_order(self):
+        """Test paging through every card, with cursors resuming after each page."""
+        ids_by_deck = {'deck:"History"': [30, 10, 20], 'deck:"Programming"': [40]}
+        self.mock_client.get_deck_names.return_value = ["Programming", "History", "History::Rome"]
+        self.mock_client.find_cards.side_effect = lambda query: list(ids_by_deck[query])
+        self.mock_client.get_cards_info.side_effect = lambda ids: [{"id": card_id} for card_id in ids]
+        self.mock_mapper.to_deck_cards.side_effect = lambda name, cards: DeckCards(
+            deck_name=name, new_cards=[card["id"] for card in cards], learning_cards=[], review_cards=[]
+        )
+
+        pages = list(self.repository.iter_card_pages(page_size=2))
+
+        self.assertEqual([(page.deck.deck_name, page.deck.new_cards) for page in pages],
+                         [("History", [10, 20]), ("History", [30]), ("Programming", [40])])
+        self.assertIsNone(pages[-1].cursor)
+
+        resumed = list(self.repository.iter_card_pages(page_size=2, cursor=pages[0].cursor))
+        self.assertEqual([page.deck.new_cards for page in resumed], [[30], [40]])
+
+    def test_get_all_cards_weighted_finds_tiers_in_one_batch(self):
+        """Test that weight tiers are searched together with the deck's cards."""
+        self.mock_client.find_cards_many.side_effect = lambda queries: [[1, 2, 3]] + [[3]] + [[]] * (len(queries) - 2)
+        self.mock_client.get_cards_info_many.side_effect = lambda groups: [[{"id": i} for i in ids] for ids in groups]
+        self.mock_mapper.to_deck_cards.return_value = DeckCards("Test Deck", [Card("q", "a")], [], [])
+
+        self.repository.get_all_cards(limit=2, deck_name="Test Deck", seed=1, weight="lapses")
+        self.repository.get_all_cards(limit=1, offset=1, deck_name="Test Deck", seed=1, weight="lapses")
+
+        queries = self.mock_client.find_cards_many.call_args_list[0].args[0]
+        self.assertEqual(queries[:2], ['deck:"Test Deck"', 'deck:"Test Deck" prop:lapses>=1'])
+        first, second = [call.args[0][0] for call in self.mock_client.get_cards_info_many.call_args_list]
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, first[1:])
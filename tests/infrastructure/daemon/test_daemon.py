@@ -0,0 +1,80 @@
+"""Tests for the `anki serve` daemon and its client."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.daemon.client import DaemonClient
+from src.infrastructure.daemon.server import AnkiDaemon
+from tests.fixtures.collection import create_collection
+
+
+@pytest.fixture
+def start_daemon(tmp_path):
+    """Start daemons on sockets in a temporary directory and stop them afterwards."""
+    daemons = []
+
+    def start(container, options, commands):
+        daemon = AnkiDaemon(container, options, commands, path=str(tmp_path / "daemon.sock"))
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        while not DaemonClient(daemon.path).is_running():
+            time.sleep(0.01)
+        daemons.append((daemon, thread))
+        return DaemonClient(daemon.path)
+
+    yield start
+    for daemon, thread in daemons:
+        daemon.shutdown()
+        thread.join()
+
+
+def test_request_without_daemon(tmp_path):
+    """Test that the client reports a missing daemon so the CLI can run directly."""
+    client = DaemonClient(str(tmp_path / "missing.sock"))
+
+    assert not client.is_running()
+    assert client.request("today", {}, {}) is None
+
+
+def test_daemon_runs_cli_commands_against_warm_container(start_daemon, tmp_path):
+    """Test that today and list run on the daemon's container and return their output."""
+    from src.application.containers import Container
+    from src.cli import COMMANDS
+
+    options = {"stack": "sync", "backend": "collection",
+               "collection": {"path": create_collection(tmp_path / "collection.anki2")}}
+    container = Container()
+    container.config.from_dict(options)
+    client = start_daemon(container, options, COMMANDS)
+
+    console = client.request("today", {"deck": None}, {**options, "output": {"format": "console"}})
+    ndjson = client.request("today", {"deck": "History"}, {**options, "output": {"format": "ndjson"}})
+
+    assert console["status"] == "ok"
+    assert "Total cards to review today: 4" in console["output"]
+    assert ndjson["status"] == "ok"
+    assert sorted(json.loads(line)["card_id"] for line in ndjson["output"].splitlines()) == [2001, 2002]
+
+
+def test_daemon_rejects_other_global_options(start_daemon):
+    """Test that requests made with different global options are left to the CLI."""
+    client = start_daemon(Mock(), {"stack": "sync"}, {"today": lambda container, **params: None})
+
+    assert client.request("today", {}, {"stack": "async"}) == {"status": "unsupported"}
+    assert client.request("unknown", {}, {"stack": "sync"}) == {"status": "unsupported"}
+
+
+def test_daemon_reports_command_errors(start_daemon):
+    """Test that a failing command is reported back to the client."""
+    def fail(container, **params):
+        raise RuntimeError("Failed to communicate with Anki: refused")
+
+    client = start_daemon(Mock(), {}, {"today": fail})
+
+    assert client.request("today", {}, {}) == {
+        "status": "error", "error": "Failed to communicate with Anki: refused"
+    }
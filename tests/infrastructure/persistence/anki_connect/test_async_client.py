@@ -0,0 +1,158 @@
+"""Tests for AsyncAnkiConnectClient."""
+
+import asyncio
+import json
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.infrastructure.persistence.anki_connect.async_client import AsyncAnkiConnectClient
+from src.infrastructure.persistence.anki_connect.async_transport import AsyncAnkiConnectTransport
+from src.infrastructure.persistence.anki_connect.chunking import AdaptiveChunker
+from tests.fixtures.decks import TEST_DECKS
+
+
+class _AnkiConnectHandler(BaseHTTPRequestHandler):
+    """Serves deckNames, findCards and cardsInfo from the TEST_DECKS fixture."""
+
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests_seen.append(request)
+        action, params = request["action"], request["params"]
+        cards = {card["id"]: card for deck in TEST_DECKS for card in deck["cards"]}
+
+        if action == "deckNames":
+            response = {"result": [deck["name"] for deck in TEST_DECKS], "error": None}
+        elif action == "findCards":
+            name = params["query"].split('"')[1]
+            response = {"result": [card["id"] for deck in TEST_DECKS if deck["name"] == name for card in deck["cards"]], "error": None}
+        elif action == "cardsInfo":
+            response = {"result": [cards.get(card_id, {}) for card_id in params["cards"]], "error": None}
+        else:
+            response = {"result": None, "error": f"unsupported action {action}"}
+
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Start a local fake AnkiConnect server."""
+    _AnkiConnectHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AnkiConnectHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_deck_names(server_url):
+    """Test retrieving deck names over asyncio."""
+    client = AsyncAnkiConnectClient(base_url=server_url)
+
+    assert asyncio.run(client.get_deck_names()) == ["Programming", "History"]
+
+
+def test_find_cards_and_get_cards_info(server_url):
+    """Test finding cards and fetching their details over asyncio."""
+    client = AsyncAnkiConnectClient(base_url=server_url)
+
+    async def run():
+        card_ids = await client.find_cards('deck:"Programming"')
+        return card_ids, await client.get_cards_info(card_ids)
+
+    card_ids, cards = asyncio.run(run())
+
+    assert card_ids == [1, 2]
+    assert [card["fields"]["Front"]["value"] for card in cards] == ["What is Python?", "What is a decorator?"]
+
+
+def test_anki_error_is_raised(server_url):
+    """Test that an AnkiConnect error is raised as RuntimeError."""
+    client = AsyncAnkiConnectClient(base_url=server_url)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        asyncio.run(client._make_request("unknownAction"))
+
+    assert "AnkiConnect error: unsupported action unknownAction" in str(exc_info.value)
+
+
+def test_network_error_is_raised():
+    """Test that a refused connection is raised as RuntimeError."""
+    client = AsyncAnkiConnectClient(base_url="http://127.0.0.1:1")
+
+    with pytest.raises(RuntimeError) as exc_info:
+        asyncio.run(client.get_deck_names())
+
+    assert "Failed to communicate with Anki" in str(exc_info.value)
+
+
+def test_https_url_connects_over_tls(monkeypatch):
+    """Test that an https URL opens a TLS connection on port 443 by default."""
+    opened = []
+
+    async def open_connection(host, port, ssl=None):
+        opened.append((host, port, ssl))
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    client = AsyncAnkiConnectClient(base_url="https://anki.example")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.get_deck_names())
+
+    host, port, context = opened[0]
+    assert (host, port) == ("anki.example", 443)
+    assert isinstance(context, ssl.SSLContext)
+
+
+def test_unsupported_url_scheme_is_rejected():
+    """Test that a URL that isn't http or https is rejected instead of posted over plain HTTP."""
+    transport = AsyncAnkiConnectTransport()
+
+    with pytest.raises(ValueError) as exc_info:
+        asyncio.run(transport.post("ftp://127.0.0.1:8765", {"action": "deckNames"}))
+
+    assert "ftp" in str(exc_info.value)
+
+
+def test_connections_are_reused(server_url):
+    """Test that sequential requests share one keep-alive connection."""
+    transport = AsyncAnkiConnectTransport()
+    client = AsyncAnkiConnectClient(base_url=server_url, transport=transport)
+
+    async def run():
+        for _ in range(4):
+            await client.get_deck_names()
+        await transport.close()
+
+    asyncio.run(run())
+
+    stats = transport.stats()
+    assert stats.requests == 4
+    assert stats.connections_opened == 1
+    assert stats.reused_requests == 3
+
+
+def test_get_cards_info_in_concurrent_chunks(server_url):
+    """Test that large ID lists are fetched in chunks and reassembled in order."""
+    chunker = AdaptiveChunker(initial_size=1, min_size=1, max_size=1)
+    client = AsyncAnkiConnectClient(base_url=server_url, chunker=chunker, max_workers=2)
+
+    cards = asyncio.run(client.get_cards_info([3, 1, 2]))
+
+    assert [card["id"] for card in cards] == [3, 1, 2]
+    assert len(_AnkiConnectHandler.requests_seen) == 3
@@ -0,0 +1,56 @@
+"""Tests for AdaptiveChunker."""
+
+from src.infrastructure.persistence.anki_connect.chunking import AdaptiveChunker
+
+
+def test_initial_size_is_clamped():
+    """Test that the initial size respects the configured bounds."""
+    assert AdaptiveChunker(initial_size=10, min_size=50).size == 50
+    assert AdaptiveChunker(initial_size=10000, max_size=5000).size == 5000
+
+
+def test_size_follows_latency_target():
+    """Test that slow cards shrink the chunk to fit the latency target."""
+    chunker = AdaptiveChunker(initial_size=500, min_size=10, target_latency=0.5)
+
+    # 1ms per card -> 500 cards fit in 0.5s
+    chunker.record(cards=100, seconds=0.1, response_bytes=100)
+
+    assert chunker.size == 500
+
+
+def test_size_follows_response_size_limit():
+    """Test that large cards shrink the chunk to fit the response size limit."""
+    chunker = AdaptiveChunker(min_size=10, max_response_bytes=10000, target_latency=10.0)
+
+    # 100 bytes per card -> 100 cards fit in 10000 bytes
+    chunker.record(cards=50, seconds=0.001, response_bytes=5000)
+
+    assert chunker.size == 100
+
+
+def test_size_grows_for_fast_small_cards():
+    """Test that cheap cards grow the chunk up to the maximum size."""
+    chunker = AdaptiveChunker(initial_size=100, max_size=2000)
+
+    chunker.record(cards=100, seconds=0.001, response_bytes=1000)
+
+    assert chunker.size == 2000
+
+
+def test_size_never_drops_below_minimum():
+    """Test that very slow cards still use the minimum chunk size."""
+    chunker = AdaptiveChunker(min_size=50, target_latency=0.5)
+
+    chunker.record(cards=10, seconds=10.0, response_bytes=10)
+
+    assert chunker.size == 50
+
+
+def test_empty_chunk_is_ignored():
+    """Test that recording an empty chunk keeps the current size."""
+    chunker = AdaptiveChunker(initial_size=300)
+
+    chunker.record(cards=0, seconds=1.0, response_bytes=0)
+
+    assert chunker.size == 300
@@ -2,9 +2,10 @@
 
 import json
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from requests.exceptions import RequestException
 
+from src.infrastructure.persistence.anki_connect.chunking import AdaptiveChunker
 from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
 
 
@@ -19,7 +20,7 @@ def test_get_deck_names_success(client):
     expected_decks = ["Default", "Test::Deck1", "Test::Deck2"]
     mock_response = {"result": expected_decks, "error": None}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -28,7 +29,8 @@ def test_get_deck_names_success(client):
         assert result == expected_decks
         mock_post.assert_called_once_with(
             "http://localhost:8765",
-            json={"action": "deckNames", "version": 6, "params": {}}
+            json={"action": "deckNames", "version": 6, "params": {}},
+            timeout=(3.05, 60.0)
         )
 
 
@@ -36,7 +38,7 @@ def test_get_deck_names_empty(client):
     """Test when there are no decks."""
     mock_response = {"result": [], "error": None}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -49,7 +51,7 @@ def test_get_deck_names_anki_error(client):
     """Test when AnkiConnect returns an error."""
     mock_response = {"result": None, "error": "Failed to connect to Anki"}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -61,7 +63,7 @@ def test_get_deck_names_anki_error(client):
 
 def test_get_deck_names_network_error(client):
     """Test when there's a network error."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.side_effect = RequestException("Network error")
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -72,7 +74,7 @@ def test_get_deck_names_network_error(client):
 
 def test_get_deck_names_invalid_response(client):
     """Test when AnkiConnect returns invalid JSON."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -87,7 +89,7 @@ def test_find_cards_success(client):
     expected_cards = [1234, 5678]
     mock_response = {"result": expected_cards, "error": None}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -96,7 +98,8 @@ def test_find_cards_success(client):
         assert result == expected_cards
         mock_post.assert_called_once_with(
             "http://localhost:8765",
-            json={"action": "findCards", "version": 6, "params": {"query": "deck:Test"}}
+            json={"action": "findCards", "version": 6, "params": {"query": "deck:Test"}},
+            timeout=(3.05, 60.0)
         )
 
 
@@ -104,7 +107,7 @@ def test_find_cards_empty(client):
     """Test when no cards match the query."""
     mock_response = {"result": [], "error": None}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -117,7 +120,7 @@ def test_find_cards_anki_error(client):
     """Test when AnkiConnect returns an error during card search."""
     mock_response = {"result": None, "error": "Invalid search query"}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -129,7 +132,7 @@ def test_find_cards_anki_error(client):
 
 def test_find_cards_network_error(client):
     """Test when there's a network error during card search."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.side_effect = RequestException("Network error")
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -159,7 +162,7 @@ def test_get_cards_info_success(client):
     ]
     mock_response = {"result": expected_info, "error": None}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -168,7 +171,8 @@ def test_get_cards_info_success(client):
         assert result == expected_info
         mock_post.assert_called_once_with(
             "http://localhost:8765",
-            json={"action": "cardsInfo", "version": 6, "params": {"cards": card_ids}}
+            json={"action": "cardsInfo", "version": 6, "params": {"cards": card_ids}},
+            timeout=(3.05, 60.0)
         )
 
 
@@ -176,7 +180,7 @@ def test_get_cards_info_empty(client):
     """Test when no cards are found."""
     mock_response = {"result": [], "error": None}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -189,7 +193,7 @@ def test_get_cards_info_anki_error(client):
     """Test when AnkiConnect returns an error during cards info retrieval."""
     mock_response = {"result": None, "error": "Invalid card IDs"}
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status.return_value = None
 
@@ -201,10 +205,162 @@ def test_get_cards_info_anki_error(client):
 
 def test_get_cards_info_network_error(client):
     """Test when there's a network error during cards info retrieval."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.side_effect = RequestException("Network error")
 
         with pytest.raises(RuntimeError) as exc_info:
             client.get_cards_info([1234])
 
-        assert "Failed to communicate with Anki: Network error" in str(exc_info.value) 
\ No newline at end of file
+        assert "Failed to communicate with Anki: Network error" in str(exc_info.value) 
+
+def test_batch_sends_single_multi_request(client):
+    """Test that batched actions are sent as one multi request."""
+    mock_response = {
+        "result": [
+            {"result": ["Default"], "error": None},
+            {"result": [1234], "error": None}
+        ],
+        "error": None
+    }
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.json.return_value = mock_response
+        mock_post.return_value.raise_for_status.return_value = None
+
+        with client.batch() as batch:
+            decks = batch.get_deck_names()
+            cards = batch.find_cards("deck:Default")
+
+        assert decks.result() == ["Default"]
+        assert cards.result() == [1234]
+        mock_post.assert_called_once_with(
+            "http://localhost:8765",
+            json={"action": "multi", "version": 6, "params": {"actions": [
+                {"action": "deckNames", "version": 6, "params": {}},
+                {"action": "findCards", "version": 6, "params": {"query": "deck:Default"}}
+            ]}},
+            timeout=(3.05, 60.0)
+        )
+
+
+def test_batch_splits_errors_per_action(client):
+    """Test that an error for one batched action is raised only by its result."""
+    mock_response = {
+        "result": [
+            {"result": [1234], "error": None},
+            {"result": None, "error": "Invalid search query"}
+        ],
+        "error": None
+    }
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.json.return_value = mock_response
+        mock_post.return_value.raise_for_status.return_value = None
+
+        with client.batch() as batch:
+            good = batch.find_cards("deck:Test")
+            bad = batch.find_cards("invalid:query")
+
+        assert good.result() == [1234]
+        with pytest.raises(RuntimeError) as exc_info:
+            bad.result()
+
+        assert "AnkiConnect error: Invalid search query" in str(exc_info.value)
+
+
+def test_batch_result_before_send(client):
+    """Test that reading a result before the batch is sent raises an error."""
+    batch = client.batch()
+    pending = batch.find_cards("deck:Test")
+
+    with pytest.raises(RuntimeError) as exc_info:
+        pending.result()
+
+    assert "has not been sent yet" in str(exc_info.value)
+
+
+def test_find_cards_many_and_get_cards_info_many(client):
+    """Test the batched helpers return one result per input, in order."""
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.raise_for_status.return_value = None
+        mock_post.return_value.json.side_effect = [
+            {"result": [{"result": [1], "error": None}, {"result": [2, 3], "error": None}], "error": None},
+            {"result": [{"result": [{"cardId": 1}], "error": None}, {"result": [{"cardId": 2}, {"cardId": 3}], "error": None}], "error": None}
+        ]
+
+        assert client.find_cards_many(['deck:"A"', 'deck:"B"']) == [[1], [2, 3]]
+        assert client.get_cards_info_many([[1], [2, 3]]) == [[{"cardId": 1}], [{"cardId": 2}, {"cardId": 3}]]
+        assert mock_post.call_count == 2
+
+
+def test_find_cards_many_empty(client):
+    """Test that no request is sent for an empty list of queries."""
+    with patch("requests.Session.post") as mock_post:
+        assert client.find_cards_many([]) == []
+        mock_post.assert_not_called()
+
+
+def _echo_cards_info(url, json, timeout):
+    """Answer a cardsInfo request with one card dictionary per requested ID."""
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.content = b"x" * 10 * len(json["params"]["cards"])
+    response.json.return_value = {
+        "result": [{"cardId": card_id} for card_id in json["params"]["cards"]],
+        "error": None
+    }
+    return response
+
+
+def test_get_cards_info_fetches_large_lists_in_chunks():
+    """Test that large ID lists are split into chunks and reassembled in order."""
+    client = AnkiConnectClient(chunker=AdaptiveChunker(initial_size=50, min_size=50, max_size=50), max_workers=3)
+    card_ids = list(range(1, 201))
+
+    with patch("requests.Session.post", side_effect=_echo_cards_info) as mock_post:
+        result = client.get_cards_info(card_ids)
+
+    assert [card["cardId"] for card in result] == card_ids
+    assert mock_post.call_count == 4
+    requested = sorted(len(c.kwargs["json"]["params"]["cards"]) for c in mock_post.call_args_list)
+    assert requested == [50, 50, 50, 50]
+
+
+def test_iter_cards_info_yields_chunks_in_order():
+    """Test that chunks are yielded one by one in the order of the IDs."""
+    client = AnkiConnectClient(chunker=AdaptiveChunker(initial_size=50, min_size=50, max_size=50))
+
+    with patch("requests.Session.post", side_effect=_echo_cards_info):
+        chunks = list(client.iter_cards_info(list(range(120))))
+
+    assert [len(chunk) for chunk in chunks] == [50, 50, 20]
+    assert [card["cardId"] for chunk in chunks for card in chunk] == list(range(120))
+
+
+def test_get_cards_info_many_splits_chunked_results_back():
+    """Test that large groups are fetched in chunks and returned per group."""
+    client = AnkiConnectClient(chunker=AdaptiveChunker(initial_size=50, min_size=50, max_size=50))
+
+    with patch("requests.Session.post", side_effect=_echo_cards_info):
+        groups = client.get_cards_info_many([list(range(40)), list(range(40, 100))])
+
+    assert [[card["cardId"] for card in group] for group in groups] == [list(range(40)), list(range(40, 100))]
+
+
+def test_get_cards_mod_time_success(client):
+    """Test successful retrieval of card modification times."""
+    expected = [{"cardId": 1234, "mod": 1700000000}]
+    mock_response = {"result": expected, "error": None}
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.json.return_value = mock_response
+        mock_post.return_value.raise_for_status.return_value = None
+
+        result = client.get_cards_mod_time([1234])
+
+        assert result == expected
+        mock_post.assert_called_once_with(
+            "http://localhost:8765",
+            json={"action": "cardsModTime", "version": 6, "params": {"cards": [1234]}},
+            timeout=(3.05, 60.0)
+        )
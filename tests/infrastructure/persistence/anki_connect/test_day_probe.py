@@ -0,0 +1,39 @@
+"""Tests for DueDayProbe against the benchmarks' fake AnkiConnect server."""
+
+from benchmarks.fake_anki import FakeAnkiConnect
+from benchmarks.generator import GeneratorSpec, generate
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.day_probe import DueDayProbe
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.clock import SchedulerClock
+
+
+def test_probe_finds_the_collections_day_number():
+    """Test that the probe reads today's day number off a card due near today."""
+    collection = generate(GeneratorSpec(cards=300, decks=5, seed=2))
+    with FakeAnkiConnect(collection) as fake:
+        assert DueDayProbe(AnkiConnectClient(fake.url))() == collection.today
+
+
+def test_probe_without_cards_due_near_today():
+    """Test that the probe gives up when no review card is due within its window."""
+    collection = generate(GeneratorSpec(cards=300, decks=5, seed=2))
+    collection.today += 100_000
+    with FakeAnkiConnect(collection) as fake:
+        assert DueDayProbe(AnkiConnectClient(fake.url))() is None
+
+
+def test_mapper_counts_review_days_from_collection_creation():
+    """Test that review cards are due by the collection's day number, not days since the epoch."""
+    today = 1000
+    mapper = AnkiCardMapper(SchedulerClock(probe=lambda: today))
+    cards = [
+        {"cardId": 1, "queue": 2, "due": today, "fields": {"Front": {"value": "due"}, "Back": {"value": "a"}}},
+        {"cardId": 2, "queue": 2, "due": today + 1, "fields": {"Front": {"value": "later"}, "Back": {"value": "b"}}},
+        {"cardId": 3, "queue": 3, "due": today + 1, "fields": {"Front": {"value": "step"}, "Back": {"value": "c"}}},
+    ]
+
+    deck = mapper.to_deck_cards("Deck", cards)
+
+    assert [card.front for card in deck.review_cards] == ["due"]
+    assert deck.learning_cards == []
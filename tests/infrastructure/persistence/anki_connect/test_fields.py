@@ -0,0 +1,73 @@
+"""Tests for FieldExtractors."""
+
+from src.infrastructure.persistence.anki_connect.fields import FieldExtractors
+
+
+def _card(model, **values):
+    """Build AnkiConnect card data with fields in the order given."""
+    return {
+        "modelName": model,
+        "fields": {name: {"value": value, "order": order} for order, (name, value) in enumerate(values.items())},
+    }
+
+
+def test_extract_uses_known_pairs():
+    """Test that the Polish-English and Basic fields are found."""
+    extractors = FieldExtractors()
+
+    assert extractors.extract(_card("Basic", Front="Q", Back="A")) == ("Q", "A")
+    assert extractors.extract(_card("Polish", **{"Polish word": "kot", "Word translation": "cat"})) == ("kot", "cat")
+
+
+def test_extract_falls_back_to_later_pair_when_values_are_empty():
+    """Test that a model with several known pairs takes the first one with both values."""
+    extractors = FieldExtractors()
+    fields = {"Polish word": "", "Word translation": "cat", "Front": "Q", "Back": "A"}
+
+    assert extractors.extract(_card("Both", **fields)) == ("Q", "A")
+    assert extractors.extract(_card("Both", **{**fields, "Polish word": "kot"})) == ("kot", "cat")
+
+
+def test_extract_uses_first_fields_of_unknown_models():
+    """Test that other models show their first two fields instead of nothing."""
+    card = {"modelName": "Vocab", "fields": {"Meaning": {"value": "cat", "order": 1}, "Word": {"value": "kot", "order": 0}}}
+
+    assert FieldExtractors().extract(card) == ("kot", "cat")
+
+
+def test_extract_uses_model_rules():
+    """Test that configured rules override the default pairs."""
+    extractors = FieldExtractors(models={"Reversed": {"front": "Back", "back": "Front"}})
+
+    assert extractors.extract(_card("Reversed", Front="Q", Back="A")) == ("A", "Q")
+    assert extractors.extract(_card("Basic", Front="Q", Back="A")) == ("Q", "A")
+
+
+def test_extract_compiles_once_per_model():
+    """Test that the extractor of a model is reused for its other cards."""
+    extractors = FieldExtractors()
+    extractors.extract(_card("Basic", Front="Q1", Back="A1"))
+    compiled = dict(extractors._compiled)
+
+    assert extractors.extract(_card("Basic", Front="Q2", Back="A2")) == ("Q2", "A2")
+    assert extractors._compiled == compiled
+
+
+def test_extract_recompiles_renamed_fields():
+    """Test that a model whose fields were renamed is compiled again."""
+    extractors = FieldExtractors()
+    extractors.extract(_card("Basic", Front="Q", Back="A"))
+
+    assert extractors.extract(_card("Basic", Question="Q", Answer="A")) == ("Q", "A")
+
+
+def test_extract_without_model_name_keys_on_field_names():
+    """Test that cards not telling their model still get the right fields."""
+    extractors = FieldExtractors()
+
+    assert extractors.extract({"fields": {"Front": {"value": "Q"}, "Back": {"value": "A"}}}) == ("Q", "A")
+    assert extractors.extract({"fields": {"Polish word": {"value": "kot"}, "Word translation": {"value": "cat"}}}) == (
+        "kot", "cat"
+    )
+    assert extractors.extract({"fields": {}}) == ("", "")
+    assert extractors.extract({}) == ("", "")
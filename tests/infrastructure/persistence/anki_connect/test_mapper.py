@@ -133,6 +133,14 @@ def test_to_deck_cards_fallback_to_standard_fields(mapper):
     ]
 
 
+def test_to_deck_cards_keeps_card_id(mapper):
+    """Test that the AnkiConnect card ID is kept on the card."""
+    cards = [{"cardId": 1500000000001, "queue": 0, "type": 0, "fields": {"Front": {"value": "Q"}, "Back": {"value": "A"}}}]
+
+    result = mapper.to_deck_cards("Programming", cards)
+    assert result.new_cards[0].card_id == 1500000000001
+
+
 def test_to_deck_cards_mixed_field_types(mapper):
     """Test handling cards with mix of Polish-English and standard fields."""
     cards = [
@@ -204,4 +212,71 @@ def test_get_field_value_no_fields(mapper):
     """Test getting field value when fields key doesn't exist."""
     card = {}
     assert mapper._get_field_value(card, "Front") == ""
-    assert mapper._get_field_value(card, "Back") == "" 
\ No newline at end of file
+    assert mapper._get_field_value(card, "Back") == "" 
+
+@pytest.mark.parametrize("backend", ["array", "numpy"])
+def test_classify_matches_get_card_type(backend):
+    """Test that batch classification agrees with the per-card one on random cards."""
+    import random
+    from src.infrastructure.persistence.anki_connect.mapper import CARD_TYPES
+    from src.infrastructure.persistence.clock import SchedulerClock
+
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    now = 1_760_000_000.5
+    # Days since the collection was created, not since the epoch
+    today = 1234
+    mapper = AnkiCardMapper(SchedulerClock(probe=lambda: today, clock=lambda: now))
+
+    rng = random.Random(21)
+    cards = []
+    for _ in range(5000):
+        queue = rng.choice([-3, -2, -1, 0, 1, 2, 3, 4])
+        card = {"queue": queue, "type": rng.randint(0, 3)}
+        if queue == 1:
+            card["due"] = int(now * 1000) + rng.choice([-1, 0, 1]) * rng.randint(0, 3) * 60_000
+        else:
+            card["due"] = today + rng.randint(-3, 3)
+        if rng.random() < 0.3:
+            card["odue"] = today + rng.randint(-3, 3)
+        if rng.random() < 0.05:
+            del card[rng.choice(["queue", "due"])]
+        cards.append(card)
+
+    codes = mapper.classify(cards, backend=backend)
+
+    assert [CARD_TYPES[code] for code in codes] == [mapper._get_card_type(card) for card in cards]
+
+
+def test_to_deck_cards_resolves_fields_on_first_read():
+    """Test that lazy fields are only extracted once a card of the group is read."""
+    from unittest.mock import Mock
+    from src.infrastructure.persistence.anki_connect.fields import FieldExtractors
+
+    fields = Mock(wraps=FieldExtractors())
+    mapper = AnkiCardMapper(fields=fields)
+    cards = [
+        {"cardId": 1, "queue": 0, "type": 0, "fields": {"Front": {"value": "Q1"}, "Back": {"value": "A1"}}},
+        {"cardId": 2, "queue": 0, "type": 0, "fields": {"Front": {"value": "Q2"}, "Back": {"value": "A2"}}},
+    ]
+
+    result = mapper.to_deck_cards("Deck", cards)
+    assert result.total_cards == 2
+    fields.extract_fields.assert_not_called()
+
+    assert [(card.front, card.back, card.card_id) for card in result.new_cards] == [("Q1", "A1", 1), ("Q2", "A2", 2)]
+    assert fields.extract_fields.call_count == 2
+
+
+def test_to_deck_cards_eager_fields_match_lazy():
+    """Test that eager and lazy fields give the same cards."""
+    cards = [
+        {"cardId": index, "queue": index % 3, "type": 0, "due": 0,
+         "fields": {"Front": {"value": f"Q{index}"}, "Back": {"value": f"A{index}"}}}
+        for index in range(1, 10)
+    ]
+
+    eager = AnkiCardMapper(lazy_fields=False).to_deck_cards("Deck", cards)
+    lazy = AnkiCardMapper(lazy_fields=True).to_deck_cards("Deck", cards)
+
+    assert eager == lazy
@@ -0,0 +1,186 @@
+"""Tests for ResponseMemo and its use by AnkiConnectClient."""
+
+import threading
+import time
+
+import pytest
+
+from benchmarks.fake_anki import FakeAnkiConnect
+from benchmarks.synthetic import CollectionSpec, SyntheticCollection
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.memo import ResponseMemo
+
+
+class Clock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def _fetcher(result, calls):
+    def fetch():
+        calls.append(1)
+        return list(result), 10
+    return fetch
+
+
+def test_repeated_read_is_answered_from_memo(clock):
+    """Test that an identical request within its TTL is not sent again."""
+    memo = ResponseMemo(ttls={"findCards": 5}, clock=clock)
+    calls = []
+
+    first = memo.call("findCards", {"query": "is:due"}, _fetcher([1, 2], calls))
+    second = memo.call("findCards", {"query": "is:due"}, _fetcher([1, 2], calls))
+    memo.call("findCards", {"query": "is:new"}, _fetcher([3], calls))
+
+    assert first == second == ([1, 2], 10)
+    assert len(calls) == 2
+    assert memo.stats().hits == 1 and memo.stats().misses == 2
+
+
+def test_answers_expire_after_ttl(clock):
+    """Test that answers are fetched again once their TTL has passed."""
+    memo = ResponseMemo(ttls={"deckNames": 5}, clock=clock)
+    calls = []
+
+    memo.call("deckNames", {}, _fetcher(["A"], calls))
+    clock.now = 5.1
+    memo.call("deckNames", {}, _fetcher(["A"], calls))
+
+    assert len(calls) == 2
+
+
+def test_actions_without_ttl_are_not_remembered(clock):
+    """Test that reads without a TTL, like cardsInfo by default, are always sent."""
+    memo = ResponseMemo(clock=clock)
+    calls = []
+
+    memo.call("cardsInfo", {"cards": [1]}, _fetcher([{}], calls))
+    memo.call("cardsInfo", {"cards": [1]}, _fetcher([{}], calls))
+
+    assert len(calls) == 2
+
+
+def test_callers_get_their_own_copy(clock):
+    """Test that changing a returned answer doesn't change the remembered one."""
+    memo = ResponseMemo(ttls={"findCards": 5}, clock=clock)
+
+    result, _ = memo.call("findCards", {"query": "deck:A"}, _fetcher([1, 2, 3], []))
+    result.reverse()
+
+    assert memo.call("findCards", {"query": "deck:A"}, _fetcher([], []))[0] == [1, 2, 3]
+
+
+def test_least_recently_used_answers_are_evicted(clock):
+    """Test that the memo stays within its entry and byte bounds."""
+    memo = ResponseMemo(ttls={"findCards": 5}, max_entries=2, max_bytes=25, clock=clock)
+    calls = []
+
+    memo.call("findCards", {"query": "a"}, _fetcher([1], calls))
+    memo.call("findCards", {"query": "b"}, _fetcher([2], calls))
+    memo.call("findCards", {"query": "a"}, _fetcher([1], calls))
+    memo.call("findCards", {"query": "c"}, _fetcher([3], calls))
+
+    stats = memo.stats()
+    assert stats.entries == 2 and stats.bytes == 20 and stats.evictions == 1
+    memo.call("findCards", {"query": "a"}, _fetcher([1], calls))
+    assert len(calls) == 3
+
+
+def test_write_actions_invalidate(clock):
+    """Test that any action that may change the collection clears the memo."""
+    memo = ResponseMemo(ttls={"findCards": 5}, clock=clock)
+    calls = []
+
+    memo.call("findCards", {"query": "is:due"}, _fetcher([1], calls))
+    memo.call("answerCards", {"answers": []}, _fetcher([True], []))
+    memo.call("findCards", {"query": "is:due"}, _fetcher([1], calls))
+
+    assert len(calls) == 2
+    assert memo.stats().invalidations == 1
+
+
+def test_concurrent_identical_requests_are_coalesced():
+    """Test that callers asking while a request is in flight share its answer."""
+    memo = ResponseMemo(ttls={"findCards": 5})
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return [1, 2], 10
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(memo.call("findCards", {"query": "q"}, slow_fetch)))
+    first.start()
+    started.wait(5)
+    second = threading.Thread(target=lambda: results.append(memo.call("findCards", {"query": "q"}, slow_fetch)))
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+
+    assert len(calls) == 1
+    assert results == [([1, 2], 10), ([1, 2], 10)]
+    assert memo.stats().coalesced == 1
+
+
+def test_failed_requests_are_not_remembered(clock):
+    """Test that errors reach the caller and the next call tries again."""
+    memo = ResponseMemo(ttls={"findCards": 5}, clock=clock)
+
+    def fail():
+        raise RuntimeError("Failed to communicate with Anki: down")
+
+    with pytest.raises(RuntimeError, match="down"):
+        memo.call("findCards", {"query": "q"}, fail)
+
+    assert memo.call("findCards", {"query": "q"}, _fetcher([1], []))[0] == [1]
+
+
+def test_multi_sends_only_unremembered_actions(clock):
+    """Test that batched actions already remembered are left out of the multi request."""
+    memo = ResponseMemo(ttls={"deckNames": 5, "findCards": 5}, clock=clock)
+    memo.call("deckNames", {}, _fetcher(["A"], []))
+    sent = []
+
+    def fetch_many(actions):
+        sent.append(actions)
+        return [{"result": [7], "error": None}, {"result": None, "error": "bad query"}]
+
+    actions = [
+        {"action": "deckNames", "version": 6, "params": {}},
+        {"action": "findCards", "version": 6, "params": {"query": "is:due"}},
+        {"action": "findCards", "version": 6, "params": {"query": "bad"}},
+    ]
+    responses = memo.call_many(actions, fetch_many)
+
+    assert sent == [actions[1:]]
+    assert responses == [["A"], [7], {"result": None, "error": "bad query"}]
+    assert memo.call("findCards", {"query": "is:due"}, _fetcher([], []))[0] == [7]
+
+
+def test_client_sends_repeated_lookups_once():
+    """Test that repeated per-deck lookups through the client reach Anki once."""
+    collection = SyntheticCollection(CollectionSpec(cards=100, decks=3))
+    with FakeAnkiConnect(collection) as fake:
+        client = AnkiConnectClient(base_url=fake.url, memo=ResponseMemo())
+        for _ in range(3):
+            client.get_deck_names()
+            client.find_cards_many(['deck:"Deck 0000" is:due', 'deck:"Deck 0001" is:due'])
+
+    assert fake.requests["deckNames"] == 1
+    assert fake.requests["multi"] == 1
+    assert client.memo.stats().hits == 6
@@ -0,0 +1,34 @@
+"""Tests for TodayQueryPlanner."""
+
+import pytest
+
+from src.infrastructure.persistence.anki_connect.planner import QueryPlan, TodayQueryPlanner
+
+
+@pytest.fixture
+def planner():
+    """Create an instance of TodayQueryPlanner."""
+    return TodayQueryPlanner(min_decks_for_global=20, sparse_cards_per_deck=5)
+
+
+def test_single_deck_uses_per_deck_plan(planner):
+    """Test that a single deck is always queried directly."""
+    assert planner.plan(1) is QueryPlan.PER_DECK
+    assert planner.plan(1, expected_cards=0) is QueryPlan.PER_DECK
+
+
+def test_few_decks_use_per_deck_plan(planner):
+    """Test that a handful of decks is queried per deck."""
+    assert planner.plan(5) is QueryPlan.PER_DECK
+
+
+def test_many_decks_use_global_plan(planner):
+    """Test that large deck counts switch to the global query."""
+    assert planner.plan(20) is QueryPlan.GLOBAL
+    assert planner.plan(250, expected_cards=100000) is QueryPlan.GLOBAL
+
+
+def test_sparse_results_use_global_plan(planner):
+    """Test that few expected cards across several decks switch to the global query."""
+    assert planner.plan(10, expected_cards=12) is QueryPlan.GLOBAL
+    assert planner.plan(10, expected_cards=500) is QueryPlan.PER_DECK
@@ -0,0 +1,86 @@
+"""Tests for AnkiConnectTransport."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.transport import AnkiConnectTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every AnkiConnect request with an empty deck list."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"result": [], "error": None}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Start a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_pooled_connection(server_url):
+    """Test that sequential requests share one keep-alive connection."""
+    transport = AnkiConnectTransport()
+    client = AnkiConnectClient(base_url=server_url, transport=transport)
+
+    for _ in range(5):
+        assert client.get_deck_names() == []
+
+    stats = transport.stats()
+    assert stats.requests == 5
+    assert stats.connections_opened == 1
+    assert stats.connections[0].requests == 5
+    assert stats.reused_requests == 4
+    transport.close()
+
+
+def test_requests_without_keep_alive_open_new_connections(server_url):
+    """Test that disabling keep-alive opens a connection per request."""
+    transport = AnkiConnectTransport(keep_alive=False)
+    client = AnkiConnectClient(base_url=server_url, transport=transport)
+
+    for _ in range(3):
+        client.get_deck_names()
+
+    stats = transport.stats()
+    assert stats.requests == 3
+    assert stats.reused_requests == 0
+    transport.close()
+
+
+def test_timeouts_are_passed_to_session():
+    """Test that connect and read timeouts are applied to each request."""
+    transport = AnkiConnectTransport(connect_timeout=1.0, read_timeout=5.0)
+
+    assert transport.timeout == (1.0, 5.0)
+
+
+def test_clients_share_container_transport():
+    """Test that the container hands the same transport to every client user."""
+    from src.application.containers import Container
+
+    container = Container()
+
+    assert container.client().transport is container.transport()
+    assert container.repository()._client.transport is container.transport()
@@ -0,0 +1,164 @@
+"""Tests for SqliteCardCache and CachingAnkiConnectClient."""
+
+import json
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.persistence.cache import CachingAnkiConnectClient, SqliteCardCache
+
+
+def _card(card_id, mod, front="question"):
+    return {"cardId": card_id, "mod": mod, "fields": {"Front": {"value": front}}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary file."""
+    cache = SqliteCardCache(str(tmp_path / "cards.sqlite3"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def inner_client():
+    """Create a mock AnkiConnect client."""
+    return Mock()
+
+
+def test_cache_round_trip(cache):
+    """Test that stored cards are returned with their modification time."""
+    cache.put_many([_card(1, 100), _card(2, 200)])
+
+    found = cache.get_many([1, 2, 3])
+
+    assert found == {1: (100, _card(1, 100)), 2: (200, _card(2, 200))}
+
+
+def test_cache_persists_between_instances(tmp_path):
+    """Test that cards survive reopening the cache file."""
+    path = str(tmp_path / "cards.sqlite3")
+    first = SqliteCardCache(path)
+    first.put_many([_card(1, 100)])
+    first.close()
+
+    second = SqliteCardCache(path)
+
+    assert second.get_many([1]) == {1: (100, _card(1, 100))}
+    second.close()
+
+
+def test_cache_delete_many(cache):
+    """Test removing cards from the cache."""
+    cache.put_many([_card(1, 100), _card(2, 200)])
+
+    cache.delete_many([1])
+
+    assert list(cache.get_many([1, 2])) == [2]
+
+
+def test_first_lookup_fetches_and_stores_cards(cache, inner_client):
+    """Test that a cold cache fetches every card and remembers it."""
+    inner_client.get_cards_mod_time.return_value = [{"cardId": 1, "mod": 100}, {"cardId": 2, "mod": 200}]
+    inner_client.get_cards_info.return_value = [_card(1, 100), _card(2, 200)]
+    client = CachingAnkiConnectClient(inner_client, cache)
+
+    result = client.get_cards_info([1, 2])
+
+    assert result == [_card(1, 100), _card(2, 200)]
+    inner_client.get_cards_info.assert_called_once_with([1, 2])
+    assert client.stats().hits == 0
+    assert client.stats().misses == 2
+    assert set(cache.get_many([1, 2])) == {1, 2}
+
+
+def test_only_changed_cards_are_refetched(cache, inner_client):
+    """Test that unchanged cards come from the cache and changed ones are refetched."""
+    cache.put_many([_card(1, 100, "old"), _card(2, 200), _card(3, 300)])
+    inner_client.get_cards_mod_time.return_value = [
+        {"cardId": 1, "mod": 150},
+        {"cardId": 2, "mod": 200},
+        {"cardId": 3, "mod": 300}
+    ]
+    inner_client.get_cards_info.return_value = [_card(1, 150, "new")]
+    client = CachingAnkiConnectClient(inner_client, cache)
+
+    result = client.get_cards_info([3, 1, 2])
+
+    assert [card["cardId"] for card in result] == [3, 1, 2]
+    assert result[1]["fields"]["Front"]["value"] == "new"
+    inner_client.get_cards_info.assert_called_once_with([1])
+    assert client.stats().hits == 2
+    assert client.stats().misses == 1
+    assert cache.get_many([1])[1][0] == 150
+
+
+def test_fully_cached_lookup_skips_cards_info(cache, inner_client):
+    """Test that no cardsInfo request is sent when every card is up to date."""
+    cache.put_many([_card(1, 100)])
+    inner_client.get_cards_mod_time.return_value = [{"cardId": 1, "mod": 100}]
+    client = CachingAnkiConnectClient(inner_client, cache)
+
+    assert client.get_cards_info([1]) == [_card(1, 100)]
+    inner_client.get_cards_info.assert_not_called()
+    assert client.stats().hit_rate == 1.0
+
+
+def test_get_cards_info_many_splits_groups(cache, inner_client):
+    """Test that grouped lookups are answered per group, in order."""
+    cache.put_many([_card(1, 100), _card(2, 200), _card(3, 300)])
+    inner_client.get_cards_mod_time.return_value = [
+        {"cardId": 1, "mod": 100}, {"cardId": 2, "mod": 200}, {"cardId": 3, "mod": 300}
+    ]
+    client = CachingAnkiConnectClient(inner_client, cache)
+
+    groups = client.get_cards_info_many([[1], [2, 3]])
+
+    assert [[card["cardId"] for card in group] for group in groups] == [[1], [2, 3]]
+
+
+def test_iter_cards_info_streams_chunk_by_chunk(cache, inner_client):
+    """Test that each chunk is checked and yielded before the next one is looked up."""
+    cache.put_many([_card(1, 100), _card(3, 300)])
+    mods = {1: 100, 2: 200, 3: 300, 4: 400}
+    inner_client.chunker = Mock(size=2)
+    inner_client.get_cards_mod_time.side_effect = lambda ids: [{"cardId": i, "mod": mods[i]} for i in ids]
+    inner_client.iter_cards_info.side_effect = lambda ids: iter([[_card(i, mods[i]) for i in ids]])
+    client = CachingAnkiConnectClient(inner_client, cache)
+
+    chunks = client.iter_cards_info([1, 2, 3, 4])
+    first = next(chunks)
+
+    assert [card["cardId"] for card in first] == [1, 2]
+    inner_client.get_cards_mod_time.assert_called_once_with([1, 2])
+    inner_client.iter_cards_info.assert_called_once_with([2])
+    assert [card["cardId"] for card in next(chunks)] == [3, 4]
+    inner_client.iter_cards_info.assert_called_with([4])
+    assert client.stats().hits == 2
+    assert set(cache.get_many([1, 2, 3, 4])) == {1, 2, 3, 4}
+
+
+def test_other_calls_are_passed_through(cache, inner_client):
+    """Test that uncached actions go straight to the wrapped client."""
+    inner_client.find_cards_many.return_value = [[1]]
+    client = CachingAnkiConnectClient(inner_client, cache)
+
+    assert client.find_cards_many(['deck:"A"']) == [[1]]
+    inner_client.find_cards_many.assert_called_once_with(['deck:"A"'])
+
+
+def test_cache_adds_deck_column_to_old_files(tmp_path):
+    """Test that caches written before the deck column existed are migrated."""
+    path = str(tmp_path / "cards.sqlite3")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE cards (card_id INTEGER PRIMARY KEY, mod INTEGER NOT NULL, data TEXT NOT NULL)")
+    connection.execute("INSERT INTO cards VALUES (1, 100, ?)", (json.dumps({"cardId": 1, "deckName": "Polish"}),))
+    connection.commit()
+    connection.close()
+
+    cache = SqliteCardCache(path)
+
+    assert cache.count_by_deck() == {"Polish": 1}
+    assert cache.get_mods([1, 2]) == {1: 100}
+    cache.close()
@@ -0,0 +1,156 @@
+"""Tests for CardSync against the benchmarks' fake AnkiConnect server."""
+
+from dataclasses import replace
+
+import pytest
+
+from benchmarks.fake_anki import FakeAnkiConnect
+from benchmarks.generator import GeneratedCollection, GeneratorSpec, generate
+from src.infrastructure.persistence.anki_connect.chunking import AdaptiveChunker
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.anki_connect.repository import AnkiConnectCardRepository
+from src.infrastructure.persistence.cache import CardSync, SqliteCardCache
+
+
+@pytest.fixture
+def fake():
+    """Serve a small generated collection."""
+    with FakeAnkiConnect(generate(GeneratorSpec(cards=500, decks=12, seed=3))) as fake:
+        yield fake
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary file."""
+    cache = SqliteCardCache(str(tmp_path / "cards.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def _replace_cards(fake, cards):
+    collection = fake.collection
+    fake.collection = GeneratedCollection(collection.created, collection.decks, cards, now=collection.now)
+
+
+def test_first_sync_downloads_no_cards(fake, cache):
+    """Test that the first run is a full one that only lists card IDs."""
+    sync = CardSync(AnkiConnectClient(base_url=fake.url), cache)
+
+    stats = sync.sync()
+
+    assert stats.full
+    assert stats.checked == 500
+    assert fake.requests.get("cardsInfo", 0) == 0
+    assert cache.card_ids() == []
+
+
+def test_lookups_fill_mirror_lazily(fake, cache):
+    """Test that only looked up cards are downloaded and mirrored."""
+    sync = CardSync(AnkiConnectClient(base_url=fake.url), cache)
+    card_ids = [card.card_id for card in fake.collection.cards[:5]]
+
+    sync.get_cards_info(card_ids)
+    cards_info_requests = fake.requests["cardsInfo"]
+    cards = sync.get_cards_info(card_ids)
+
+    assert [card["cardId"] for card in cards] == card_ids
+    assert sorted(cache.card_ids()) == sorted(card_ids)
+    assert fake.requests["cardsInfo"] == cards_info_requests
+    assert sync.stats().hits == 5
+
+
+def test_steady_state_sync_lists_nothing(fake, cache):
+    """Test that a run without changes only compares deck totals."""
+    sync = CardSync(AnkiConnectClient(base_url=fake.url), cache)
+    sync.sync()
+    find_cards_requests = fake.requests.get("findCards", 0)
+
+    stats = sync.sync()
+
+    assert not stats.full
+    assert stats.checked == 0 and stats.deleted == 0
+    assert fake.requests.get("findCards", 0) == find_cards_requests
+    assert fake.requests.get("cardsInfo", 0) == 0
+
+
+def test_lookup_refreshes_changed_cards(fake, cache):
+    """Test that a mirrored card changed in Anki is downloaded again when looked up."""
+    sync = CardSync(AnkiConnectClient(base_url=fake.url), cache)
+    edited = fake.collection.cards[10]
+    sync.get_cards_info([edited.card_id])
+    fake.collection.cards[10] = replace(edited, mod=edited.mod + 1, fields=("changed",) + edited.fields[1:])
+
+    card = sync.get_cards_info([edited.card_id])[0]
+
+    assert next(iter(card["fields"].values()))["value"] == "changed"
+
+
+def test_iter_cards_info_streams_chunk_by_chunk(fake, cache):
+    """Test that the first chunk is yielded before the later chunks are downloaded."""
+    chunker = AdaptiveChunker(initial_size=100, min_size=100, max_size=100)
+    sync = CardSync(AnkiConnectClient(base_url=fake.url, chunker=chunker), cache)
+    card_ids = [card.card_id for card in fake.collection.cards]
+
+    chunks = sync.iter_cards_info(card_ids)
+    first = next(chunks)
+
+    assert [card["cardId"] for card in first] == card_ids[:100]
+    assert fake.requests["cardsInfo"] == 1
+    assert [card["cardId"] for chunk in chunks for card in chunk] == card_ids[100:]
+
+
+def test_repository_sees_unburied_cards(fake, cache):
+    """Test that a card rescheduled without being edited, reviewed or added is seen through the mirror."""
+    client = AnkiConnectClient(base_url=fake.url)
+    repository = AnkiConnectCardRepository(client, AnkiCardMapper(), sync=CardSync(client, cache))
+    index, buried = next((index, card) for index, card in enumerate(fake.collection.cards) if card.queue == -3)
+    before = repository.get_today_review().total_cards
+
+    fake.collection.cards[index] = replace(
+        buried, type=2, queue=2, due=fake.collection.today, original_due=0, original_deck_id=0, mod=buried.mod + 1
+    )
+
+    assert repository.get_today_review().total_cards == before + 1
+    assert repository.get_today_review() == AnkiConnectCardRepository(client, AnkiCardMapper()).get_today_review()
+
+
+def test_sync_detects_deleted_cards(fake, cache):
+    """Test that mirrored cards deleted from the collection leave the mirror."""
+    sync = CardSync(AnkiConnectClient(base_url=fake.url), cache)
+    sync.sync()
+    sync.get_cards_info([card.card_id for card in fake.collection.cards[:20]])
+    deleted = fake.collection.cards[:3]
+    _replace_cards(fake, fake.collection.cards[3:])
+
+    stats = sync.sync()
+
+    assert not stats.full
+    assert stats.deleted == 3
+    assert not set(card.card_id for card in deleted) & set(cache.card_ids())
+    assert len(cache.card_ids()) == 17
+
+
+def test_full_sync_after_interval(fake, cache):
+    """Test that a run after the full sync interval compares every card again."""
+    sync = CardSync(AnkiConnectClient(base_url=fake.url), cache, full_sync_interval=0)
+    sync.sync()
+
+    stats = sync.sync()
+
+    assert stats.full
+    assert fake.requests.get("cardsInfo", 0) == 0
+
+
+def test_repository_reads_cards_from_mirror(fake, cache):
+    """Test that the repository returns the same review with and without the mirror."""
+    client = AnkiConnectClient(base_url=fake.url)
+    direct = AnkiConnectCardRepository(client, AnkiCardMapper()).get_today_review()
+    repository = AnkiConnectCardRepository(client, AnkiCardMapper(), sync=CardSync(client, cache))
+
+    repository.get_today_review()
+    cards_info_requests = fake.requests["cardsInfo"]
+    mirrored = repository.get_today_review()
+
+    assert mirrored == direct
+    assert fake.requests["cardsInfo"] == cards_info_requests
@@ -0,0 +1,188 @@
+"""Tests for CollectionCardRepository."""
+
+import pytest
+
+from src.core.entities import TodayReview
+from src.infrastructure.persistence.anki_connect.mapper import AnkiCardMapper
+from src.infrastructure.persistence.collection import CollectionCardRepository
+from tests.fixtures.collection import create_collection
+
+
+@pytest.fixture(params=[False, True], ids=["modern", "legacy"])
+def repository(request, tmp_path):
+    """Create a repository over a generated collection file in both schema versions."""
+    path = create_collection(tmp_path / "collection.anki2", legacy=request.param)
+    repository = CollectionCardRepository(path, AnkiCardMapper())
+    yield repository
+    repository.close()
+
+
+def _fronts(cards):
+    return [card.front for card in cards]
+
+
+def test_get_today_review_groups_due_cards_by_main_deck(repository):
+    """Test that due cards are rolled up to their top-level decks."""
+    result = repository.get_today_review()
+
+    assert isinstance(result, TodayReview)
+    assert [deck.deck_name for deck in result.decks] == ["History", "Programming"]
+
+    history, programming = result.decks
+    assert _fronts(history.review_cards) == ["Who was Julius Caesar?"]
+    assert _fronts(history.learning_cards) == ["marynarz"]
+    assert _fronts(programming.learning_cards) == ["What is a decorator?"]
+    assert _fronts(programming.review_cards) == ["What is a generator?"]
+
+
+def test_get_today_review_skips_new_future_and_suspended_cards(repository):
+    """Test that only cards Anki considers due are returned."""
+    fronts = [card.front for deck in repository.get_today_review().decks
+              for card in deck.new_cards + deck.learning_cards + deck.review_cards]
+
+    assert "What is Python?" not in fronts
+    assert "What is a list?" not in fronts
+    assert "Suspended card" not in fronts
+
+
+def test_get_today_review_for_sub_deck_filter(repository):
+    """Test filtering by a deck includes its sub-decks."""
+    result = repository.get_today_review(deck_name="Programming::Python")
+
+    assert [deck.deck_name for deck in result.decks] == ["Programming::Python"]
+    assert result.total_cards == 2
+
+
+def test_get_all_cards_with_limit_and_offset(repository):
+    """Test listing cards applies limit and offset per deck in card ID order."""
+    result = repository.get_all_cards(limit=2, offset=1, deck_name="Programming")
+
+    assert len(result.decks) == 1
+    deck = result.decks[0]
+    fronts = _fronts(deck.new_cards + deck.learning_cards + deck.review_cards)
+    assert sorted(fronts) == ["What is a decorator?", "What is a generator?"]
+
+
+def test_get_all_cards_every_deck(repository):
+    """Test listing cards from every top-level deck."""
+    result = repository.get_all_cards(limit=100)
+
+    assert [deck.deck_name for deck in result.decks] == ["History", "Programming"]
+
+
+def test_missing_collection_raises_runtime_error(tmp_path):
+    """Test that an unreadable collection is reported as RuntimeError."""
+    repository = CollectionCardRepository(str(tmp_path / "missing.anki2"), AnkiCardMapper())
+
+    with pytest.raises(RuntimeError) as exc_info:
+        repository.get_today_review()
+
+    assert "Failed to read Anki collection" in str(exc_info.value)
+
+
+def test_container_selects_collection_backend(tmp_path):
+    """Test that the container wires the collection repository from config."""
+    from src.application.containers import Container
+
+    path = create_collection(tmp_path / "collection.anki2")
+    container = Container()
+    container.config.from_dict({"backend": "collection", "collection": {"path": path}})
+
+    repository = container.anki_today()._repository
+
+    assert isinstance(repository, CollectionCardRepository)
+    assert repository.get_today_review().total_cards == 4
+
+
+def test_get_today_summary_matches_today_review(repository):
+    """Test that the counting query agrees with the full review."""
+    summary = repository.get_today_summary()
+    review = repository.get_today_review()
+
+    assert [deck.deck_name for deck in summary.decks] == [deck.deck_name for deck in review.decks]
+    for counted, listed in zip(summary.decks, review.decks):
+        assert listed.new_cards == []
+        assert counted.learning_count == len(listed.learning_cards)
+        assert counted.review_count == len(listed.review_cards)
+
+
+def test_get_today_summary_for_deck(repository):
+    """Test counting the due cards of one deck."""
+    summary = repository.get_today_summary(deck_name="History")
+
+    assert [deck.deck_name for deck in summary.decks] == ["History"]
+    assert (summary.decks[0].learning_count, summary.decks[0].review_count) == (1, 1)
+
+
+def _page_ids(pages):
+    return sorted(card.card_id for page in pages for card in page.deck.new_cards + page.deck.learning_cards + page.deck.review_cards)
+
+
+def test_iter_card_pages_covers_every_deck_once(repository):
+    """Test that small pages yield the same cards as a single large page."""
+    pages = list(repository.iter_card_pages(page_size=1))
+
+    assert _page_ids(pages) == _page_ids(repository.iter_card_pages(page_size=100))
+    assert [page.cursor is None for page in pages] == [False] * (len(pages) - 1) + [True]
+
+
+def test_iter_card_pages_resumes_after_cursor(repository):
+    """Test that a cursor continues the walk right after its page."""
+    pages = list(repository.iter_card_pages(page_size=2))
+    resumed = list(repository.iter_card_pages(page_size=2, cursor=pages[0].cursor))
+
+    assert _page_ids(resumed) == _page_ids(pages[1:])
+
+
+def _review_ids(review):
+    return sorted(card.card_id for deck in review.decks for card in deck.new_cards + deck.learning_cards + deck.review_cards)
+
+
+def test_get_all_cards_random_is_stable_for_a_seed(repository):
+    """Test that a seed picks the same cards, and that weighted picks come from the deck."""
+    first = repository.get_all_cards(limit=2, deck_name="Programming", random=True, seed=5)
+    again = repository.get_all_cards(limit=2, deck_name="Programming", random=True, seed=5)
+    weighted = repository.get_all_cards(limit=4, deck_name="Programming", seed=9, weight="lapses")
+
+    assert _review_ids(first) == _review_ids(again)
+    assert _review_ids(weighted) == _review_ids(repository.get_all_cards(limit=4, deck_name="Programming"))
+
+
+def test_clock_is_anchored_to_collection_creation(tmp_path):
+    """Test that review cards are due by days since the collection was created."""
+    from src.infrastructure.persistence.clock import SchedulerClock
+    from tests.fixtures.collection import TODAY
+
+    clock = SchedulerClock()
+    path = create_collection(tmp_path / "collection.anki2")
+    repository = CollectionCardRepository(path, AnkiCardMapper(clock), clock=clock)
+
+    fronts = _fronts(card for deck in repository.get_all_cards(limit=100).decks for card in deck.review_cards)
+    repository.close()
+
+    assert clock.today() == TODAY
+    assert "What is a list?" not in fronts
+    assert "What is a generator?" in fronts
+
+
+def test_container_rejects_async_stack_for_collection(tmp_path):
+    """Test that the async stack isn't silently served by AnkiConnect when a collection file is given."""
+    from src.application.containers import Container
+
+    container = Container()
+    container.config.from_dict({"stack": "async", "backend": "collection", "collection": {"path": str(tmp_path)}})
+
+    with pytest.raises(ValueError, match="no async stack"):
+        container.anki_today()
+
+
+def test_cli_rejects_async_with_collection(tmp_path):
+    """Test that `anki --async --collection FILE` fails instead of querying AnkiConnect."""
+    from typer.testing import CliRunner
+    from src.cli import app
+
+    path = create_collection(tmp_path / "collection.anki2")
+    result = CliRunner().invoke(app, ["--async", "--collection", path, "--no-daemon", "today"])
+
+    assert result.exit_code == 2
+    assert "--collection" in result.output
@@ -0,0 +1,78 @@
+"""Tests for SchedulerClock."""
+
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.persistence.clock import SchedulerClock
+
+
+class _Time:
+    """A settable clock."""
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def _at(*args) -> float:
+    return datetime(*args).timestamp()
+
+
+def test_today_is_probed_once_and_counted_on_at_rollover():
+    """Test that the day number only changes when the rollover hour passes."""
+    calls = []
+    now = _Time(_at(2026, 3, 1, 12, 0))
+    clock = SchedulerClock(probe=lambda: calls.append(1) or 500, rollover_hour=4, clock=now)
+
+    assert clock.today() == 500
+    now.value = _at(2026, 3, 2, 3, 59)
+    assert clock.today() == 500
+    now.value = _at(2026, 3, 2, 4, 0)
+    assert clock.today() == 501
+    now.value = _at(2026, 3, 12, 23, 0)
+    assert clock.today() == 511
+    assert len(calls) == 1
+
+
+def test_failed_probe_is_retried_the_next_day():
+    """Test that without an answer the day is counted from the epoch until a probe succeeds."""
+    answers = [None, 42]
+    now = _Time(_at(2026, 3, 1, 12, 0))
+    clock = SchedulerClock(probe=lambda: answers.pop(0), clock=now)
+
+    assert clock.today() == int(now.value / 86400)
+    assert clock.today() == int(now.value / 86400)
+    now.value = _at(2026, 3, 2, 12, 0)
+    assert clock.today() == 42
+    assert answers == []
+
+
+def test_probe_that_raises_is_retried_on_the_next_call():
+    """Test that a probe failing to reach Anki doesn't leave the day counted from the epoch until rollover."""
+    answers = [RuntimeError("Failed to communicate with Anki"), 42]
+
+    def probe():
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    clock = SchedulerClock(probe=probe, clock=_Time(_at(2026, 3, 1, 12, 0)))
+
+    with pytest.raises(RuntimeError):
+        clock.today()
+    assert clock.today() == 42
+
+
+def test_anchor_sets_the_day_without_probing():
+    """Test that sources knowing the day number can set it."""
+    now = _Time(_at(2026, 3, 1, 12, 0))
+    clock = SchedulerClock(clock=now)
+
+    clock.anchor(100, at=_at(2026, 2, 28, 12, 0))
+
+    assert clock.today() == 101
+    assert clock.now_ms() == int(now.value * 1000)
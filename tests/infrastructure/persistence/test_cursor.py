@@ -0,0 +1,20 @@
+"""Tests for page cursors."""
+
+import pytest
+
+from src.infrastructure.persistence.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the deck and card it was made from."""
+    cursor = encode_cursor("Polish::Verbs", 1_500_000_000_123)
+
+    assert decode_cursor(cursor) == ("Polish::Verbs", 1_500_000_000_123)
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", "bnVsbA", encode_cursor("Deck", 1)[:-3]])
+def test_invalid_cursor_raises_value_error(cursor):
+    """Test that malformed tokens are rejected."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
@@ -0,0 +1,70 @@
+"""Tests for card sampling."""
+
+from collections import Counter
+
+import pytest
+
+from src.infrastructure.persistence.sampling import CardSampler, sample_ids, weighted_sample_ids
+
+CARD_IDS = list(range(1000, 1100))
+
+
+def test_sample_ids_is_seeded_and_pages_with_offset():
+    """Test that a seed gives one order, which offsets page through without repeats."""
+    first = sample_ids(CARD_IDS, 10, seed=7, salt="Deck")
+    second = sample_ids(CARD_IDS, 10, offset=10, seed=7, salt="Deck")
+
+    assert first == sample_ids(CARD_IDS, 10, seed=7, salt="Deck")
+    assert first + second == sample_ids(CARD_IDS, 20, seed=7, salt="Deck")
+    assert len(set(first + second)) == 20
+    assert first != sample_ids(CARD_IDS, 10, seed=8, salt="Deck")
+    assert sorted(sample_ids(CARD_IDS, 500, seed=7)) == CARD_IDS
+
+
+def test_weighted_sample_favours_heavy_cards():
+    """Test that cards are picked in proportion to their weight."""
+    weights = {card_id: 10.0 for card_id in CARD_IDS[:10]}
+    picks = Counter(
+        card_id for seed in range(200) for card_id in weighted_sample_ids(CARD_IDS, weights, 1, seed=seed)
+    )
+
+    # The heavy tenth of the cards carries 100 of 190 weight units
+    assert 80 <= sum(picks[card_id] for card_id in CARD_IDS[:10]) <= 130
+
+
+def test_weighted_sample_pages_with_offset():
+    """Test that offsets continue the same weighted order."""
+    weights = {card_id: 3.0 for card_id in CARD_IDS[::7]}
+    picked = weighted_sample_ids(CARD_IDS, weights, 30, seed=3)
+
+    assert len(set(picked)) == 30
+    assert weighted_sample_ids(CARD_IDS, weights, 10, offset=20, seed=3) == picked[20:]
+    assert sorted(weighted_sample_ids(CARD_IDS, weights, 500, seed=3)) == CARD_IDS
+
+
+@pytest.mark.parametrize("weight, values, expected", [
+    ("lapses", {"lapses": 5}, 5.0),
+    ("lapses", {"lapses": 0}, 1.0),
+    ("overdue", {"overdue_days": 40}, 33.0),
+    ("ease", {"factor": 2000}, 3.0),
+    ("ease", {"factor": 0, "card_type": 0}, 1.0),
+])
+def test_card_weight_uses_search_tiers(weight, values, expected):
+    """Test weights computed from card values."""
+    arguments = {"lapses": 0, "factor": 2500, "card_type": 2, "overdue_days": 0, **values}
+
+    assert CardSampler(weight=weight).card_weight(**arguments) == expected
+
+
+def test_tier_weights_take_the_heaviest_matching_tier():
+    """Test turning tier search results into weights."""
+    sampler = CardSampler(weight="lapses")
+
+    assert sampler.searches('deck:"A"')[:2] == ['deck:"A" prop:lapses>=1', 'deck:"A" prop:lapses>=2']
+    assert sampler.tier_weights([[1, 2], [2]]) == {1: 2.0, 2: 3.0}
+
+
+def test_unknown_weight_raises_value_error():
+    """Test that only known weights are accepted."""
+    with pytest.raises(ValueError, match="Unknown weight"):
+        CardSampler(weight="difficulty")
@@ -1,8 +1,9 @@
 """Tests for the ConsolePresenter."""
 
 from unittest.mock import patch, call
-from src.core.entities import TodayReview, DeckCards, Card
+from src.core.entities import TodayReview, DeckCards, Card, DeckSummary, TodaySummary
 from src.infrastructure.presentation.console import ConsolePresenter
+from src.infrastructure.presentation.renderer import BufferedRenderer
 
 
 def test_present_no_cards():
@@ -10,9 +11,9 @@ def test_present_no_cards():
     presenter = ConsolePresenter()
     review = TodayReview([])
 
-    with patch('src.infrastructure.presentation.console.print') as mock_print:
+    with patch.object(BufferedRenderer, 'line') as mock_line:
         presenter.present(review)
-        mock_print.assert_called_once_with("\nNo cards to review today!")
+        mock_line.assert_called_once_with("\nNo cards to review today!")
 
 
 def test_present_single_new_card():
@@ -26,9 +27,9 @@ def test_present_single_new_card():
     )
     review = TodayReview([deck])
 
-    with patch('src.infrastructure.presentation.console.print') as mock_print:
+    with patch.object(BufferedRenderer, 'line') as mock_line:
         presenter.present(review)
-        mock_print.assert_has_calls([
+        mock_line.assert_has_calls([
             call("\nTotal cards to review today: 1"),
             call("Test Deck:"),
             call("  New cards (1):"),
@@ -48,9 +49,9 @@ def test_present_single_learning_card():
     )
     review = TodayReview([deck])
 
-    with patch('src.infrastructure.presentation.console.print') as mock_print:
+    with patch.object(BufferedRenderer, 'line') as mock_line:
         presenter.present(review)
-        mock_print.assert_has_calls([
+        mock_line.assert_has_calls([
             call("\nTotal cards to review today: 1"),
             call("Test Deck:"),
             call("  Learning cards (1):"),
@@ -70,9 +71,9 @@ def test_present_single_review_card():
     )
     review = TodayReview([deck])
 
-    with patch('src.infrastructure.presentation.console.print') as mock_print:
+    with patch.object(BufferedRenderer, 'line') as mock_line:
         presenter.present(review)
-        mock_print.assert_has_calls([
+        mock_line.assert_has_calls([
             call("\nTotal cards to review today: 1"),
             call("Test Deck:"),
             call("  Review cards (1):"),
@@ -101,9 +102,9 @@ def test_present_multiple_decks_with_mixed_cards():
     
     review = TodayReview([python_deck, design_patterns_deck])
 
-    with patch('src.infrastructure.presentation.console.print') as mock_print:
+    with patch.object(BufferedRenderer, 'line') as mock_line:
         presenter.present(review)
-        mock_print.assert_has_calls([
+        mock_line.assert_has_calls([
             call("\nTotal cards to review today: 6"),
             call("Python:"),
             call("  New cards (1):"),
@@ -125,4 +126,52 @@ def test_present_multiple_decks_with_mixed_cards():
             call("  Review cards (1):"),
             call("    - Front: Explain dependency injection."),
             call("      Back:  Passing dependencies instead of creating them")
-        ]) 
\ No newline at end of file
+        ]) 
+
+def test_present_summary_no_cards():
+    """Test presenting an empty summary."""
+    presenter = ConsolePresenter()
+
+    with patch.object(BufferedRenderer, 'line') as mock_line:
+        presenter.present_summary(TodaySummary([]))
+        mock_line.assert_called_once_with("\nNo cards to review today!")
+
+
+def test_present_summary_counts():
+    """Test presenting the card counts per deck."""
+    presenter = ConsolePresenter()
+    summary = TodaySummary([
+        DeckSummary("Programming", learning_count=1, review_count=2),
+        DeckSummary("History", learning_count=0, review_count=1),
+    ])
+
+    with patch.object(BufferedRenderer, 'line') as mock_line:
+        presenter.present_summary(summary)
+        mock_line.assert_has_calls([
+            call("\nTotal cards to review today: 4"),
+            call("Programming: 1 learning, 2 review"),
+            call("History: 0 learning, 1 review")
+        ])
+
+
+def test_present_stream_prints_total_last():
+    """Test streaming decks prints each deck as it arrives and the total at the end."""
+    presenter = ConsolePresenter()
+    decks = iter([
+        DeckCards("Programming", new_cards=[Card("Q1", "A1")], learning_cards=[], review_cards=[]),
+        DeckCards("History", new_cards=[], learning_cards=[], review_cards=[Card("Q2", "A2")]),
+    ])
+
+    with patch.object(BufferedRenderer, 'line') as mock_line:
+        presenter.present_stream(decks)
+        assert mock_line.call_args_list[-1] == call("\nTotal cards to review today: 2")
+        assert call("Programming:") in mock_line.call_args_list
+
+
+def test_present_stream_no_cards():
+    """Test streaming an empty deck sequence."""
+    presenter = ConsolePresenter()
+
+    with patch.object(BufferedRenderer, 'line') as mock_line:
+        presenter.present_stream(iter([]))
+        assert mock_line.call_args_list[-1] == call("\nNo cards to review today!")
@@ -0,0 +1,77 @@
+"""Tests for the BufferedRenderer."""
+
+from io import StringIO
+
+from src.core.entities import DeckCards, TodayReview, Card
+from src.infrastructure.presentation.console import ConsolePresenter
+from src.infrastructure.presentation.renderer import BufferedRenderer
+
+
+class _Stream(StringIO):
+    """String stream that counts writes and can pretend to be a terminal."""
+
+    def __init__(self, tty: bool = False):
+        super().__init__()
+        self.tty = tty
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def isatty(self):
+        return self.tty
+
+
+def test_plain_output_is_written_once_per_buffer():
+    """Test that lines are collected and written in one go."""
+    stream = _Stream()
+    renderer = BufferedRenderer(stream=stream)
+
+    for index in range(100):
+        renderer.line(f"line {index}")
+    assert stream.writes == 0
+
+    renderer.flush()
+    assert stream.writes == 1
+    assert stream.getvalue().splitlines() == [f"line {index}" for index in range(100)]
+
+
+def test_full_buffer_is_written_early():
+    """Test that the buffer is written out once it reaches its size."""
+    stream = _Stream()
+    renderer = BufferedRenderer(stream=stream, buffer_size=20)
+
+    renderer.line("a" * 10)
+    renderer.line("b" * 10)
+
+    assert stream.getvalue() == "a" * 10 + "\n" + "b" * 10 + "\n"
+
+
+def test_plain_mode_follows_terminal_detection():
+    """Test that the plain path is only used when the stream is not a terminal."""
+    assert BufferedRenderer(stream=_Stream(tty=False)).plain
+    assert not BufferedRenderer(stream=_Stream(tty=True)).plain
+    assert not BufferedRenderer(stream=_Stream(tty=False), plain=False).plain
+
+
+def test_plain_and_rich_modes_render_the_same_text():
+    """Test that both modes keep the presenter's layout."""
+    review = TodayReview([
+        DeckCards("Deck", new_cards=[Card("Q1", "A1")], learning_cards=[], review_cards=[Card("Q2", "A2")]),
+    ])
+    plain, rich = StringIO(), StringIO()
+
+    ConsolePresenter(stream=plain, plain=True).present(review)
+    ConsolePresenter(stream=rich, plain=False).present(review)
+
+    assert plain.getvalue() == rich.getvalue() == (
+        "\nTotal cards to review today: 2\n"
+        "Deck:\n"
+        "  New cards (1):\n"
+        "    - Front: Q1\n"
+        "      Back:  A1\n"
+        "  Review cards (1):\n"
+        "    - Front: Q2\n"
+        "      Back:  A2\n"
+    )
@@ -0,0 +1,91 @@
+"""Tests for the JSON, NDJSON and CSV presenters."""
+
+import json
+from io import StringIO
+
+import pytest
+
+from src.core.entities import Card, DeckCards, DeckSummary, TodayReview, TodaySummary
+from src.infrastructure.presentation.encoders import get_json_encoder, stdlib_encoder
+from src.infrastructure.presentation.structured import CsvPresenter, JsonPresenter, NdjsonPresenter
+
+
+@pytest.fixture
+def review():
+    """Create a review with two decks."""
+    return TodayReview([
+        DeckCards("Python", new_cards=[Card("Q1", "A1", card_id=1)], learning_cards=[], review_cards=[]),
+        DeckCards("History", new_cards=[], learning_cards=[Card("Q2", "A2, \"quoted\"", card_id=2)], review_cards=[]),
+    ])
+
+
+def test_json_presenter_writes_one_document(review):
+    """Test that the JSON presenter writes all cards in one document."""
+    output = StringIO()
+
+    JsonPresenter(stream=output, encoder=stdlib_encoder).present(review)
+
+    assert json.loads(output.getvalue()) == {
+        "total_cards": 2,
+        "cards": [
+            {"deck": "Python", "type": "new", "card_id": 1, "front": "Q1", "back": "A1"},
+            {"deck": "History", "type": "learning", "card_id": 2, "front": "Q2", "back": "A2, \"quoted\""},
+        ],
+    }
+
+
+def test_ndjson_presenter_streams_one_line_per_card(review):
+    """Test that NDJSON writes every deck as soon as it arrives."""
+    output = StringIO()
+    written = []
+
+    def decks():
+        for deck in review.decks:
+            yield deck
+            written.append(len(output.getvalue().splitlines()))
+
+    NdjsonPresenter(stream=output).present_stream(decks())
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert written == [1, 2]
+    assert [(line["deck"], line["type"], line["card_id"]) for line in lines] == [
+        ("Python", "new", 1), ("History", "learning", 2)
+    ]
+
+
+def test_csv_presenter_writes_header_and_rows(review):
+    """Test that CSV output quotes values and starts with a header."""
+    output = StringIO()
+
+    CsvPresenter(stream=output).present(review)
+
+    assert output.getvalue().splitlines() == [
+        "deck,type,card_id,front,back",
+        "Python,new,1,Q1,A1",
+        'History,learning,2,Q2,"A2, ""quoted"""',
+    ]
+
+
+def test_summary_formats():
+    """Test that the summary is written as counts per deck."""
+    summary = TodaySummary([DeckSummary("Python", learning_count=2, review_count=3)])
+    ndjson, csv_output = StringIO(), StringIO()
+
+    NdjsonPresenter(stream=ndjson).present_summary(summary)
+    CsvPresenter(stream=csv_output).present_summary(summary)
+
+    assert json.loads(ndjson.getvalue()) == {"deck": "Python", "learning": 2, "review": 3}
+    assert csv_output.getvalue() == "deck,learning,review\nPython,2,3\n"
+
+
+def test_encoders_produce_the_same_json():
+    """Test that every available encoder produces equivalent JSON."""
+    value = {"front": "zażółć", "card_id": 1, "due": None}
+
+    assert json.loads(get_json_encoder("json")(value)) == json.loads(get_json_encoder("auto")(value)) == value
+
+
+def test_unknown_encoder():
+    """Test that an unknown encoder name is rejected."""
+    with pytest.raises(ValueError):
+        get_json_encoder("yaml")
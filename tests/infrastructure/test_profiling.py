@@ -0,0 +1,103 @@
+"""Tests for the span profiler."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+from src.infrastructure import profiling
+from src.infrastructure.persistence.anki_connect.client import AnkiConnectClient
+
+
+def test_spans_are_not_recorded_without_profiler():
+    """Test that instrumented code runs unprofiled when no profiler is active."""
+    with profiling.span("stage") as span:
+        span.set(cards=1)
+
+    assert not span.recording
+    assert profiling.active_profiler() is None
+
+
+def test_nested_spans_split_self_time():
+    """Test that a child span's time is not counted as its parent's self time."""
+    profiler = profiling.Profiler()
+
+    with profiling.activate(profiler):
+        with profiling.span("parent"):
+            with profiling.span("child", cards=2):
+                time.sleep(0.02)
+            with profiling.span("child", cards=3):
+                pass
+
+    stages = {stage.name: stage for stage in profiler.stages()}
+    assert stages["child"].calls == 2
+    assert stages["child"].counters == {"cards": 5}
+    assert stages["parent"].total >= stages["child"].total
+    assert stages["parent"].self_time < stages["child"].total
+    assert "child" in profiler.format_report()
+
+
+def test_timed_decorates_functions_and_coroutines():
+    """Test that the decorator records sync and async calls."""
+    @profiling.timed("sync_stage")
+    def work(value):
+        return value * 2
+
+    @profiling.timed("async_stage")
+    async def async_work(value):
+        return value * 3
+
+    profiler = profiling.Profiler()
+    with profiling.activate(profiler):
+        assert work(2) == 4
+        assert asyncio.run(async_work(2)) == 6
+
+    assert sorted(stage.name for stage in profiler.stages()) == ["async_stage", "sync_stage"]
+
+
+def test_write_trace(tmp_path):
+    """Test that spans are written in the Chrome trace event format."""
+    profiler = profiling.Profiler()
+    with profiling.activate(profiler):
+        with profiling.span("anki_connect.deckNames", items=2):
+            pass
+
+    path = tmp_path / "trace.json"
+    profiler.write_trace(str(path))
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [(event["name"], event["ph"], event["args"]) for event in events] == [
+        ("anki_connect.deckNames", "X", {"items": 2})
+    ]
+
+
+def test_cprofile_runs_in_selected_stage():
+    """Test that cProfile statistics are collected for the selected stage only."""
+    def hot_function():
+        return sum(range(1000))
+
+    profiler = profiling.Profiler(cprofile_stage="hot")
+    with profiling.activate(profiler):
+        with profiling.span("hot"):
+            hot_function()
+
+    stats = profiler.cprofile_stats()
+    assert stats is not None
+    assert any(name == "hot_function" for _, _, name in stats.stats)
+
+
+def test_client_records_request_sizes():
+    """Test that AnkiConnect requests are recorded per action with their sizes."""
+    profiler = profiling.Profiler()
+
+    with patch("requests.Session.post") as mock_post, profiling.activate(profiler):
+        mock_post.return_value.json.return_value = {"result": [{"cardId": 1}, {"cardId": 2}], "error": None}
+        mock_post.return_value.content = b"x" * 100
+        AnkiConnectClient().get_cards_info([1, 2])
+
+    stages = {stage.name: stage for stage in profiler.stages()}
+    counters = stages["anki_connect.cardsInfo"].counters
+    assert counters["response_bytes"] == 100
+    assert counters["items"] == 2
+    assert counters["request_bytes"] > 0
+    assert "anki_connect.json_decode" in stages
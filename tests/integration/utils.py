@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 import pytest
+from dependency_injector import providers
 
 from src.application.containers import Container
 
@@ -23,7 +24,7 @@ def mock_container(request):
     # Get test_decks from the requesting test, defaulting to None
     test_decks = getattr(request, "param", None)
     
-    with patch('src.cli.Container', autospec=True) as mock_container_class:
+    with patch('src.application.containers.Container', autospec=True) as mock_container_class:
         # Create a real container instance
         container = Container()
         
@@ -36,7 +37,8 @@ def mock_container(request):
             
             # Mock find_cards to return card IDs for each deck
             def mock_find_cards(query):
-                if not test_decks:
+                # Only deck searches find cards, not e.g. the scheduler's `prop:due=N` probe
+                if not test_decks or '"' not in query:
                     return []
                 deck_name = query.split('"')[1]  # Extract deck name from query
                 for deck in test_decks:
@@ -52,9 +54,17 @@ def mock_container(request):
                 all_cards = [card for deck in test_decks for card in deck["cards"]]
                 return [card for card in all_cards if card["id"] in card_ids]
             mock_client.get_cards_info.side_effect = mock_get_cards_info
+
+            # Batched variants answer each query or ID group independently
+            mock_client.find_cards_many.side_effect = lambda queries: [mock_find_cards(q) for q in queries]
+            mock_client.get_cards_info_many.side_effect = lambda id_lists: [mock_get_cards_info(ids) for ids in id_lists]
             
-            # Update container to use our mock client
+            # Update container to use our mock client, bypassing the card cache and its mirror
+            # so that the user's cache file is never touched
+            container.config.cache.backend.from_value("none")
             container.client.override(mock_client)
+            container.cards_client.override(mock_client)
+            container.card_sync.override(providers.Object(None))
             
             # Make the container class return our configured container
             mock_container_class.return_value = container
@@ -0,0 +1,32 @@
+"""Tests for the CLI's deferred imports."""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modules_after(code: str) -> set:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_cli_defers_heavy_modules():
+    """Test that importing the CLI doesn't load the container or the HTTP stack."""
+    modules = _modules_after("import src.cli")
+
+    assert "src.cli" in modules
+    for name in ("dependency_injector", "requests", "src.application.containers", "src.infrastructure.presentation.console"):
+        assert name not in modules
+
+
+def test_package_exports_load_on_access():
+    """Test that package exports are still importable by name."""
+    modules = _modules_after("from src.infrastructure import ConsolePresenter")
+
+    assert "src.infrastructure.presentation.console" in modules
+    assert "src.infrastructure.persistence.anki_connect.client" not in modules